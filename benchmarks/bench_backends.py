@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Backend rotation benchmark for MacSpoofX.
+
+Creates a set of throwaway dummy interfaces, rotates random MACs on them
+through each available backend and reports rotations per second.
+
+Usage:
+    sudo python3 benchmarks/bench_backends.py --interfaces 4 --rotations 200
+    sudo python3 benchmarks/bench_backends.py --backends netlink,macchanger
+
+Educational purposes only. Requires root to create interfaces.
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# Keep the sequence cursor, journal and history out of the real state
+# directory; macspoofx reads MACSPOOFX_STATE_DIR at import time
+STATE_DIR = tempfile.mkdtemp(prefix='msxbench-state-')
+os.environ['MACSPOOFX_STATE_DIR'] = STATE_DIR
+
+import macspoofx  # noqa: E402
+
+
+def create_interfaces(prefix: str, count: int) -> list:
+    """Create dummy interfaces, falling back to veth pairs without the dummy module."""
+    names = []
+    for i in range(count):
+        name = f'{prefix}{i}'
+        result = subprocess.run(['ip', 'link', 'add', name, 'type', 'dummy'], capture_output=True)
+        if result.returncode != 0:
+            subprocess.run(['ip', 'link', 'add', name, 'type', 'veth', 'peer', 'name', f'{name}p'],
+                           capture_output=True, check=True)
+        names.append(name)
+    return names
+
+
+def delete_interfaces(names: list):
+    """Delete interfaces created by create_interfaces()."""
+    for name in names:
+        subprocess.run(['ip', 'link', 'del', name], capture_output=True)
+
+
+def bench_backend(name: str, interfaces: list, rotations: int) -> dict:
+    """Rotate random MACs round-robin over the interfaces and time it."""
+    backend = macspoofx.create_backend(name)
+    if not backend.is_available():
+        return {'backend': name, 'available': False}
+
+    changers = [macspoofx.MACChanger(iface, backend=backend) for iface in interfaces]
+    failures = 0
+    start = time.perf_counter()
+    for i in range(rotations):
+        success, _mac = changers[i % len(changers)].change_mac_random()
+        if not success:
+            failures += 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        'backend': name,
+        'available': True,
+        'rotations': rotations,
+        'failures': failures,
+        'seconds': elapsed,
+        'rotations_per_sec': rotations / elapsed if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare MAC change backends on dummy interfaces')
+    parser.add_argument('--interfaces', type=int, default=4, help='Number of dummy interfaces (default: 4)')
+    parser.add_argument('--rotations', type=int, default=200, help='Rotations per backend (default: 200)')
+    parser.add_argument('--backends', type=str, default=','.join(macspoofx.BACKENDS),
+                        help='Comma separated backends to compare')
+    parser.add_argument('--prefix', type=str, default='msxb', help='Interface name prefix (default: msxb)')
+    args = parser.parse_args()
+
+    if os.geteuid() != 0:
+        print('[-] Benchmark requires root to create dummy interfaces')
+        shutil.rmtree(STATE_DIR, ignore_errors=True)
+        sys.exit(1)
+
+    interfaces = create_interfaces(args.prefix, args.interfaces)
+    try:
+        print(f'[*] {len(interfaces)} interfaces, {args.rotations} rotations per backend\n')
+        print(f"{'backend':<12} {'rotations/s':>12} {'seconds':>10} {'failures':>9}")
+        for name in args.backends.split(','):
+            result = bench_backend(name.strip(), interfaces, args.rotations)
+            if not result['available']:
+                print(f"{result['backend']:<12} {'unavailable':>12}")
+                continue
+            print(f"{result['backend']:<12} {result['rotations_per_sec']:>12.1f} "
+                  f"{result['seconds']:>10.3f} {result['failures']:>9}")
+    finally:
+        delete_interfaces(interfaces)
+        shutil.rmtree(STATE_DIR, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
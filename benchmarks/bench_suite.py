@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark suite for MacSpoofX.
+
+Runs the single, batch, scheduled and listing workloads through the real
+MacSpoofX, MACChanger and NetworkInterfaceManager code paths and reports
+throughput, p50/p99 latency, external process spawns and peak RSS.
+
+Isolation:
+- Default mode (root): a throwaway network namespace is created with N
+  dummy (or veth) interfaces, and every workload runs inside it in its own
+  worker process, so peak RSS is per workload and the host is untouched
+- --fake (no root): stub ip/ethtool/macchanger scripts keep interface state
+  in a temporary directory and are put first on PATH; rotations go through
+  the macchanger backend, so this measures the subprocess pipeline. The
+  listing workload reads the kernel's real links over rtnetlink, which the
+  stubs cannot fake, so it is skipped in this mode
+
+Usage:
+    sudo python3 benchmarks/bench_suite.py --interfaces 16 --rotations 500
+    sudo python3 benchmarks/bench_suite.py --backend macchanger --workloads single,batch
+    python3 benchmarks/bench_suite.py --fake --json results.json
+
+Educational purposes only.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import macspoofx  # noqa: E402
+
+WORKLOADS = ('single', 'batch', 'scheduled', 'listing')
+
+FAKE_IP = r'''#!/bin/sh
+# Stub 'ip' for the benchmark's fake-command mode
+state="$MSX_FAKE_STATE"
+if [ "$1" = "-j" ]; then
+    echo '[]'
+    exit 0
+fi
+[ "$1" = "link" ] || exit 0
+iface="$3"
+if [ ! -f "$state/$iface" ]; then
+    echo "Device \"$iface\" does not exist." >&2
+    exit 1
+fi
+case "$2" in
+    show)
+        flags="BROADCAST,MULTICAST"
+        [ -f "$state/$iface.up" ] && flags="$flags,UP"
+        echo "2: $iface: <$flags> mtu 1500 qdisc noqueue state UNKNOWN mode DEFAULT"
+        echo "    link/ether $(cat "$state/$iface") brd ff:ff:ff:ff:ff:ff"
+        ;;
+    set)
+        case "$4" in
+            up) : > "$state/$iface.up" ;;
+            down) rm -f "$state/$iface.up" ;;
+            address) echo "$5" > "$state/$iface" ;;
+        esac
+        ;;
+esac
+'''
+
+FAKE_ETHTOOL = r'''#!/bin/sh
+# Stub 'ethtool' for the benchmark's fake-command mode
+state="$MSX_FAKE_STATE"
+[ -f "$state/$2" ] || exit 1
+case "$1" in
+    -P) echo "Permanent address: $(cat "$state/$2.perm")" ;;
+    -i) echo "driver: fake" ;;
+esac
+'''
+
+FAKE_MACCHANGER = r'''#!/bin/sh
+# Stub 'macchanger' for the benchmark's fake-command mode
+state="$MSX_FAKE_STATE"
+if [ "$1" = "--version" ]; then
+    echo "GNU MAC Changer 1.7.0 (benchmark stub)"
+    exit 0
+fi
+flag="$1"
+if [ "$flag" = "-m" ]; then
+    mac="$2"
+    iface="$3"
+else
+    iface="$2"
+fi
+[ -f "$state/$iface" ] || exit 1
+old=$(cat "$state/$iface")
+case "$flag" in
+    -m) ;;
+    -p) mac=$(cat "$state/$iface.perm") ;;
+    *) mac=$(od -An -N5 -tx1 /dev/urandom | tr -s ' ' ':' | sed 's/^:/02:/') ;;
+esac
+echo "$mac" > "$state/$iface"
+echo "Current MAC:   $old"
+echo "New MAC:       $mac"
+'''
+
+
+def percentile(samples: list, fraction: float) -> float:
+    """Nearest-rank percentile of a list of seconds, in milliseconds."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+
+
+def spawn_count() -> int:
+    """External commands run so far, from the subprocess histogram."""
+    series = macspoofx.METRICS.histograms.get('macspoofx_subprocess_seconds', {})
+    return sum(state[2] for state in series.values())
+
+
+def make_app(argv: list) -> macspoofx.MacSpoofX:
+    """Build MacSpoofX exactly as the CLI would from argv."""
+    saved = sys.argv
+    sys.argv = ['macspoofx'] + argv
+    try:
+        args = macspoofx.parse_arguments()
+    finally:
+        sys.argv = saved
+    return macspoofx.MacSpoofX(args)
+
+
+def run_single(names: list, options) -> list:
+    app = make_app(['-i', names[0], '-b', options.backend, '--history-db', 'history.db'])
+    latencies = []
+    for _ in range(options.rotations):
+        start = time.perf_counter()
+        success, _mac = app.mac_changer.change_mac_random()
+        latencies.append(time.perf_counter() - start)
+        if not success:
+            raise RuntimeError(f"rotation of {names[0]} failed")
+    app.cleanup()
+    return latencies
+
+
+def run_batch(names: list, options) -> list:
+    app = make_app(['--interfaces', ','.join(names), '-b', options.backend,
+                    '--workers', str(options.workers), '--history-db', 'history.db'])
+    latencies = []
+    for _ in range(options.batches):
+        start = time.perf_counter()
+        result = app.execute_batch_spoofing()
+        latencies.append(time.perf_counter() - start)
+        if result.failed:
+            raise RuntimeError(f"{len(result.failed)} batch rotations failed")
+    app.cleanup()
+    return latencies
+
+
+def run_scheduled(names: list, options) -> list:
+    app = make_app(['--interfaces', ','.join(names), '-b', options.backend,
+                    '-t', str(options.schedule_interval), '--history-db', 'history.db'])
+    runner = threading.Thread(target=app.execute_scheduled_spoofing, daemon=True)
+    runner.start()
+    time.sleep(options.schedule_seconds)
+    app.scheduler.stop()
+    runner.join()
+    lags = [lag for job in app.scheduler.jobs.values() for lag in job['drift_samples']]
+    app.cleanup()
+    return lags
+
+
+def run_listing(names: list, options) -> list:
+    latencies = []
+    for _ in range(options.listings):
+        start = time.perf_counter()
+        manager = macspoofx.NetworkInterfaceManager()
+        inventory = manager.get_inventory()
+        latencies.append(time.perf_counter() - start)
+        if not inventory:
+            raise RuntimeError("listing returned no interfaces")
+    return latencies
+
+
+RUNNERS = {'single': run_single, 'batch': run_batch, 'scheduled': run_scheduled, 'listing': run_listing}
+
+
+def worker(options):
+    """Run one workload in this process and print its JSON result."""
+    names = options.names.split(',')
+    macspoofx.METRICS.enabled = True
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        samples = RUNNERS[options.worker](names, options)
+        elapsed = time.perf_counter() - start
+
+    # Throughput counts rotations (batch/scheduled run one per interface per sample)
+    operations = len(samples) * (len(names) if options.worker == 'batch' else 1)
+    print(json.dumps({
+        'workload': options.worker,
+        'operations': operations,
+        'seconds': round(elapsed, 4),
+        'ops_per_sec': round(operations / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(samples, 0.50), 3),
+        'p99_ms': round(percentile(samples, 0.99), 3),
+        'spawns': spawn_count(),
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }))
+
+
+def create_namespace(namespace: str, prefix: str, count: int) -> list:
+    """Create a network namespace with dummy interfaces (veth pairs without the dummy module)."""
+    subprocess.run(['ip', 'netns', 'add', namespace], check=True)
+    subprocess.run(['ip', '-n', namespace, 'link', 'set', 'lo', 'up'], check=True)
+    names = []
+    for i in range(count):
+        name = f'{prefix}{i}'
+        result = subprocess.run(['ip', '-n', namespace, 'link', 'add', name, 'type', 'dummy'],
+                                capture_output=True)
+        if result.returncode != 0:
+            subprocess.run(['ip', '-n', namespace, 'link', 'add', name, 'type', 'veth',
+                            'peer', 'name', f'{name}p'], capture_output=True, check=True)
+            subprocess.run(['ip', '-n', namespace, 'link', 'set', f'{name}p', 'up'], check=True)
+        subprocess.run(['ip', '-n', namespace, 'link', 'set', name, 'up'], check=True)
+        names.append(name)
+    return names
+
+
+def create_fake_commands(directory: str, prefix: str, count: int) -> list:
+    """Install stub commands and fake interface state under directory."""
+    bin_dir = os.path.join(directory, 'bin')
+    state_dir = os.path.join(directory, 'links')
+    os.makedirs(bin_dir)
+    os.makedirs(state_dir)
+    for command, script in (('ip', FAKE_IP), ('ethtool', FAKE_ETHTOOL), ('macchanger', FAKE_MACCHANGER)):
+        path = os.path.join(bin_dir, command)
+        with open(path, 'w') as f:
+            f.write(script)
+        os.chmod(path, 0o755)
+    names = []
+    for i in range(count):
+        name = f'{prefix}{i}'
+        mac = f'02:00:00:00:{i // 256:02x}:{i % 256:02x}'
+        for suffix, content in (('', mac), ('.perm', mac), ('.up', '')):
+            with open(os.path.join(state_dir, name + suffix), 'w') as f:
+                f.write(content + '\n' if content else '')
+        names.append(name)
+    return names
+
+
+def run_workload(workload: str, names: list, options, workdir: str, env: dict,
+                 namespace: str = None) -> dict:
+    command = [sys.executable, os.path.abspath(__file__), '--worker', workload,
+               '--names', ','.join(names), '--backend', options.backend,
+               '--rotations', str(options.rotations), '--batches', str(options.batches),
+               '--workers', str(options.workers), '--listings', str(options.listings),
+               '--schedule-seconds', str(options.schedule_seconds),
+               '--schedule-interval', str(options.schedule_interval)]
+    if namespace:
+        command = ['ip', 'netns', 'exec', namespace] + command
+    result = subprocess.run(command, cwd=workdir, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        return {'workload': workload, 'error': (result.stderr.strip().splitlines() or ['failed'])[-1]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MacSpoofX end-to-end benchmark suite')
+    parser.add_argument('--interfaces', type=int, default=8, help='Interfaces to create (default: 8)')
+    parser.add_argument('--rotations', type=int, default=200, help='Single-interface rotations (default: 200)')
+    parser.add_argument('--batches', type=int, default=20, help='Batch rotations over all interfaces (default: 20)')
+    parser.add_argument('--workers', type=int, default=8, help='Batch worker pool size (default: 8)')
+    parser.add_argument('--listings', type=int, default=50, help='Cold interface listings (default: 50)')
+    parser.add_argument('--schedule-seconds', type=float, default=3.0,
+                        help='How long the scheduled workload runs (default: 3)')
+    parser.add_argument('--schedule-interval', type=float, default=0.05,
+                        help='Per-interface rotation interval for the scheduled workload (default: 0.05)')
+    parser.add_argument('--workloads', type=str, default=','.join(WORKLOADS), help='Comma separated workloads')
+    parser.add_argument('--backend', type=str, default='auto', help='MacSpoofX backend (default: auto)')
+    parser.add_argument('--fake', action='store_true', help='Use stub ip/ethtool/macchanger instead of a netns')
+    parser.add_argument('--prefix', type=str, default='msxb', help='Interface name prefix (default: msxb)')
+    parser.add_argument('--json', type=str, default=None, help='Also write results to this JSON file')
+    parser.add_argument('--worker', choices=WORKLOADS, help=argparse.SUPPRESS)
+    parser.add_argument('--names', type=str, help=argparse.SUPPRESS)
+    options = parser.parse_args()
+
+    if options.worker:
+        worker(options)
+        return
+
+    if not options.fake and os.geteuid() != 0:
+        print('[-] The namespace mode requires root; use --fake to benchmark with stub commands')
+        sys.exit(1)
+    if options.fake:
+        options.backend = 'macchanger'
+
+    workdir = tempfile.mkdtemp(prefix='msxbench-')
+    env = dict(os.environ, MACSPOOFX_STATE_DIR=os.path.join(workdir, 'state'))
+    namespace = None
+    try:
+        if options.fake:
+            names = create_fake_commands(workdir, options.prefix, options.interfaces)
+            env['PATH'] = os.path.join(workdir, 'bin') + os.pathsep + env.get('PATH', '')
+            env['MSX_FAKE_STATE'] = os.path.join(workdir, 'links')
+        else:
+            namespace = f'msxbench{os.getpid()}'
+            names = create_namespace(namespace, options.prefix, options.interfaces)
+
+        where = 'stub commands' if options.fake else f'netns {namespace}'
+        print(f'[*] {len(names)} interfaces ({where}), backend {options.backend}\n')
+        print(f"{'workload':<10} {'ops':>6} {'ops/s':>10} {'p50 ms':>9} {'p99 ms':>9} "
+              f"{'spawns':>7} {'RSS MB':>7}")
+        results = []
+        for workload in options.workloads.split(','):
+            workload = workload.strip()
+            if options.fake and workload == 'listing':
+                result = {'workload': workload, 'skipped': 'lists real kernel links, not the stub commands'}
+                results.append(result)
+                print(f"{workload:<10} skipped: {result['skipped']}")
+                continue
+            result = run_workload(workload, names, options, workdir, env, namespace)
+            results.append(result)
+            if 'error' in result:
+                print(f"{result['workload']:<10} error: {result['error']}")
+                continue
+            print(f"{result['workload']:<10} {result['operations']:>6} {result['ops_per_sec']:>10.1f} "
+                  f"{result['p50_ms']:>9.3f} {result['p99_ms']:>9.3f} {result['spawns']:>7} "
+                  f"{result['peak_rss_mb']:>7.1f}")
+
+        if options.json:
+            with open(options.json, 'w') as f:
+                json.dump({'interfaces': len(names), 'backend': options.backend,
+                           'fake': options.fake, 'results': results}, f, indent=4)
+    finally:
+        if namespace:
+            subprocess.run(['ip', 'netns', 'del', namespace], capture_output=True)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
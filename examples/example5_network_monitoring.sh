@@ -39,9 +39,13 @@ echo "[*] Changing MAC address..."
 sudo python3 ../macspoofx.py \
     --interface $INTERFACE \
     --mode random \
+    --converge \
     --output $LOG_FILE \
     --verbose
 
+# --converge waits for carrier (and the interface's IPv4 address) through
+# netlink events and prints time-to-carrier / time-to-IP for the change
+
 echo ""
 echo "[*] New MAC:"
 ip link show $INTERFACE | grep "link/ether"
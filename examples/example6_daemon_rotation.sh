@@ -0,0 +1,48 @@
+#!/bin/bash
+# Example 6: Daemon-Driven MAC Rotation
+# This script starts a MacSpoofX daemon and triggers rotations over its
+# control socket, instead of starting a new process for every change
+
+echo "===================================="
+echo "Example 6: Daemon-Driven Rotation"
+echo "===================================="
+
+# Configuration
+INTERFACE="eth0"
+SOCKET="/run/macspoofx.sock"
+ROTATIONS=5
+INTERVAL=10  # seconds between changes
+
+echo "[*] Configuration:"
+echo "    Interface: $INTERFACE"
+echo "    Socket: $SOCKET"
+echo "    Rotations: $ROTATIONS every $INTERVAL seconds"
+echo ""
+
+echo "[*] Starting daemon..."
+sudo python3 ../macspoofx.py --daemon --socket $SOCKET --interface $INTERFACE &
+DAEMON_PID=$!
+sleep 1
+
+# Each rotation is a single request/response on the socket
+for i in $(seq 1 $ROTATIONS); do
+    echo "[*] Rotation $i/$ROTATIONS"
+    sudo python3 ../macspoofx.py --ctl rotate --socket $SOCKET --interface $INTERFACE --mode random
+    sleep $INTERVAL
+done
+
+echo ""
+echo "[*] Daemon status:"
+sudo python3 ../macspoofx.py --ctl status --socket $SOCKET --interface $INTERFACE
+
+echo ""
+echo "[*] Recent history:"
+sudo python3 ../macspoofx.py --ctl history --socket $SOCKET --interface $INTERFACE --limit $ROTATIONS
+
+echo ""
+echo "[*] Restoring original MAC and stopping daemon..."
+sudo python3 ../macspoofx.py --ctl reset --socket $SOCKET --interface $INTERFACE
+sudo kill -TERM $DAEMON_PID
+
+echo ""
+echo "[+] Example completed!"
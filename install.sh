@@ -48,16 +48,6 @@ else
     exit 1
 fi
 
-# Check pip
-echo -e "${CYAN}[*] Checking pip installation...${NC}"
-if command -v pip3 &> /dev/null; then
-    echo -e "${GREEN}[+] pip3 found${NC}"
-else
-    echo -e "${YELLOW}[!] pip3 not found. Installing...${NC}"
-    sudo apt update
-    sudo apt install -y python3-pip
-fi
-
 # Check macchanger
 echo -e "\n${CYAN}[*] Checking macchanger installation...${NC}"
 if command -v macchanger &> /dev/null; then
@@ -88,30 +78,9 @@ else
     sudo apt install -y ethtool
 fi
 
-# Install Python dependencies
-echo -e "\n${CYAN}[*] Installing Python dependencies...${NC}"
-
-# Try system packages first (recommended for Kali)
-echo -e "${CYAN}[*] Attempting to install via apt (recommended for Kali)...${NC}"
-sudo apt install -y python3-prettytable python3-schedule python3-netifaces python3-colorama 2>/dev/null
-
-if [ $? -eq 0 ]; then
-    echo -e "${GREEN}[+] Python dependencies installed via apt${NC}"
-else
-    # Fallback to pip with --break-system-packages for Kali Linux
-    echo -e "${YELLOW}[!] APT installation failed, using pip with --break-system-packages...${NC}"
-    echo -e "${YELLOW}[!] This is safe for Kali Linux and won't break your system${NC}"
-    
-    if [ -f "requirements.txt" ]; then
-        echo -e "${CYAN}[*] Installing from requirements.txt...${NC}"
-        pip3 install -r requirements.txt --break-system-packages
-    else
-        echo -e "${CYAN}[*] Installing individual packages...${NC}"
-        pip3 install --break-system-packages prettytable schedule netifaces colorama
-    fi
-    
-    echo -e "${GREEN}[+] Python dependencies installed via pip${NC}"
-fi
+# Python dependencies
+echo -e "\n${CYAN}[*] Checking Python dependencies...${NC}"
+echo -e "${GREEN}[+] None required: MacSpoofX only uses the Python standard library${NC}"
 
 # Make script executable
 echo -e "\n${CYAN}[*] Making macspoofx.py executable...${NC}"
@@ -127,17 +96,26 @@ fi
 echo -e "\n${CYAN}[*] Would you like to create a system-wide command 'macspoofx'? (y/n)${NC}"
 read -r response
 if [[ "$response" =~ ^([yY][eE][sS]|[yY])$ ]]; then
-    SCRIPT_PATH=$(pwd)/macspoofx.py
-    sudo ln -sf "$SCRIPT_PATH" /usr/local/bin/macspoofx
-    echo -e "${GREEN}[+] Created symlink: You can now run 'sudo macspoofx' from anywhere${NC}"
+    # A launcher that imports the module (instead of a symlink to the script)
+    # lets Python reuse cached bytecode rather than recompiling on every start
+    sudo rm -f /usr/local/bin/macspoofx
+    sudo tee /usr/local/bin/macspoofx > /dev/null << LAUNCHER
+#!/usr/bin/env python3
+import sys
+sys.path.insert(0, '$(pwd)')
+from macspoofx import main
+main()
+LAUNCHER
+    sudo chmod 755 /usr/local/bin/macspoofx
+    echo -e "${GREEN}[+] Created launcher: You can now run 'sudo macspoofx' from anywhere${NC}"
 fi
 
 # Test installation
 echo -e "\n${CYAN}[*] Testing installation...${NC}"
-if python3 -c "import prettytable, schedule, netifaces, colorama" 2>/dev/null; then
-    echo -e "${GREEN}[+] All Python modules imported successfully${NC}"
+if sudo python3 -c "import macspoofx" 2>/dev/null; then
+    echo -e "${GREEN}[+] macspoofx module imported and bytecode cached${NC}"
 else
-    echo -e "${RED}[-] Some Python modules failed to import${NC}"
+    echo -e "${RED}[-] macspoofx failed to import${NC}"
     exit 1
 fi
 
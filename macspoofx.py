@@ -18,54 +18,535 @@ Network Protocol Details:
 - MAC addresses operate at Layer 2 (Data Link Layer) of the OSI model
 - MAC spoofing changes the hardware address identifier of network interfaces
 - This can be used for privacy, testing, or bypassing MAC filtering
-- The tool uses macchanger to modify the NIC's MAC address in kernel space
+- The tool writes the NIC's MAC address in kernel space over rtnetlink
+  (or macchanger, selectable with --backend)
 - iptables rules can be applied to manage packet filtering during spoofing
 """
 
+import time
+_MODULE_START = time.perf_counter()
+
 import argparse
+import atexit
+import importlib
 import subprocess
 import sys
 import os
 import re
-import time
 import json
-import csv
 import logging
+import math
 import threading
+import select
+import shutil
 import signal
+import tempfile
+import errno
+import heapq
+import random
+import socket
+import struct
+import fcntl
+import bisect
+import zlib
+from array import array
+from collections import deque
+from itertools import accumulate, chain, islice
 from datetime import datetime
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Iterable
 from pathlib import Path
 
-try:
-    from prettytable import PrettyTable
-except ImportError:
-    print("[!] PrettyTable not found. Installing...")
-    subprocess.run([sys.executable, "-m", "pip", "install", "prettytable"], check=True)
-    from prettytable import PrettyTable
-
-try:
-    import schedule
-except ImportError:
-    print("[!] Schedule module not found. Installing...")
-    subprocess.run([sys.executable, "-m", "pip", "install", "schedule"], check=True)
-    import schedule
-
-try:
-    import netifaces
-except ImportError:
-    print("[!] Netifaces module not found. Installing...")
-    subprocess.run([sys.executable, "-m", "pip", "install", "netifaces"], check=True)
-    import netifaces
-
-try:
-    from colorama import init, Fore, Style
-    init(autoreset=True)
-except ImportError:
-    print("[!] Colorama not found. Installing...")
-    subprocess.run([sys.executable, "-m", "pip", "install", "colorama"], check=True)
-    from colorama import init, Fore, Style
-    init(autoreset=True)
+
+class _LazyModule:
+    """
+    Module proxy that imports on first attribute access.
+    
+    Keeps heavy standard library modules (asyncio alone costs ~40 ms) off the
+    startup path of one-shot invocations that never use them. Import times
+    are recorded for --startup-profile.
+    """
+    
+    loaded: Dict[str, float] = {}
+    
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            started = time.perf_counter()
+            self._module = importlib.import_module(self._name)
+            _LazyModule.loaded[self._name] = (time.perf_counter() - started) * 1000
+        return getattr(self._module, attr)
+
+
+asyncio = _LazyModule('asyncio')
+futures = _LazyModule('concurrent.futures')
+sqlite3 = _LazyModule('sqlite3')
+ctypes = _LazyModule('ctypes')
+mmap = _LazyModule('mmap')
+csv = _LazyModule('csv')
+socketserver = _LazyModule('socketserver')
+multiprocessing = _LazyModule('multiprocessing')
+
+
+class _Palette:
+    """ANSI color codes; empty when output is not a terminal or NO_COLOR is set."""
+    
+    def __init__(self, enabled: bool, **codes):
+        for name, code in codes.items():
+            setattr(self, name, code if enabled else '')
+
+
+_COLOR = sys.stdout.isatty() and 'NO_COLOR' not in os.environ
+Fore = _Palette(_COLOR, RED='\033[31m', GREEN='\033[32m', YELLOW='\033[33m', CYAN='\033[36m')
+Style = _Palette(_COLOR, RESET_ALL='\033[0m', BRIGHT='\033[1m')
+
+
+# Persistent state (sequence cursor, caches, history) lives here
+STATE_DIR = os.environ.get('MACSPOOFX_STATE_DIR', '/var/lib/macspoofx')
+
+
+class Metrics:
+    """
+    Minimal Prometheus-style metrics registry.
+    
+    Metric Types:
+    - Histograms: cumulative buckets plus _sum and _count, in seconds
+    - Counters: monotonically increasing totals
+    
+    Every label set is a tuple of values in the order of the metric's label
+    names. While disabled, observe() and inc() return before touching any
+    state, so instrumented hot paths pay one attribute check.
+    
+    Exposure:
+    - render() returns the text exposition format (version 0.0.4)
+    - write_file() replaces a file atomically (node_exporter textfile style)
+    - serve() starts a local HTTP endpoint on a background thread
+    """
+    
+    BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+               0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    METRICS = {
+        'macspoofx_phase_seconds': ('histogram', 'Duration of each MAC change phase', ('phase', 'backend')),
+        'macspoofx_subprocess_seconds': ('histogram', 'Wall time of external command spawns', ('command',)),
+        'macspoofx_interface_query_seconds': ('histogram', 'Interface state reads that missed the cache',
+                                              ('field',)),
+        'macspoofx_scheduler_lag_seconds': ('histogram', 'Delay between a scheduled deadline and its run', ()),
+        'macspoofx_admission_wait_seconds': ('histogram', 'Time a MAC change waited for flap admission', ()),
+        'macspoofx_rotations_total': ('counter', 'MAC changes by mode, interface and result',
+                                      ('mode', 'interface', 'result')),
+        'macspoofx_scheduler_missed_total': ('counter', 'Scheduled runs skipped after falling behind', ()),
+        'macspoofx_cache_requests_total': ('counter', 'Interface state cache lookups', ('result',)),
+        'macspoofx_collisions_total': ('counter', 'Generated MACs rejected as neighbor or recent duplicates',
+                                       ('reason',)),
+    }
+    
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.histograms: Dict[str, Dict[Tuple, List]] = {}
+        self.counters: Dict[str, Dict[Tuple, float]] = {}
+        self._server = None
+    
+    def observe(self, name: str, seconds: float, labels: Tuple = ()):
+        """Record one histogram sample."""
+        if not self.enabled:
+            return
+        index = bisect.bisect_left(self.BUCKETS, seconds)
+        with self.lock:
+            series = self.histograms.setdefault(name, {})
+            state = series.get(labels)
+            if state is None:
+                state = series[labels] = [[0] * (len(self.BUCKETS) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += seconds
+            state[2] += 1
+    
+    def inc(self, name: str, labels: Tuple = (), amount: float = 1):
+        """Increment a counter."""
+        if not self.enabled:
+            return
+        with self.lock:
+            series = self.counters.setdefault(name, {})
+            series[labels] = series.get(labels, 0) + amount
+    
+    @staticmethod
+    def _labels(names: Tuple, values: Tuple, extra: str = '') -> str:
+        pairs = [f'{name}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+                 for name, value in zip(names, values)]
+        if extra:
+            pairs.append(extra)
+        return '{' + ','.join(pairs) + '}' if pairs else ''
+    
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        with self.lock:
+            for name, (kind, help_text, label_names) in self.METRICS.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                if kind == 'counter':
+                    for values, total in sorted(self.counters.get(name, {}).items()):
+                        lines.append(f"{name}{self._labels(label_names, values)} {total}")
+                    continue
+                for values, (buckets, total, count) in sorted(self.histograms.get(name, {}).items()):
+                    cumulative = 0
+                    for bound, bucket in zip(self.BUCKETS + ('+Inf',), buckets):
+                        cumulative += bucket
+                        le = self._labels(label_names, values, f'le="{bound}"')
+                        lines.append(f"{name}_bucket{le} {cumulative}")
+                    lines.append(f"{name}_sum{self._labels(label_names, values)} {total:.9f}")
+                    lines.append(f"{name}_count{self._labels(label_names, values)} {count}")
+        return '\n'.join(lines) + '\n'
+    
+    def write_file(self, path: str):
+        """Atomically replace path with the current exposition."""
+        temp = f"{path}.tmp"
+        with open(temp, 'w') as f:
+            f.write(self.render())
+        os.replace(temp, path)
+    
+    def serve(self, port: int, address: str = '127.0.0.1'):
+        """Serve /metrics over HTTP from a daemon thread."""
+        http_server = importlib.import_module('http.server')
+        metrics = self
+        
+        class Handler(http_server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        self._server = http_server.ThreadingHTTPServer((address, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name='metrics', daemon=True).start()
+    
+    def close(self):
+        """Stop the HTTP endpoint if one is running."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# Process-wide registry; enabled by --metrics-file / --metrics-port
+METRICS = Metrics()
+
+
+def run_command(command: List[str], **kwargs) -> subprocess.CompletedProcess:
+    """subprocess.run() that records the spawn in macspoofx_subprocess_seconds."""
+    started = time.perf_counter()
+    try:
+        return subprocess.run(command, **kwargs)
+    finally:
+        METRICS.observe('macspoofx_subprocess_seconds', time.perf_counter() - started, (command[0],))
+
+
+class MacAddress:
+    """
+    48-bit MAC address stored as a single int.
+    
+    Accepted input forms (case-insensitive):
+    - colon or hyphen separated octets: 00:1a:2b:3c:4d:5e, 00-1A-2B-3C-4D-5E
+    - Cisco dotted quads: 001a.2b3c.4d5e
+    - bare hex: 001a2b3c4d5e
+    
+    Instances are immutable, hashable and ordered by value, and cost one
+    slot each. Bulk helpers (parse_many, format_many, load_file) work on
+    packed uint64 arrays: a NumPy array when NumPy is installed, otherwise
+    an array('Q') buffer. Clean fixed-width input is parsed with bytes
+    slicing alone; input with bad rows is validated row-wise in NumPy,
+    or line by line without it.
+    """
+    
+    __slots__ = ('value',)
+    
+    PATTERN = re.compile(
+        r'[0-9A-Fa-f]{2}([:-])(?:[0-9A-Fa-f]{2}\1){4}[0-9A-Fa-f]{2}'
+        r'|[0-9A-Fa-f]{4}\.[0-9A-Fa-f]{4}\.[0-9A-Fa-f]{4}'
+        r'|[0-9A-Fa-f]{12}'
+    )
+    SEPARATORS = str.maketrans('', '', ':-.')
+    STYLES = ('colon', 'hyphen', 'cisco', 'bare')
+    
+    # Fixed-width layouts for the vectorized parser: width -> (separator columns, separators)
+    LAYOUTS = {
+        17: ((2, 5, 8, 11, 14), b':-'),
+        14: ((4, 9), b'.'),
+        12: ((), b''),
+    }
+    
+    _numpy_module = None
+    
+    def __init__(self, value: int):
+        if not 0 <= value <= 0xFFFFFFFFFFFF:
+            raise ValueError(f"MAC address out of range: {value:#x}")
+        self.value = value
+    
+    @classmethod
+    def parse(cls, text: str) -> 'MacAddress':
+        """
+        Parse any accepted form.
+        
+        Raises:
+            ValueError: If text is not a MAC address
+        """
+        text = text.strip()
+        if not cls.PATTERN.fullmatch(text):
+            raise ValueError(f"Invalid MAC address: {text!r}")
+        return cls(int(text.translate(cls.SEPARATORS), 16))
+    
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> 'MacAddress':
+        """Build from 6 raw octets."""
+        if len(raw) != 6:
+            raise ValueError(f"MAC address must be 6 bytes, got {len(raw)}")
+        return cls(int.from_bytes(raw, 'big'))
+    
+    @property
+    def packed(self) -> bytes:
+        return self.value.to_bytes(6, 'big')
+    
+    @property
+    def oui(self) -> int:
+        """24-bit organizationally unique identifier."""
+        return self.value >> 24
+    
+    @property
+    def is_multicast(self) -> bool:
+        """I/G bit (bit 0 of the first octet) set."""
+        return bool(self.value >> 40 & 0x01)
+    
+    @property
+    def is_unicast(self) -> bool:
+        return not self.value >> 40 & 0x01
+    
+    @property
+    def is_locally_administered(self) -> bool:
+        """U/L bit (bit 1 of the first octet) set."""
+        return bool(self.value >> 40 & 0x02)
+    
+    @property
+    def is_universal(self) -> bool:
+        return not self.value >> 40 & 0x02
+    
+    def format(self, style: str = 'colon', upper: bool = False) -> str:
+        """
+        Format the address.
+        
+        Args:
+            style: One of 'colon', 'hyphen', 'cisco', 'bare'
+            upper: Use uppercase hex digits
+        """
+        if style == 'colon':
+            text = self.packed.hex(':')
+        elif style == 'hyphen':
+            text = self.packed.hex('-')
+        elif style == 'cisco':
+            text = self.packed.hex('.', 2)
+        elif style == 'bare':
+            text = self.packed.hex()
+        else:
+            raise ValueError(f"Unknown MAC format style: {style}")
+        return text.upper() if upper else text
+    
+    def __str__(self) -> str:
+        return self.packed.hex(':')
+    
+    def __repr__(self) -> str:
+        return f"MacAddress('{self}')"
+    
+    def __int__(self) -> int:
+        return self.value
+    
+    def __hash__(self) -> int:
+        return hash(self.value)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MacAddress):
+            return self.value == other.value
+        return NotImplemented
+    
+    def __lt__(self, other: 'MacAddress') -> bool:
+        if isinstance(other, MacAddress):
+            return self.value < other.value
+        return NotImplemented
+    
+    @classmethod
+    def _numpy(cls):
+        """NumPy if it is installed, else None (imported on first bulk call)."""
+        if cls._numpy_module is None:
+            try:
+                cls._numpy_module = importlib.import_module('numpy')
+            except ImportError:
+                cls._numpy_module = False
+        return cls._numpy_module or None
+    
+    @classmethod
+    def parse_many(cls, data, use_numpy: bool = None) -> Tuple[Iterable[int], List[Tuple[int, str]]]:
+        """
+        Validate and parse many addresses at once.
+        
+        Args:
+            data: Newline separated addresses (bytes or str) or an iterable
+                of address strings
+            use_numpy: Force (True) or disable (False) the NumPy path;
+                default is to use it when installed
+            
+        Returns:
+            Tuple of (values of the valid addresses in input order as a
+            uint64 NumPy array or array('Q'), list of (line number, text)
+            for the invalid ones)
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        elif not isinstance(data, (bytes, bytearray, memoryview)):
+            data = '\n'.join(data).encode()
+        data = bytes(data).replace(b'\r\n', b'\n')
+        if data and not data.endswith(b'\n'):
+            data += b'\n'
+        
+        # Clean fixed-width input is fastest as plain bytes slicing; NumPy
+        # pays off once rows have to be validated and filtered individually
+        np = cls._numpy() if use_numpy is not False else None
+        parsed = cls._parse_fixed_width_bytes(data)
+        if parsed is not None:
+            values, invalid = parsed
+            return (np.frombuffer(values, dtype=np.uint64).copy() if np is not None else values), invalid
+        if np is not None:
+            parsed = cls._parse_fixed_width(np, data)
+            if parsed is not None:
+                return parsed
+        
+        values = array('Q')
+        invalid = []
+        pattern, separators = cls.PATTERN, cls.SEPARATORS
+        for number, line in enumerate(data.decode('ascii', 'replace').splitlines(), 1):
+            text = line.strip()
+            if pattern.fullmatch(text):
+                values.append(int(text.translate(separators), 16))
+            else:
+                invalid.append((number, line))
+        if np is not None:
+            values = np.frombuffer(values, dtype=np.uint64).copy()
+        return values, invalid
+    
+    @classmethod
+    def _parse_fixed_width_bytes(cls, data: bytes):
+        """
+        Parse a clean fixed-width buffer with bytes slicing alone; None if any
+        line is off, so the caller can fall back to line-by-line parsing.
+        """
+        if not data:
+            return array('Q'), []
+        width = data.index(b'\n')
+        if width not in cls.LAYOUTS or len(data) % (width + 1):
+            return None
+        step = width + 1
+        count = len(data) // step
+        if data[width::step] != b'\n' * count:
+            return None
+        
+        sep_columns, allowed = cls.LAYOUTS[width]
+        if sep_columns:
+            first = data[sep_columns[0]::step]
+            if first.translate(None, allowed) or any(data[c::step] != first for c in sep_columns[1:]):
+                return None
+        try:
+            raw = bytes.fromhex(data.translate(None, b':-.\n').decode('ascii'))
+        except (ValueError, UnicodeDecodeError):
+            return None
+        if len(raw) != 6 * count:
+            return None
+        
+        # Widen each 6-byte address to a big-endian uint64
+        buf = bytearray(8 * count)
+        for octet in range(6):
+            buf[octet + 2::8] = raw[octet::6]
+        values = array('Q', bytes(buf))
+        if sys.byteorder == 'little':
+            values.byteswap()
+        return values, []
+    
+    @classmethod
+    def _parse_fixed_width(cls, np, data: bytes):
+        """Vectorized parse when every line has the same width and no padding; None otherwise."""
+        if not data:
+            return np.zeros(0, dtype=np.uint64), []
+        width = data.index(b'\n')
+        if width not in cls.LAYOUTS or len(data) % (width + 1):
+            return None
+        rows = np.frombuffer(data, dtype=np.uint8).reshape(-1, width + 1)
+        if not (rows[:, width] == ord('\n')).all():
+            return None
+        
+        sep_columns, allowed = cls.LAYOUTS[width]
+        hex_columns = [c for c in range(width) if c not in sep_columns]
+        lookup = np.full(256, 255, dtype=np.uint8)
+        for digit, char in enumerate(b'0123456789abcdef'):
+            lookup[char] = digit
+            lookup[ord(chr(char).upper())] = digit
+        
+        nibbles = lookup[rows[:, hex_columns]]
+        valid = (nibbles != 255).all(axis=1)
+        if sep_columns:
+            seps = rows[:, list(sep_columns)]
+            # Every separator in a row must be the same allowed character
+            valid &= (seps == seps[:, :1]).all(axis=1) & np.isin(seps[:, 0], list(allowed))
+        
+        shifts = np.arange(44, -1, -4, dtype=np.uint64)
+        values = (nibbles[valid].astype(np.uint64) << shifts).sum(axis=1, dtype=np.uint64)
+        invalid = [(int(i) + 1, rows[i, :width].tobytes().decode('ascii', 'replace'))
+                   for i in np.flatnonzero(~valid)]
+        return values, invalid
+    
+    @classmethod
+    def format_many(cls, values, style: str = 'colon', upper: bool = False) -> str:
+        """
+        Format packed values as newline terminated lines.
+        
+        Args:
+            values: uint64 values (NumPy array, array('Q') or any iterable)
+            style: One of 'colon', 'hyphen', 'cisco', 'bare'
+            upper: Use uppercase hex digits
+        """
+        if style not in cls.STYLES:
+            raise ValueError(f"Unknown MAC format style: {style}")
+        np = cls._numpy()
+        if np is not None and len(values):
+            octets = np.asarray(values, dtype=np.uint64).astype('>u8').view(np.uint8).reshape(-1, 8)[:, 2:]
+            digits = (b'0123456789ABCDEF' if upper else b'0123456789abcdef')
+            table = np.frombuffer(bytes(c for i in range(256) for c in (digits[i >> 4], digits[i & 15])),
+                                  dtype=np.uint8).reshape(256, 2)
+            hex_digits = table[octets].reshape(-1, 12)
+            if style in ('colon', 'hyphen'):
+                out = np.full((len(octets), 18), ord(':' if style == 'colon' else '-'), dtype=np.uint8)
+                out[:, [c for c in range(17) if c % 3 != 2]] = hex_digits
+            elif style == 'cisco':
+                out = np.full((len(octets), 15), ord('.'), dtype=np.uint8)
+                out[:, [c for c in range(14) if c % 5 != 4]] = hex_digits
+            else:
+                out = np.empty((len(octets), 13), dtype=np.uint8)
+                out[:, :12] = hex_digits
+            out[:, -1] = ord('\n')
+            return out.tobytes().decode('ascii')
+        return ''.join(cls(int(value)).format(style, upper) + '\n' for value in values)
+    
+    @classmethod
+    def load_file(cls, path: str, use_numpy: bool = None) -> Tuple[Iterable[int], List[Tuple[int, str]]]:
+        """Read and parse an address-per-line file ('-' for stdin); see parse_many."""
+        if path == '-':
+            return cls.parse_many(sys.stdin.buffer.read(), use_numpy)
+        with open(path, 'rb') as f:
+            return cls.parse_many(f.read(), use_numpy)
 
 
 class MACAddressValidator:
@@ -74,8 +555,10 @@ class MACAddressValidator:
     
     MAC Address Format:
     - 48-bit identifier typically displayed as 6 groups of 2 hexadecimal digits
-    - Separated by colons (:) or hyphens (-)
+    - Separated by colons (:) or hyphens (-), or Cisco dotted / bare hex
     - Example: 00:1A:2B:3C:4D:5E
+    
+    String-level helpers over MacAddress.
     """
     
     @staticmethod
@@ -89,8 +572,7 @@ class MACAddressValidator:
         Returns:
             bool: True if valid, False otherwise
         """
-        pattern = re.compile(r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$')
-        return bool(pattern.match(mac))
+        return bool(MacAddress.PATTERN.fullmatch(mac.strip()))
     
     @staticmethod
     def normalize_mac(mac: str) -> str:
@@ -102,536 +584,5604 @@ class MACAddressValidator:
             
         Returns:
             str: Normalized MAC address
+            
+        Raises:
+            ValueError: If mac is not a MAC address
+        """
+        return str(MacAddress.parse(mac))
+    
+    @staticmethod
+    def is_unicast(mac: str) -> bool:
+        """Check the I/G bit (bit 0 of the first octet) is clear."""
+        return not int(mac[0:2], 16) & 0x01
+    
+    @staticmethod
+    def is_locally_administered(mac: str) -> bool:
+        """Check the U/L bit (bit 1 of the first octet) is set."""
+        return bool(int(mac[0:2], 16) & 0x02)
+    
+    @staticmethod
+    def validate_batch(macs: List[str]) -> List[str]:
+        """
+        Filter a batch of generated addresses down to valid unicast MACs.
+        
+        Args:
+            macs: Candidate MAC addresses
+            
+        Returns:
+            List of addresses that passed format and unicast checks
         """
-        mac = mac.replace('-', ':').lower()
-        return mac
+        return [
+            mac for mac in macs
+            if MACAddressValidator.is_valid_mac(mac) and MACAddressValidator.is_unicast(mac)
+            and mac != '00:00:00:00:00:00'
+        ]
 
 
-class NetworkInterfaceManager:
+class OUIDatabase:
     """
-    Manages network interface operations including detection, status checks,
-    and configuration using Kali Linux networking tools.
+    Compiled, memory-mapped IEEE vendor prefix database.
     
-    Integration:
-    - Uses 'ip' command for interface management
-    - Leverages 'ethtool' for advanced NIC information
-    - Interfaces with 'iwconfig' for wireless adapters
+    Source formats accepted:
+    - IEEE text registries (oui.txt, mam.txt, oui36.txt) with '(hex)' and
+      '(base 16)' lines
+    - IEEE CSV registries (oui.csv, mam.csv, oui36.csv)
+    - macchanger OUI.list and Wireshark manuf style 'XX:XX:XX[/bits] Vendor'
+    
+    Index layout (native byte order, sections 8-byte aligned):
+    - header: magic, MA-L/MA-M/MA-S counts, vendor count, string blob size
+    - sorted 24/28/36-bit prefix arrays, each with a parallel vendor index array
+    - vendors sorted by lowercase name: name offsets and entry ranges
+    - per-vendor entry list (prefix | bits << 48) and the UTF-8 name blob
+    
+    The index is mmap'd and binary-searched in place, so loading it costs a
+    single mmap and no per-entry Python objects are created.
     """
     
-    def __init__(self, verbose: bool = False):
-        self.verbose = verbose
-        self.logger = logging.getLogger(__name__)
+    MAGIC = b'MSXOUI01'
+    HEADER = struct.Struct('=8s5I4x')
     
-    def get_all_interfaces(self) -> List[str]:
-        """
-        Retrieve all network interfaces on the system.
+    # Distinct vendor queries remembered by find_vendors()
+    VENDOR_CACHE_SIZE = 256
+    
+    DEFAULT_SOURCES = [
+        '/usr/share/ieee-data/oui.txt',
+        '/usr/share/ieee-data/mam.txt',
+        '/usr/share/ieee-data/oui36.txt',
+        '/usr/share/macchanger/OUI.list',
+        '/usr/share/wireshark/manuf',
+    ]
+    
+    HEX_LINE = re.compile(r'^\s*([0-9A-Fa-f]{2}(?:-[0-9A-Fa-f]{1,2}){2,4})\s+\(hex\)\s+(.*)$')
+    BASE16_LINE = re.compile(r'^\s*([0-9A-Fa-f]{6})(?:-([0-9A-Fa-f]{6}))?\s+\(base 16\)\s+(.*)$')
+    PLAIN_LINE = re.compile(r'^([0-9A-Fa-f]{2}(?:[:\- ][0-9A-Fa-f]{2}){2,5})(?:/(\d+))?\s+(.+)$')
+    
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        with open(index_path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._map)
+        magic, n24, n28, n36, n_vendors, blob_size = self.HEADER.unpack_from(view)
+        if magic != self.MAGIC:
+            raise ValueError(f"Not an OUI index: {index_path}")
         
-        Returns:
-            List of interface names
-        """
-        try:
-            interfaces = netifaces.interfaces()
-            # Filter out loopback
-            interfaces = [iface for iface in interfaces if iface != 'lo']
-            return interfaces
-        except Exception as e:
-            self.logger.error(f"Error getting interfaces: {e}")
-            return []
+        offset = self.HEADER.size
+        
+        def section(count: int, fmt: str):
+            nonlocal offset
+            size = count * struct.calcsize(fmt)
+            part = view[offset:offset + size].cast(fmt)
+            offset += size + (-size % 8)
+            return part
+        
+        self.prefixes = {24: section(n24, 'I'), 28: section(n28, 'I'), 36: section(n36, 'Q')}
+        self.vendor_of = {24: section(n24, 'I'), 28: section(n28, 'I'), 36: section(n36, 'I')}
+        self.name_offsets = section(n_vendors + 1, 'I')
+        self.entry_ranges = section(n_vendors + 1, 'I')
+        self.entries = section(self.entry_ranges[n_vendors] if n_vendors else 0, 'Q')
+        self.names = view[offset:offset + blob_size]
+        self.vendor_count = n_vendors
+        self._vendor_cache: Dict[str, List[int]] = {}
     
-    def get_interface_info(self, interface: str) -> Dict[str, str]:
+    def close(self):
+        """Release the memory map."""
+        for views in (self.prefixes, self.vendor_of):
+            for part in views.values():
+                part.release()
+        for part in (self.name_offsets, self.entry_ranges, self.entries, self.names):
+            part.release()
+        self._map.close()
+    
+    @classmethod
+    def parse_source(cls, filepath: str) -> List[Tuple[int, int, str]]:
         """
-        Get detailed information about a network interface.
+        Parse a registry file into (prefix, bits, vendor) tuples.
         
         Args:
-            interface: Interface name
+            filepath: Registry text, CSV or manuf file
             
         Returns:
-            Dictionary containing interface details
+            List of (prefix_value, prefix_bits, vendor_name)
         """
-        info = {
-            'interface': interface,
-            'current_mac': self.get_current_mac(interface),
-            'permanent_mac': self.get_permanent_mac(interface),
-            'status': self.get_interface_status(interface),
-            'ip_address': self.get_ip_address(interface),
-            'driver': self.get_driver_info(interface)
-        }
-        return info
+        entries = []
+        with open(filepath, encoding='utf-8', errors='replace') as f:
+            if filepath.endswith('.csv'):
+                for row in csv.reader(f):
+                    if len(row) >= 3 and re.fullmatch(r'[0-9A-Fa-f]{6,9}', row[1]):
+                        entries.append((int(row[1], 16), len(row[1]) * 4, row[2].strip()))
+                return entries
+            
+            last_oui = None
+            for line in f:
+                match = cls.HEX_LINE.match(line)
+                if match:
+                    last_oui = match.group(1).replace('-', '')
+                    continue
+                match = cls.BASE16_LINE.match(line)
+                if match:
+                    start, end, vendor = match.groups()
+                    digits = start
+                    if end and last_oui:
+                        # MA-M/MA-S ranges: fixed leading nibbles extend the OUI
+                        fixed = 0
+                        while fixed < 6 and start[fixed] == end[fixed]:
+                            fixed += 1
+                        digits = last_oui[:6] + start[:fixed]
+                    entries.append((int(digits, 16), len(digits) * 4, vendor.strip()))
+                    continue
+                if line.startswith('#'):
+                    continue
+                match = cls.PLAIN_LINE.match(line.strip())
+                if match:
+                    digits = re.sub(r'[:\- ]', '', match.group(1))
+                    bits = int(match.group(2)) if match.group(2) else 24
+                    if bits not in (24, 28, 36):
+                        continue
+                    value = int(digits, 16) >> (len(digits) * 4 - bits) if len(digits) * 4 > bits else int(digits, 16)
+                    vendor = match.group(3).split('\t')[-1].strip()
+                    entries.append((value, bits, vendor))
+        return entries
     
-    def get_current_mac(self, interface: str) -> Optional[str]:
+    @classmethod
+    def compile(cls, sources: List[str], index_path: str) -> int:
         """
-        Get current MAC address of interface using 'ip' command.
+        Compile registry files into a binary index.
         
         Args:
-            interface: Network interface name
+            sources: Registry files to merge
+            index_path: Destination index file
             
         Returns:
-            Current MAC address or None
+            Number of prefixes indexed
         """
-        try:
-            result = subprocess.run(
-                ['ip', 'link', 'show', interface],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            mac_match = re.search(r'link/ether\s+([0-9a-fA-F:]{17})', result.stdout)
-            if mac_match:
-                return mac_match.group(1).lower()
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Error getting MAC for {interface}: {e}")
-        return None
+        by_prefix: Dict[Tuple[int, int], str] = {}
+        for source in sources:
+            for value, bits, vendor in cls.parse_source(source):
+                by_prefix.setdefault((bits, value), vendor)
+        
+        vendors = sorted({vendor for vendor in by_prefix.values()}, key=str.lower)
+        vendor_ids = {vendor: i for i, vendor in enumerate(vendors)}
+        
+        sections = []
+        for bits, fmt in ((24, 'I'), (28, 'I'), (36, 'Q')):
+            keys = sorted(value for (b, value) in by_prefix if b == bits)
+            sections.append((array(fmt, keys), array('I', (vendor_ids[by_prefix[(bits, v)]] for v in keys))))
+        
+        per_vendor: List[List[int]] = [[] for _ in vendors]
+        for (bits, value), vendor in by_prefix.items():
+            per_vendor[vendor_ids[vendor]].append(value | bits << 48)
+        
+        blob = bytearray()
+        name_offsets = array('I')
+        entry_ranges = array('I', [0])
+        entries = array('Q')
+        for i, vendor in enumerate(vendors):
+            name_offsets.append(len(blob))
+            blob += vendor.encode()
+            entries.extend(sorted(per_vendor[i]))
+            entry_ranges.append(len(entries))
+        name_offsets.append(len(blob))
+        
+        parts = [cls.HEADER.pack(cls.MAGIC, len(sections[0][0]), len(sections[1][0]),
+                                 len(sections[2][0]), len(vendors), len(blob))]
+        arrays = [prefixes for prefixes, _ in sections] + [ids for _, ids in sections]
+        arrays += [name_offsets, entry_ranges, entries]
+        for part in arrays:
+            raw = part.tobytes()
+            parts.append(raw + b'\0' * (-len(raw) % 8))
+        parts.append(bytes(blob))
+        
+        os.makedirs(os.path.dirname(index_path) or '.', exist_ok=True)
+        tmp_path = f"{index_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(b''.join(parts))
+        os.replace(tmp_path, index_path)
+        return len(by_prefix)
     
-    def get_permanent_mac(self, interface: str) -> Optional[str]:
+    @classmethod
+    def load(cls, sources: List[str] = None, index_path: str = None) -> Optional['OUIDatabase']:
         """
-        Get permanent (hardware) MAC address using ethtool.
+        Open the index, (re)compiling it when a source file is newer.
         
         Args:
-            interface: Network interface name
+            sources: Registry files (default: IEEE/macchanger/Wireshark system paths)
+            index_path: Compiled index location (default: STATE_DIR/oui.idx)
             
         Returns:
-            Permanent MAC address or None
+            OUIDatabase or None when no registry data is available
         """
+        logger = logging.getLogger(__name__)
+        index_path = index_path or os.path.join(STATE_DIR, 'oui.idx')
+        sources = [path for path in (sources or cls.DEFAULT_SOURCES) if os.path.exists(path)]
         try:
-            result = subprocess.run(
-                ['ethtool', '-P', interface],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            if result.returncode == 0:
-                mac_match = re.search(r'([0-9a-fA-F:]{17})', result.stdout)
-                if mac_match:
-                    return mac_match.group(1).lower()
-        except FileNotFoundError:
-            self.logger.warning("ethtool not found, skipping permanent MAC retrieval")
-        return None
+            index_mtime = os.path.getmtime(index_path)
+        except OSError:
+            index_mtime = None
+        
+        if sources and (index_mtime is None or any(os.path.getmtime(p) > index_mtime for p in sources)):
+            try:
+                count = cls.compile(sources, index_path)
+                logger.info(f"Compiled {count} OUI prefixes into {index_path}")
+            except OSError as e:
+                logger.warning(f"Could not compile OUI index: {e}")
+                if index_mtime is None:
+                    return None
+        elif index_mtime is None:
+            return None
+        
+        try:
+            return cls(index_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not open OUI index: {e}")
+            return None
     
-    def get_interface_status(self, interface: str) -> str:
+    def vendor_name(self, vendor_id: int) -> str:
+        """Return the vendor name for a vendor id."""
+        return bytes(self.names[self.name_offsets[vendor_id]:self.name_offsets[vendor_id + 1]]).decode()
+    
+    def lookup(self, mac: str) -> Optional[str]:
         """
-        Check if interface is up or down.
+        Find the vendor owning a MAC address (longest prefix wins).
         
         Args:
-            interface: Network interface name
+            mac: MAC address in any ':'/'-' separated or bare hex form
             
         Returns:
-            'UP' or 'DOWN'
+            Vendor name or None
         """
         try:
-            result = subprocess.run(
-                ['ip', 'link', 'show', interface],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            if 'state UP' in result.stdout or 'UP' in result.stdout:
-                return 'UP'
-            return 'DOWN'
-        except subprocess.CalledProcessError:
-            return 'UNKNOWN'
+            value = int(re.sub(r'[:\-.]', '', mac), 16)
+        except ValueError:
+            return None
+        for bits in (36, 28, 24):
+            prefixes = self.prefixes[bits]
+            key = value >> (48 - bits)
+            i = bisect.bisect_left(prefixes, key)
+            if i < len(prefixes) and prefixes[i] == key:
+                return self.vendor_name(self.vendor_of[bits][i])
+        return None
     
-    def get_ip_address(self, interface: str) -> Optional[str]:
+    def find_vendors(self, name: str) -> List[int]:
         """
-        Get IP address assigned to interface.
+        Return vendor ids whose name starts with (or else contains) the query.
+        
+        Results are cached per query: a substring-only match scans every
+        vendor name.
         
         Args:
-            interface: Network interface name
-            
-        Returns:
-            IP address or None
+            name: Case-insensitive vendor name
         """
-        try:
-            addrs = netifaces.ifaddresses(interface)
-            if netifaces.AF_INET in addrs:
-                return addrs[netifaces.AF_INET][0]['addr']
-        except (ValueError, KeyError):
-            pass
-        return None
+        wanted = name.lower()
+        cached = self._vendor_cache.get(wanted)
+        if cached is not None:
+            return cached
+        matches = self._match_vendors(wanted)
+        if len(self._vendor_cache) >= self.VENDOR_CACHE_SIZE:
+            self._vendor_cache.clear()
+        self._vendor_cache[wanted] = matches
+        return matches
     
-    def get_driver_info(self, interface: str) -> Optional[str]:
+    def _match_vendors(self, wanted: str) -> List[int]:
+        lo, hi = 0, self.vendor_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.vendor_name(mid).lower() < wanted:
+                lo = mid + 1
+            else:
+                hi = mid
+        matches = []
+        while lo < self.vendor_count and self.vendor_name(lo).lower().startswith(wanted):
+            matches.append(lo)
+            lo += 1
+        if matches:
+            return matches
+        return [i for i in range(self.vendor_count) if wanted in self.vendor_name(i).lower()]
+    
+    def vendor_ranges(self, vendor: str = None) -> List[Tuple[int, int]]:
         """
-        Get network driver information using ethtool.
+        Resolve a vendor to its (start, end) slices of the entry list.
         
-        Args:
-            interface: Network interface name
-            
         Returns:
-            Driver name or None
+            Non-empty ranges; every entry when vendor is None, [] if unknown
         """
-        try:
-            result = subprocess.run(
-                ['ethtool', '-i', interface],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            if result.returncode == 0:
-                driver_match = re.search(r'driver:\s+(\S+)', result.stdout)
-                if driver_match:
-                    return driver_match.group(1)
-        except FileNotFoundError:
-            pass
-        return None
+        if not vendor:
+            return [(0, len(self.entries))] if len(self.entries) else []
+        ranges = [(self.entry_ranges[i], self.entry_ranges[i + 1]) for i in self.find_vendors(vendor)]
+        return [(start, end) for start, end in ranges if end > start]
     
-    def interface_down(self, interface: str) -> bool:
+    def pick_prefixes(self, ranges: List[Tuple[int, int]], count: int) -> List[Tuple[int, int]]:
         """
-        Bring interface down using 'ip link set' command.
+        Draw count prefixes uniformly from resolved vendor ranges.
         
         Args:
-            interface: Network interface name
+            ranges: Output of vendor_ranges()
+            count: Number of picks, all taken from one os.urandom buffer
             
         Returns:
-            True if successful
+            List of (prefix_value, prefix_bits); [] when ranges is empty
         """
+        ends = list(accumulate(end - start for start, end in ranges))
+        if not ends or not count:
+            return []
+        total = ends[-1]
+        randomness = os.urandom(4 * count)
+        picks = []
+        for i in range(count):
+            pick = int.from_bytes(randomness[4 * i:4 * i + 4], 'big') % total
+            slot = bisect.bisect_right(ends, pick)
+            entry = self.entries[ranges[slot][1] - (ends[slot] - pick)]
+            picks.append((entry & 0xFFFFFFFFFFFF, entry >> 48))
+        return picks
+    
+    def random_prefix(self, vendor: str = None) -> Optional[Tuple[int, int]]:
+        """
+        Pick a random registered prefix, optionally restricted to a vendor.
+        
+        Returns:
+            Tuple of (prefix_value, prefix_bits) or None if the vendor is unknown
+        """
+        picks = self.pick_prefixes(self.vendor_ranges(vendor), 1)
+        return picks[0] if picks else None
+
+
+class MACGenerator:
+    """
+    Native MAC address generator producing addresses in bulk.
+    
+    Modes:
+    - random: locally administered unicast addresses from os.urandom
+    - vendor: a registered vendor prefix (MA-L/MA-M/MA-S from the OUIDatabase,
+      or the built-in OUI table) followed by random bits
+    - sequence: a locally administered prefix with a monotonic 24-bit
+      counter, persisted between runs so addresses are never reused
+    
+    Bit layout of the first octet:
+    - bit 0 (I/G): 0 = unicast, 1 = multicast
+    - bit 1 (U/L): 0 = globally unique (OUI), 1 = locally administered
+    """
+    
+    MODES = ('random', 'vendor', 'sequence')
+    MAX_DRAWS = 64
+    
+    # Clears the multicast bit and sets the locally administered bit
+    LOCAL_UNICAST = bytes((b & 0xFC) | 0x02 for b in range(256))
+    
+    DEFAULT_VENDOR_OUIS = {
+        'Apple': ['00:1b:63', '00:1e:c2', 'ac:de:48'],
+        'Google': ['3c:5a:b4', '00:1a:11', 'f4:f5:d8'],
+        'VMware': ['00:50:56', '00:0c:29'],
+        'Intel': ['00:21:6a', '00:13:e8'],
+        'Raspberry Pi Foundation': ['b8:27:eb'],
+        'Microsoft': ['00:15:5d'],
+        'Cisco-Linksys': ['00:25:9c'],
+    }
+    
+    POOL_SIZE = 256
+    
+    def __init__(self, vendor_ouis: Dict[str, List[str]] = None, sequence_state: str = None,
+                 oui_db: OUIDatabase = None):
+        self.logger = logging.getLogger(__name__)
+        self.oui_db = oui_db
+        self.vendor_ouis = {
+            vendor: [bytes.fromhex(oui.replace(':', '').replace('-', '')) for oui in ouis]
+            for vendor, ouis in (vendor_ouis or self.DEFAULT_VENDOR_OUIS).items()
+        }
+        self.sequence_state = sequence_state or os.path.join(STATE_DIR, 'sequence.json')
+        self.lock = threading.Lock()
+        self._pool: List[str] = []
+        self._unsaved: Optional[Dict] = None
+        self.guard: Optional['CollisionGuard'] = None
+    
+    @staticmethod
+    def load_oui_table(filepath: str) -> Dict[str, List[str]]:
+        """
+        Load a vendor OUI table from a text file.
+        
+        Each line holds an OUI followed by the vendor name, e.g.
+        '00:1B:63 Apple' or '00 1B 63 Apple' (macchanger OUI.list format).
+        Lines starting with '#' are ignored.
+        
+        Args:
+            filepath: Path to the OUI table
+            
+        Returns:
+            Dictionary mapping vendor name to OUI list
+        """
+        table: Dict[str, List[str]] = {}
+        pattern = re.compile(r'^([0-9A-Fa-f]{2})[:\- ]?([0-9A-Fa-f]{2})[:\- ]?([0-9A-Fa-f]{2})\s+(.+)$')
+        with open(filepath) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                match = pattern.match(line)
+                if match:
+                    oui = ':'.join(match.group(1, 2, 3)).lower()
+                    table.setdefault(match.group(4).strip(), []).append(oui)
+        return table
+    
+    @staticmethod
+    def _format(buf: bytes) -> List[str]:
+        """Split a buffer of packed 6-byte addresses into MAC strings."""
+        text = buf.hex(':')
+        return [text[i:i + 17] for i in range(0, len(text), 18)]
+    
+    def random_batch(self, count: int) -> List[str]:
+        """Generate locally administered unicast addresses."""
+        buf = bytearray(os.urandom(6 * count))
+        buf[0::6] = buf[0::6].translate(self.LOCAL_UNICAST)
+        return self._format(buf)
+    
+    def _vendor_prefixes(self, vendor: Optional[str]) -> List[bytes]:
+        if not vendor:
+            return [oui for ouis in self.vendor_ouis.values() for oui in ouis]
+        wanted = vendor.lower()
+        return [
+            oui for name, ouis in self.vendor_ouis.items()
+            if wanted in name.lower() for oui in ouis
+        ]
+    
+    def vendor_batch(self, count: int, vendor: str = None) -> List[str]:
+        """
+        Generate addresses under a vendor OUI.
+        
+        Args:
+            count: Number of addresses
+            vendor: Case-insensitive vendor name (substring match), any vendor if None
+        """
+        # The vendor is resolved once per batch, not once per address
+        ranges = self.oui_db.vendor_ranges(vendor) if self.oui_db else []
+        if ranges:
+            tails = os.urandom(6 * count)
+            buf = bytearray()
+            for i, (prefix, bits) in enumerate(self.oui_db.pick_prefixes(ranges, count)):
+                tail = int.from_bytes(tails[6 * i:6 * i + 6], 'big') & ((1 << (48 - bits)) - 1)
+                buf += (prefix << (48 - bits) | tail).to_bytes(6, 'big')
+            return self._format(buf)
+        
+        prefixes = self._vendor_prefixes(vendor)
+        if not prefixes:
+            raise ValueError(f"No OUI known for vendor: {vendor}")
+        picks = os.urandom(2 * count)
+        tails = os.urandom(3 * count)
+        buf = b''.join(
+            prefixes[int.from_bytes(picks[2 * i:2 * i + 2], 'big') % len(prefixes)] + tails[3 * i:3 * i + 3]
+            for i in range(count)
+        )
+        return self._format(buf)
+    
+    def _load_cursor(self) -> Dict:
+        try:
+            with open(self.sequence_state) as f:
+                state = json.load(f)
+            state = {'prefix': int(state['prefix']), 'counter': int(state['counter'])}
+        except (OSError, ValueError, KeyError):
+            state = None
+        # A cursor this process could not persist is ahead of whatever the file holds
+        unsaved = self._unsaved
+        if unsaved and (state is None or state['prefix'] != unsaved['prefix']
+                        or state['counter'] < unsaved['counter']):
+            return dict(unsaved)
+        if state is None:
+            prefix = bytearray(os.urandom(3))
+            prefix[0] = self.LOCAL_UNICAST[prefix[0]]
+            state = {'prefix': int.from_bytes(prefix, 'big'), 'counter': 0}
+        return state
+    
+    def _save_cursor(self, state: Dict):
+        os.makedirs(os.path.dirname(self.sequence_state) or '.', exist_ok=True)
+        tmp_path = f"{self.sequence_state}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.sequence_state)
+    
+    def sequence_batch(self, count: int) -> List[str]:
+        """
+        Generate the next addresses of the persisted monotonic sequence.
+        
+        When the 24-bit counter wraps, a fresh locally administered prefix
+        is drawn so the sequence never repeats an address. The cursor is
+        read and written under an exclusive flock, so concurrent processes
+        (e.g. --netns workers) never hand out the same address.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.sequence_state) or '.', exist_ok=True)
+            lock_fd = os.open(f"{self.sequence_state}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError as e:
+            self.logger.warning(f"Sequence cursor lock unavailable, concurrent processes may repeat "
+                                f"addresses: {e}")
+            lock_fd = None
+        try:
+            if lock_fd is not None:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            state = self._load_cursor()
+            buf = bytearray()
+            for _ in range(count):
+                if state['counter'] > 0xFFFFFF:
+                    prefix = bytearray(os.urandom(3))
+                    prefix[0] = self.LOCAL_UNICAST[prefix[0]]
+                    state = {'prefix': int.from_bytes(prefix, 'big'), 'counter': 0}
+                buf += ((state['prefix'] << 24) | state['counter']).to_bytes(6, 'big')
+                state['counter'] += 1
+            try:
+                self._save_cursor(state)
+                self._unsaved = None
+            except OSError as e:
+                # Keep counting in memory so this process at least never repeats itself
+                self.logger.warning(f"Cannot persist sequence cursor to {self.sequence_state}: {e}")
+                self._unsaved = dict(state)
+        finally:
+            if lock_fd is not None:
+                os.close(lock_fd)
+        return self._format(buf)
+    
+    def generate(self, mode: str = 'random', count: int = 1, vendor: str = None) -> List[str]:
+        """
+        Generate a validated batch of addresses.
+        
+        Args:
+            mode: One of 'random', 'vendor', 'sequence'
+            count: Number of addresses
+            vendor: Vendor name for vendor mode
+            
+        Returns:
+            List of MAC addresses
+        """
+        with self.lock:
+            if mode == 'random':
+                batch = self.random_batch(count)
+            elif mode == 'vendor':
+                batch = self.vendor_batch(count, vendor)
+            elif mode == 'sequence':
+                batch = self.sequence_batch(count)
+            else:
+                raise ValueError(f"Unknown generator mode: {mode}")
+        return MACAddressValidator.validate_batch(batch)
+    
+    def next(self, mode: str = 'random', vendor: str = None) -> str:
+        """
+        Return one address, serving random mode from a pre-generated pool.
+        
+        With a CollisionGuard attached, candidates that collide with the
+        neighbor table or recent history are skipped.
+        
+        Args:
+            mode: One of 'random', 'vendor', 'sequence'
+            vendor: Vendor name for vendor mode
+            
+        Raises:
+            ValueError: If no collision-free address turns up in MAX_DRAWS draws
+        """
+        for _ in range(self.MAX_DRAWS):
+            candidate = self._draw(mode, vendor)
+            if self.guard is None or self.guard.accept(candidate):
+                return candidate
+        raise ValueError(f"No collision-free {mode} address after {self.MAX_DRAWS} draws")
+    
+    def _draw(self, mode: str, vendor: str = None) -> str:
+        """One validated candidate; ValueError if validation keeps rejecting them."""
+        for _ in range(self.MAX_DRAWS):
+            if mode != 'random':
+                batch = self.generate(mode, 1, vendor)
+                if batch:
+                    return batch[0]
+                continue
+            with self.lock:
+                if not self._pool:
+                    self._pool = MACAddressValidator.validate_batch(self.random_batch(self.POOL_SIZE))
+                if self._pool:
+                    return self._pool.pop()
+        raise ValueError(f"No valid {mode} address after {self.MAX_DRAWS} draws")
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over 48-bit MAC values.
+    
+    Sized for capacity entries at false_positive_rate; the k bit positions
+    come from double hashing one 64-bit multiplicative hash of the value.
+    """
+    
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        self.capacity = max(1, capacity)
+        self.size = max(64, int(-self.capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, value: int):
+        h = (value * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+    
+    def add(self, value: int):
+        self.add_many((value,))
+    
+    def add_many(self, values: Iterable[int]):
+        bits, size, hashes = self.bits, self.size, self.hashes
+        for value in values:
+            h = (value * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+            position, step = h & 0xFFFFFFFF, (h >> 32) | 1
+            for _ in range(hashes):
+                position %= size
+                bits[position >> 3] |= 1 << (position & 7)
+                position += step
+            self.count += 1
+    
+    def __contains__(self, value: int) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class CollisionGuard:
+    """
+    Rejects generated MACs that would collide on the segment or repeat a
+    recently used address.
+    
+    Sources:
+    - the kernel neighbor table (ARP and NDP entries) plus the addresses of
+      local links, loaded from one rtnetlink dump ('ip -j neigh' / sysfs
+      without netlink) into a hash set and reloaded every refresh_interval
+      seconds
+    - a rolling pair of Bloom filters of issued addresses, seeded from
+      history: once the current filter holds capacity entries it becomes
+      the previous one and a fresh filter is started, so the last
+      capacity to 2 * capacity addresses are always remembered
+    
+    accept() checks and claims a candidate in O(1), so concurrent batch
+    jobs can never be handed the same address. A Bloom false positive
+    only costs one extra draw.
+    
+    neighbor_source replaces the kernel dump with a callable returning the
+    set of 48-bit values to avoid (used by --simulate).
+    """
+    
+    # Seeding from history is limited to this window at startup
+    SEED_WINDOW = 86400
+    
+    def __init__(self, capacity: int = 16384, refresh_interval: float = 30.0, neighbor_source=None):
+        self.capacity = capacity
+        self.refresh_interval = refresh_interval
+        self.neighbor_source = neighbor_source
+        self.logger = logging.getLogger(__name__)
+        self.lock = threading.Lock()
+        self.neighbors: set = set()
+        self._loaded_at: Optional[float] = None
+        self._current = BloomFilter(capacity)
+        self._previous: Optional[BloomFilter] = None
+        self.rejected = {'neighbor': 0, 'recent': 0}
+    
+    def load_neighbors(self) -> int:
+        """Reload the neighbor and local link address set; returns its size."""
+        if self.neighbor_source:
+            addresses = set(self.neighbor_source())
+            with self.lock:
+                self.neighbors = addresses
+                self._loaded_at = time.monotonic()
+            return len(addresses)
+        try:
+            netlink = RtnetlinkSocket()
+            try:
+                raw = [n['lladdr'] for n in netlink.dump_neighbors()]
+                raw += [link['attrs'].get(RtnetlinkSocket.IFLA_ADDRESS) for link in netlink.dump_links()]
+            finally:
+                netlink.close()
+            addresses = {int.from_bytes(mac, 'big') for mac in raw if mac and len(mac) == 6}
+        except OSError as e:
+            self.logger.debug(f"Netlink neighbor dump failed, using ip/sysfs: {e}")
+            addresses = self._load_neighbors_fallback()
+        with self.lock:
+            self.neighbors = addresses
+            self._loaded_at = time.monotonic()
+        return len(addresses)
+    
+    def _load_neighbors_fallback(self) -> set:
+        texts = []
+        try:
+            result = run_command(['ip', '-j', 'neigh', 'show'], capture_output=True, text=True, check=True)
+            texts += [entry.get('lladdr') for entry in json.loads(result.stdout or '[]')]
+        except (OSError, ValueError, subprocess.CalledProcessError) as e:
+            self.logger.debug(f"ip neigh failed: {e}")
+        for path in Path('/sys/class/net').glob('*/address'):
+            try:
+                texts.append(path.read_text().strip())
+            except OSError:
+                pass
+        addresses = set()
+        for text in texts:
+            try:
+                addresses.add(MacAddress.parse(text).value)
+            except (ValueError, AttributeError):
+                pass
+        return addresses
+    
+    def seed(self, macs: List[str]) -> int:
+        """Remember already used addresses, oldest first (e.g. new_mac values from history)."""
+        values, _invalid = MacAddress.parse_many(macs, use_numpy=False)
+        values = values[-self.capacity:]
+        with self.lock:
+            self._current.add_many(values)
+        return len(values)
+    
+    def _remember(self, value: int):
+        if self._current.count >= self.capacity:
+            self._previous, self._current = self._current, BloomFilter(self.capacity)
+        self._current.add(value)
+    
+    def _recent(self, value: int) -> bool:
+        return value in self._current or (self._previous is not None and value in self._previous)
+    
+    def check(self, mac: str) -> Optional[str]:
+        """
+        Look a candidate up without claiming it.
+        
+        Returns:
+            'neighbor' or 'recent' if it collides, None if it is free
+        """
+        value = MacAddress.parse(mac).value
+        with self.lock:
+            return self._check(value)
+    
+    def _check(self, value: int) -> Optional[str]:
+        if value in self.neighbors:
+            return 'neighbor'
+        if self._recent(value):
+            return 'recent'
+        return None
+    
+    def accept(self, mac: str) -> bool:
+        """Claim a candidate if it collides with nothing; False means draw another."""
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > self.refresh_interval:
+            self.load_neighbors()
+        value = MacAddress.parse(mac).value
+        with self.lock:
+            reason = self._check(value)
+            if reason is None:
+                self._remember(value)
+                return True
+            self.rejected[reason] += 1
+        METRICS.inc('macspoofx_collisions_total', (reason,))
+        self.logger.debug(f"Rejected candidate {mac}: {reason} collision")
+        return False
+
+
+class InterfaceStateCache:
+    """
+    Per-interface, per-field TTL cache for link state.
+    
+    Field lifetimes:
+    - permanent_mac, driver: immutable for the life of the link (no TTL)
+    - current_mac, status, ip_address: volatile, expire after volatile_ttl
+    
+    When started, an rtnetlink listener subscribed to RTNLGRP_LINK and
+    RTNLGRP_IPV4_IFADDR refreshes or invalidates entries as the kernel
+    reports changes, so reads inside a rotation cycle are memory lookups
+    and never stale. Without the listener the TTLs are the safety net.
+    """
+    
+    RTMGRP_LINK = 0x1
+    RTMGRP_IPV4_IFADDR = 0x10
+    
+    IMMUTABLE_FIELDS = ('permanent_mac', 'driver')
+    VOLATILE_FIELDS = ('current_mac', 'status', 'ip_address')
+    
+    def __init__(self, volatile_ttl: float = 5.0):
+        self.volatile_ttl = volatile_ttl
+        self.logger = logging.getLogger(__name__)
+        self.lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Tuple[float, object]]] = {}
+        self._listener: Optional[RtnetlinkSocket] = None
+        self._thread: Optional[threading.Thread] = None
+        self.hits = 0
+        self.misses = 0
+    
+    @property
+    def enabled(self) -> bool:
+        return self.volatile_ttl > 0
+    
+    def _ttl(self, field: str) -> Optional[float]:
+        return None if field in self.IMMUTABLE_FIELDS else self.volatile_ttl
+    
+    def get(self, interface: str, field: str) -> Tuple[bool, object]:
+        """
+        Look up a cached field.
+        
+        Returns:
+            Tuple of (hit, value)
+        """
+        if not self.enabled:
+            return False, None
+        with self.lock:
+            entry = self._entries.get(interface, {}).get(field)
+            if entry is not None:
+                stored_at, value = entry
+                ttl = self._ttl(field)
+                if ttl is None or time.monotonic() - stored_at < ttl:
+                    self.hits += 1
+                    return True, value
+            self.misses += 1
+        return False, None
+    
+    def set(self, interface: str, field: str, value):
+        """Store a field value."""
+        if not self.enabled:
+            return
+        with self.lock:
+            self._entries.setdefault(interface, {})[field] = (time.monotonic(), value)
+    
+    def update(self, interface: str, fields: Dict):
+        """Store several fields of one interface at once."""
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        with self.lock:
+            entry = self._entries.setdefault(interface, {})
+            for field, value in fields.items():
+                entry[field] = (now, value)
+    
+    def invalidate(self, interface: str = None, fields: Tuple[str, ...] = None):
+        """
+        Drop cached state.
+        
+        Args:
+            interface: Interface to invalidate (all interfaces if None)
+            fields: Fields to drop (every field if None)
+        """
+        with self.lock:
+            targets = [interface] if interface else list(self._entries)
+            for name in targets:
+                if fields is None:
+                    self._entries.pop(name, None)
+                else:
+                    for field in fields:
+                        self._entries.get(name, {}).pop(field, None)
+    
+    def start_listener(self) -> bool:
+        """
+        Subscribe to link and IPv4 address events in a background thread.
+        
+        Returns:
+            True if the listener is running
+        """
+        if self._thread is not None:
+            return True
+        try:
+            self._listener = RtnetlinkSocket(groups=self.RTMGRP_LINK | self.RTMGRP_IPV4_IFADDR)
+        except OSError as e:
+            self.logger.debug(f"Link event listener unavailable: {e}")
+            return False
+        self._thread = threading.Thread(target=self._listen, name='link-events', daemon=True)
+        self._thread.start()
+        return True
+    
+    def stop_listener(self):
+        """Stop the event listener."""
+        if self._listener is not None:
+            try:
+                self._listener.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._listener.close()
+            self._listener = None
+        self._thread = None
+    
+    def _listen(self):
+        listener = self._listener
+        names: Dict[int, str] = {}
+        while True:
+            try:
+                data = listener.sock.recv(1 << 16)
+            except OSError as e:
+                if e.errno == errno.ENOBUFS:
+                    # Events were dropped; nothing cached can be trusted
+                    self.invalidate()
+                    continue
+                return
+            if not data:
+                return
+            for msg_type, _flags, _seq, payload in listener._messages(data):
+                self._handle_event(msg_type, payload, names)
+    
+    def _handle_event(self, msg_type: int, payload: bytes, names: Dict[int, str]):
+        if msg_type in (RtnetlinkSocket.RTM_NEWLINK, RtnetlinkSocket.RTM_DELLINK):
+            link = RtnetlinkSocket.parse_link(payload)
+            raw_name = link['attrs'].get(RtnetlinkSocket.IFLA_IFNAME)
+            name = raw_name.rstrip(b'\0').decode() if raw_name else names.get(link['index'])
+            if not name:
+                return
+            if msg_type == RtnetlinkSocket.RTM_DELLINK:
+                names.pop(link['index'], None)
+                self.invalidate(name)
+                return
+            if names.get(link['index']) not in (None, name):
+                # Renamed link: the old name no longer refers to it
+                self.invalidate(names[link['index']])
+            names[link['index']] = name
+            self.update(name, {
+                'current_mac': RtnetlinkSocket.format_mac(link['attrs'].get(RtnetlinkSocket.IFLA_ADDRESS)),
+                'status': 'UP' if link['flags'] & RtnetlinkSocket.IFF_UP else 'DOWN'
+            })
+        elif msg_type in (RtnetlinkSocket.RTM_NEWADDR, RtnetlinkSocket.RTM_DELADDR):
+            name = names.get(RtnetlinkSocket.parse_address(payload)['index'])
+            self.invalidate(name, ('ip_address',))
+
+
+class NetworkInterfaceManager:
+    """
+    Manages network interface operations including detection, status checks,
+    and configuration using Kali Linux networking tools.
+    
+    Integration:
+    - Uses 'ip' command for interface management
+    - Leverages 'ethtool' for advanced NIC information
+    - get_inventory() snapshots all links from one rtnetlink dump
+    - Interfaces with 'iwconfig' for wireless adapters
+    
+    Reads are served from a shared InterfaceStateCache where possible.
+    """
+    
+    def __init__(self, verbose: bool = False, oui_db: OUIDatabase = None,
+                 cache_ttl: float = 5.0):
+        self.verbose = verbose
+        self.logger = logging.getLogger(__name__)
+        self.oui_db = oui_db
+        self.cache = InterfaceStateCache(cache_ttl)
+    
+    def cached(self, interface: str, field: str, loader):
+        """Return a cached field or load and cache it."""
+        hit, value = self.cache.get(interface, field)
+        if hit:
+            METRICS.inc('macspoofx_cache_requests_total', ('hit',))
+            return value
+        METRICS.inc('macspoofx_cache_requests_total', ('miss',))
+        started = time.perf_counter()
+        value = loader(interface)
+        METRICS.observe('macspoofx_interface_query_seconds', time.perf_counter() - started, (field,))
+        self.cache.set(interface, field, value)
+        return value
+    
+    def get_all_interfaces(self) -> List[str]:
+        """
+        Retrieve all network interfaces on the system.
+        
+        Returns:
+            List of interface names
+        """
+        try:
+            # Filter out loopback
+            return [name for _index, name in socket.if_nameindex() if name != 'lo']
+        except OSError as e:
+            self.logger.error(f"Error getting interfaces: {e}")
+            return []
+    
+    def get_interface_info(self, interface: str) -> Dict[str, str]:
+        """
+        Get detailed information about a network interface.
+        
+        Args:
+            interface: Interface name
+            
+        Returns:
+            Dictionary containing interface details
+        """
+        fields = InterfaceStateCache.VOLATILE_FIELDS + InterfaceStateCache.IMMUTABLE_FIELDS
+        cached = {}
+        for field in fields:
+            hit, value = self.cache.get(interface, field)
+            if not hit:
+                break
+            cached[field] = value
+        else:
+            return {
+                'interface': interface,
+                'current_mac': cached['current_mac'],
+                'vendor': self.get_vendor(cached['current_mac']),
+                'permanent_mac': cached['permanent_mac'],
+                'status': cached['status'],
+                'ip_address': cached['ip_address'],
+                'driver': cached['driver']
+            }
+        
+        info = self._link_info(interface)
+        if info:
+            return info
+        
+        current_mac = self.get_current_mac(interface)
+        info = {
+            'interface': interface,
+            'current_mac': current_mac,
+            'vendor': self.get_vendor(current_mac),
+            'permanent_mac': self.get_permanent_mac(interface),
+            'status': self.get_interface_status(interface),
+            'ip_address': self.get_ip_address(interface),
+            'driver': self.get_driver_info(interface)
+        }
+        return info
+    
+    def get_inventory(self) -> Dict[str, Dict]:
+        """
+        Snapshot every interface from a single dump of links and addresses.
+        
+        Sources, in order of preference:
+        - one rtnetlink RTM_GETLINK + RTM_GETADDR dump (no process spawns)
+        - one 'ip -j addr show' call
+        - a /sys/class/net scan
+        
+        Driver and permanent MAC are read from sysfs / in-process ethtool
+        ioctls, so listing N interfaces costs O(1) process spawns.
+        
+        Returns:
+            Dictionary of interface name to info record (same keys as
+            get_interface_info), ordered by interface index
+        """
+        inventory = None
+        for source in (self._inventory_netlink, self._inventory_ip_json, self._inventory_sysfs):
+            try:
+                inventory = source()
+                break
+            except (OSError, ValueError, KeyError, subprocess.CalledProcessError) as e:
+                self.logger.debug(f"Inventory source {source.__name__} failed: {e}")
+        if inventory is None:
+            self.logger.error("Error getting interface inventory")
+            return {}
+        
+        for name, info in inventory.items():
+            info['vendor'] = self.get_vendor(info['current_mac'])
+            if not info['permanent_mac']:
+                info['permanent_mac'] = IoctlBackend.ethtool_permanent_mac(name)
+            info['driver'] = self._sysfs_driver(name)
+            self.cache.update(name, {
+                field: info[field]
+                for field in InterfaceStateCache.VOLATILE_FIELDS + InterfaceStateCache.IMMUTABLE_FIELDS
+            })
+        return inventory
+    
+    def _link_info(self, interface: str) -> Optional[Dict]:
+        """
+        Fetch one interface with a single RTM_GETLINK (no full dump).
+        
+        Returns:
+            Info record (same keys as get_interface_info) or None when
+            rtnetlink is unavailable or the interface does not exist
+        """
+        try:
+            index = socket.if_nametoindex(interface)
+            netlink = RtnetlinkSocket()
+            try:
+                link = netlink.get_link(index)
+            finally:
+                netlink.close()
+        except OSError as e:
+            self.logger.debug(f"Link lookup for {interface} failed: {e}")
+            return None
+        if not link:
+            return None
+        
+        attrs = link['attrs']
+        permanent_mac = RtnetlinkSocket.format_mac(attrs.get(RtnetlinkSocket.IFLA_PERM_ADDRESS))
+        info = self._record(
+            interface,
+            RtnetlinkSocket.format_mac(attrs.get(RtnetlinkSocket.IFLA_ADDRESS)),
+            permanent_mac if permanent_mac != '00:00:00:00:00:00' else None,
+            bool(link['flags'] & RtnetlinkSocket.IFF_UP),
+            self._ioctl_ipv4(interface)
+        )
+        info['vendor'] = self.get_vendor(info['current_mac'])
+        if not info['permanent_mac']:
+            info['permanent_mac'] = IoctlBackend.ethtool_permanent_mac(interface)
+        info['driver'] = self._sysfs_driver(interface)
+        self.cache.update(interface, {
+            field: info[field]
+            for field in InterfaceStateCache.VOLATILE_FIELDS + InterfaceStateCache.IMMUTABLE_FIELDS
+        })
+        return info
+    
+    @staticmethod
+    def _record(name: str, current_mac: Optional[str], permanent_mac: Optional[str],
+                up: bool, ip_address: Optional[str]) -> Dict:
+        return {
+            'interface': name,
+            'current_mac': current_mac,
+            'vendor': None,
+            'permanent_mac': permanent_mac,
+            'status': 'UP' if up else 'DOWN',
+            'ip_address': ip_address,
+            'driver': None
+        }
+    
+    def _inventory_netlink(self) -> Dict[str, Dict]:
+        netlink = RtnetlinkSocket()
+        try:
+            links = netlink.dump_links()
+            addresses = netlink.dump_addresses(socket.AF_INET)
+        finally:
+            netlink.close()
+        
+        first_ip: Dict[int, str] = {}
+        for addr in addresses:
+            first_ip.setdefault(addr['index'], addr['address'])
+        
+        inventory = {}
+        for link in sorted(links, key=lambda l: l['index']):
+            attrs = link['attrs']
+            name = attrs.get(RtnetlinkSocket.IFLA_IFNAME, b'').rstrip(b'\0').decode()
+            if not name or name == 'lo':
+                continue
+            permanent_mac = RtnetlinkSocket.format_mac(attrs.get(RtnetlinkSocket.IFLA_PERM_ADDRESS))
+            inventory[name] = self._record(
+                name,
+                RtnetlinkSocket.format_mac(attrs.get(RtnetlinkSocket.IFLA_ADDRESS)),
+                permanent_mac if permanent_mac != '00:00:00:00:00:00' else None,
+                bool(link['flags'] & RtnetlinkSocket.IFF_UP),
+                first_ip.get(link['index'])
+            )
+        return inventory
+    
+    def _inventory_ip_json(self) -> Dict[str, Dict]:
+        result = run_command(
+            ['ip', '-j', 'addr', 'show'],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        inventory = {}
+        for link in sorted(json.loads(result.stdout), key=lambda l: l['ifindex']):
+            name = link['ifname']
+            if name == 'lo':
+                continue
+            ipv4 = [a['local'] for a in link.get('addr_info', []) if a.get('family') == 'inet']
+            inventory[name] = self._record(
+                name,
+                link.get('address'),
+                link.get('permaddr'),
+                'UP' in link.get('flags', []),
+                ipv4[0] if ipv4 else None
+            )
+        return inventory
+    
+    def _inventory_sysfs(self) -> Dict[str, Dict]:
+        base = Path('/sys/class/net')
+        entries = []
+        for path in base.iterdir():
+            if path.name == 'lo':
+                continue
+            try:
+                entries.append((int((path / 'ifindex').read_text()), path))
+            except (OSError, ValueError):
+                # Link vanished (or is half-registered) mid-scan
+                continue
+        
+        inventory = {}
+        for _index, path in sorted(entries):
+            try:
+                mac = (path / 'address').read_text().strip() or None
+            except OSError:
+                mac = None
+            try:
+                flags = int((path / 'flags').read_text(), 16)
+            except (OSError, ValueError):
+                continue
+            inventory[path.name] = self._record(
+                path.name, mac, None, bool(flags & RtnetlinkSocket.IFF_UP),
+                self._ioctl_ipv4(path.name)
+            )
+        return inventory
+    
+    @staticmethod
+    def _ioctl_ipv4(interface: str) -> Optional[str]:
+        """Read the primary IPv4 address with SIOCGIFADDR."""
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                result = fcntl.ioctl(sock, 0x8915, struct.pack('16s', interface.encode()).ljust(40, b'\0'))
+            return socket.inet_ntoa(result[20:24])
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _sysfs_driver(interface: str) -> Optional[str]:
+        """Read the driver name from the /sys/class/net device link."""
+        try:
+            return os.path.basename(os.readlink(f'/sys/class/net/{interface}/device/driver'))
+        except OSError:
+            return None
+    
+    def get_vendor(self, mac: Optional[str]) -> Optional[str]:
+        """
+        Resolve the vendor of a MAC address from the OUI database.
+        
+        Args:
+            mac: MAC address
+            
+        Returns:
+            Vendor name or None
+        """
+        if not mac or not self.oui_db:
+            return None
+        return self.oui_db.lookup(mac)
+    
+    def get_current_mac(self, interface: str) -> Optional[str]:
+        """
+        Get current MAC address of interface using 'ip' command.
+        
+        Args:
+            interface: Network interface name
+            
+        Returns:
+            Current MAC address or None
+        """
+        return self.cached(interface, 'current_mac', self._query_current_mac)
+    
+    def _query_current_mac(self, interface: str) -> Optional[str]:
+        try:
+            result = run_command(
+                ['ip', 'link', 'show', interface],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            mac_match = re.search(r'link/ether\s+([0-9a-fA-F:]{17})', result.stdout)
+            if mac_match:
+                return mac_match.group(1).lower()
+        except subprocess.CalledProcessError as e:
+            self.logger.error(f"Error getting MAC for {interface}: {e}")
+        return None
+    
+    def get_permanent_mac(self, interface: str) -> Optional[str]:
+        """
+        Get permanent (hardware) MAC address using ethtool.
+        
+        Args:
+            interface: Network interface name
+            
+        Returns:
+            Permanent MAC address or None
+        """
+        return self.cached(interface, 'permanent_mac', self._query_permanent_mac)
+    
+    def _query_permanent_mac(self, interface: str) -> Optional[str]:
+        try:
+            result = run_command(
+                ['ethtool', '-P', interface],
+                capture_output=True,
+                text=True,
+                check=False
+            )
+            if result.returncode == 0:
+                mac_match = re.search(r'([0-9a-fA-F:]{17})', result.stdout)
+                if mac_match:
+                    return mac_match.group(1).lower()
+        except FileNotFoundError:
+            self.logger.warning("ethtool not found, skipping permanent MAC retrieval")
+        return None
+    
+    def get_interface_status(self, interface: str) -> str:
+        """
+        Check if interface is up or down.
+        
+        Args:
+            interface: Network interface name
+            
+        Returns:
+            'UP' or 'DOWN'
+        """
+        return self.cached(interface, 'status', self._query_status)
+    
+    def _query_status(self, interface: str) -> str:
+        try:
+            result = run_command(
+                ['ip', 'link', 'show', interface],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            if 'state UP' in result.stdout or 'UP' in result.stdout:
+                return 'UP'
+            return 'DOWN'
+        except subprocess.CalledProcessError:
+            return 'UNKNOWN'
+    
+    def get_ip_address(self, interface: str) -> Optional[str]:
+        """
+        Get IP address assigned to interface.
+        
+        Args:
+            interface: Network interface name
+            
+        Returns:
+            IP address or None
+        """
+        return self.cached(interface, 'ip_address', self._query_ip_address)
+    
+    def _query_ip_address(self, interface: str) -> Optional[str]:
+        return self._ioctl_ipv4(interface)
+    
+    def get_driver_info(self, interface: str) -> Optional[str]:
+        """
+        Get network driver information using ethtool.
+        
+        Args:
+            interface: Network interface name
+            
+        Returns:
+            Driver name or None
+        """
+        return self.cached(interface, 'driver', self._query_driver)
+    
+    def _query_driver(self, interface: str) -> Optional[str]:
+        try:
+            result = run_command(
+                ['ethtool', '-i', interface],
+                capture_output=True,
+                text=True,
+                check=False
+            )
+            if result.returncode == 0:
+                driver_match = re.search(r'driver:\s+(\S+)', result.stdout)
+                if driver_match:
+                    return driver_match.group(1)
+        except FileNotFoundError:
+            pass
+        return None
+    
+    def interface_down(self, interface: str) -> bool:
+        """
+        Bring interface down using 'ip link set' command.
+        
+        Args:
+            interface: Network interface name
+            
+        Returns:
+            True if successful
+        """
+        try:
+            self.cache.invalidate(interface, ('status',))
+            run_command(
+                ['ip', 'link', 'set', interface, 'down'],
+                check=True,
+                capture_output=True
+            )
+            if self.verbose:
+                self.logger.info(f"Interface {interface} brought down")
+            return True
+        except subprocess.CalledProcessError as e:
+            self.logger.error(f"Failed to bring down {interface}: {e}")
+            return False
+    
+    def interface_up(self, interface: str) -> bool:
+        """
+        Bring interface up using 'ip link set' command.
+        
+        Args:
+            interface: Network interface name
+            
+        Returns:
+            True if successful
+        """
+        try:
+            self.cache.invalidate(interface, ('status',))
+            run_command(
+                ['ip', 'link', 'set', interface, 'up'],
+                check=True,
+                capture_output=True
+            )
+            if self.verbose:
+                self.logger.info(f"Interface {interface} brought up")
+            return True
+        except subprocess.CalledProcessError as e:
+            self.logger.error(f"Failed to bring up {interface}: {e}")
+            return False
+
+
+class InterfaceDetector:
+    """
+    Ranks candidate interfaces to pick the one that actually carries traffic.
+    
+    Signals, read from one snapshot:
+    - default routes and their metrics (/proc/net/route, /proc/net/ipv6_route)
+    - operational state, admin state and rx+tx byte counters from a single
+      rtnetlink link dump (IFLA_OPERSTATE, IFLA_STATS64), or sysfs without
+      netlink
+    - hardware vs virtual links (IFLA_LINKINFO is only present on virtual ones)
+    
+    Only Ethernet-type links (ARPHRD_ETHER) are candidates, since they are
+    the only ones with a MAC address to change.
+    
+    The choice is cached in memory and in STATE_DIR keyed on the link-set
+    generation: a fingerprint of the network namespace, the interface
+    index/name table and the routing tables. As long as no link is added,
+    removed or renamed and no route changes, repeated invocations and
+    scheduled runs reuse the previous choice without ranking again.
+    """
+    
+    ARPHRD_ETHER = 1
+    IF_OPER_UP = 6
+    IFLA_STATS64 = 23
+    IFLA_LINKINFO = 18
+    RTF_UP = 0x1
+    OPERSTATES = {'up': IF_OPER_UP, 'unknown': 0, 'dormant': 5, 'down': 2, 'lowerlayerdown': 3}
+    
+    def __init__(self, state_path: str = None):
+        self.logger = logging.getLogger(__name__)
+        self.state_path = state_path or os.path.join(STATE_DIR, 'interface.json')
+        self._cached: Optional[Tuple[str, Optional[str]]] = None
+    
+    @staticmethod
+    def _read(path: str) -> bytes:
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return b''
+    
+    def generation(self) -> str:
+        """Fingerprint of the link set and routing tables (cheap: no per-link reads)."""
+        try:
+            namespace = os.stat('/proc/self/ns/net').st_ino
+        except OSError:
+            namespace = 0
+        try:
+            links = repr(socket.if_nameindex()).encode()
+        except OSError:
+            links = b''
+        crc = zlib.crc32(links, namespace & 0xFFFFFFFF)
+        crc = zlib.crc32(self._read('/proc/net/route'), crc)
+        crc = zlib.crc32(self._read('/proc/net/ipv6_route'), crc)
+        return f'{namespace:x}-{crc:08x}'
+    
+    def default_routes(self) -> Dict[str, int]:
+        """Map interface name to its lowest default route metric (IPv4 and IPv6)."""
+        routes: Dict[str, int] = {}
+        for line in self._read('/proc/net/route').decode().splitlines()[1:]:
+            fields = line.split()
+            if (len(fields) >= 8 and fields[1] == '00000000' and fields[7] == '00000000'
+                    and int(fields[3], 16) & self.RTF_UP):
+                metric = int(fields[6])
+                routes[fields[0]] = min(metric, routes.get(fields[0], metric))
+        for line in self._read('/proc/net/ipv6_route').decode().splitlines():
+            fields = line.split()
+            if (len(fields) == 10 and fields[0] == '0' * 32 and fields[1] == '00'
+                    and int(fields[8], 16) & self.RTF_UP and fields[9] != 'lo'):
+                metric = int(fields[5], 16)
+                routes[fields[9]] = min(metric, routes.get(fields[9], metric))
+        return routes
+    
+    def snapshot(self) -> List[Dict]:
+        """Read every link's ranking signals, from one netlink dump or sysfs."""
+        try:
+            netlink = RtnetlinkSocket()
+            try:
+                links = netlink.dump_links()
+            finally:
+                netlink.close()
+        except OSError as e:
+            self.logger.debug(f"Netlink link dump failed, reading sysfs: {e}")
+            return self._snapshot_sysfs()
+        
+        candidates = []
+        for link in links:
+            attrs = link['attrs']
+            name = attrs.get(RtnetlinkSocket.IFLA_IFNAME, b'').rstrip(b'\0').decode()
+            if not name or link['type'] != self.ARPHRD_ETHER:
+                continue
+            operstate = attrs.get(RtnetlinkSocket.IFLA_OPERSTATE, b'\0')[0]
+            stats = attrs.get(self.IFLA_STATS64, b'')
+            traffic = sum(struct.unpack_from('=QQ', stats, 16)) if len(stats) >= 32 else 0
+            candidates.append({
+                'interface': name,
+                'index': link['index'],
+                'admin_up': bool(link['flags'] & RtnetlinkSocket.IFF_UP),
+                'oper_up': operstate == self.IF_OPER_UP,
+                'physical': self.IFLA_LINKINFO not in attrs,
+                'bytes': traffic
+            })
+        return candidates
+    
+    def _snapshot_sysfs(self) -> List[Dict]:
+        candidates = []
+        for path in Path('/sys/class/net').iterdir():
+            try:
+                if int((path / 'type').read_text()) != self.ARPHRD_ETHER:
+                    continue
+                flags = int((path / 'flags').read_text(), 16)
+                operstate = (path / 'operstate').read_text().strip()
+                traffic = (int((path / 'statistics' / 'rx_bytes').read_text())
+                           + int((path / 'statistics' / 'tx_bytes').read_text()))
+                index = int((path / 'ifindex').read_text())
+            except (OSError, ValueError):
+                continue
+            candidates.append({
+                'interface': path.name,
+                'index': index,
+                'admin_up': bool(flags & RtnetlinkSocket.IFF_UP),
+                'oper_up': self.OPERSTATES.get(operstate) == self.IF_OPER_UP,
+                'physical': (path / 'device').exists(),
+                'bytes': traffic
+            })
+        return candidates
+    
+    def rank(self) -> List[Dict]:
+        """
+        Rank candidates, best first.
+        
+        Order: has a default route (lowest metric first), operationally up,
+        hardware link, administratively up, most traffic, lowest index.
+        """
+        routes = self.default_routes()
+        candidates = self.snapshot()
+        for candidate in candidates:
+            candidate['route_metric'] = routes.get(candidate['interface'])
+        
+        def key(c):
+            metric = c['route_metric']
+            return (metric is None, metric or 0, not c['oper_up'], not c['physical'],
+                    not c['admin_up'], -c['bytes'], c['index'])
+        
+        return sorted(candidates, key=key)
+    
+    def _load(self, generation: str) -> Optional[str]:
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get('generation') != generation:
+            return None
+        return state.get('interface')
+    
+    def _save(self, generation: str, interface: str):
+        try:
+            os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+            tmp_path = f"{self.state_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'generation': generation, 'interface': interface}, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            self.logger.debug(f"Could not persist interface choice: {e}")
+    
+    def detect(self) -> Tuple[Optional[str], Optional[Dict]]:
+        """
+        Pick the best interface, reusing the cached choice when the link-set
+        generation is unchanged.
+        
+        Returns:
+            Tuple of (interface or None, ranking record or None when the
+            choice came from the cache)
+        """
+        generation = self.generation()
+        if self._cached and self._cached[0] == generation:
+            return self._cached[1], None
+        
+        interface = self._load(generation)
+        if interface:
+            self._cached = (generation, interface)
+            return interface, None
+        
+        ranked = self.rank()
+        if not ranked:
+            return None, None
+        best = ranked[0]
+        self._cached = (generation, best['interface'])
+        self._save(generation, best['interface'])
+        return best['interface'], best
+
+
+class RtnetlinkSocket:
+    """
+    Minimal rtnetlink (NETLINK_ROUTE) client used for in-process link control.
+    
+    rtnetlink Integration:
+    - The kernel exposes link configuration through RTM_*LINK messages
+    - An RTM_NEWLINK carrying IFLA_ADDRESS sets the hardware address
+    - Changing IFF_UP in ifinfomsg.ifi_change brings a link up or down
+    - Several requests can be sent in one datagram and are acknowledged in order
+    
+    This replaces the 'ip link' / macchanger process chain with plain syscalls.
+    """
+    
+    NLMSG_ERROR = 2
+    NLMSG_DONE = 3
+    
+    RTM_NEWLINK = 16
+    RTM_DELLINK = 17
+    RTM_GETLINK = 18
+    RTM_NEWADDR = 20
+    RTM_DELADDR = 21
+    RTM_GETADDR = 22
+    RTM_NEWNEIGH = 28
+    RTM_GETNEIGH = 30
+    
+    NLM_F_REQUEST = 0x1
+    NLM_F_ACK = 0x4
+    NLM_F_DUMP = 0x300
+    
+    IFLA_ADDRESS = 1
+    IFLA_IFNAME = 3
+    IFLA_OPERSTATE = 16
+    IFLA_PERM_ADDRESS = 54
+    
+    IFA_ADDRESS = 1
+    IFA_LOCAL = 2
+    
+    NDA_LLADDR = 2
+    
+    IFF_UP = 0x1
+    
+    REPLY_TIMEOUT = 5.0
+    
+    NLMSG_HEADER = struct.Struct('=IHHII')
+    IFINFOMSG = struct.Struct('=BxHiII')
+    IFADDRMSG = struct.Struct('=BBBBI')
+    NDMSG = struct.Struct('=BxxxiHBB')
+    RTATTR = struct.Struct('=HH')
+    
+    def __init__(self, groups: int = 0):
+        self.sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        self.sock.bind((0, groups))
+        if not groups:
+            # Request sockets must not hang forever on a lost reply; event
+            # listeners (groups set) block until something happens
+            self.sock.settimeout(self.REPLY_TIMEOUT)
+        self.seq = int(time.time()) & 0x7FFFFFFF
+        self.lock = threading.Lock()
+    
+    def close(self):
+        """Close the underlying netlink socket."""
+        self.sock.close()
+    
+    @classmethod
+    def pack_attr(cls, attr_type: int, data: bytes) -> bytes:
+        """Pack a single rtattr, padded to the 4-byte netlink alignment."""
+        length = cls.RTATTR.size + len(data)
+        return cls.RTATTR.pack(length, attr_type) + data + b'\0' * (-length % 4)
+    
+    @classmethod
+    def parse_attrs(cls, data: bytes, offset: int = 0) -> Dict[int, bytes]:
+        """Parse a run of rtattrs into a {type: payload} dictionary."""
+        attrs = {}
+        while offset + cls.RTATTR.size <= len(data):
+            length, attr_type = cls.RTATTR.unpack_from(data, offset)
+            if length < cls.RTATTR.size:
+                break
+            attrs[attr_type & 0x3FFF] = data[offset + cls.RTATTR.size:offset + length]
+            offset += (length + 3) & ~3
+        return attrs
+    
+    def _next_seq(self) -> int:
+        self.seq = (self.seq + 1) & 0x7FFFFFFF
+        return self.seq
+    
+    def build_link_message(self, index: int, flags: int = 0, change: int = 0,
+                           attrs: bytes = b'', msg_type: int = RTM_NEWLINK,
+                           nl_flags: int = NLM_F_REQUEST | NLM_F_ACK) -> Tuple[int, bytes]:
+        """
+        Build an ifinfomsg-based request.
+        
+        Returns:
+            Tuple of (sequence_number, encoded_message)
+        """
+        seq = self._next_seq()
+        body = self.IFINFOMSG.pack(socket.AF_UNSPEC, 0, index, flags, change) + attrs
+        header = self.NLMSG_HEADER.pack(self.NLMSG_HEADER.size + len(body), msg_type, nl_flags, seq, 0)
+        return seq, header + body
+    
+    def _messages(self, data: bytes):
+        """Yield (type, flags, seq, payload) for every message in a datagram."""
+        offset = 0
+        while offset + self.NLMSG_HEADER.size <= len(data):
+            length, msg_type, flags, seq, _pid = self.NLMSG_HEADER.unpack_from(data, offset)
+            if length < self.NLMSG_HEADER.size:
+                break
+            yield msg_type, flags, seq, data[offset + self.NLMSG_HEADER.size:offset + length]
+            offset += (length + 3) & ~3
+    
+    def transact(self, messages: List[Tuple[int, bytes]]) -> List[int]:
+        """
+        Send several acknowledged requests in one datagram.
+        
+        Args:
+            messages: (seq, message) pairs from build_link_message()
+            
+        Returns:
+            List of errno values in request order (0 means success)
+        """
+        pending = {seq: i for i, (seq, _msg) in enumerate(messages)}
+        results = [0] * len(messages)
+        with self.lock:
+            self.sock.send(b''.join(msg for _seq, msg in messages))
+            while pending:
+                data = self.sock.recv(65536)
+                for msg_type, _flags, seq, payload in self._messages(data):
+                    if msg_type == self.NLMSG_ERROR and seq in pending:
+                        results[pending.pop(seq)] = -struct.unpack_from('=i', payload)[0]
+        return results
+    
+    def request(self, message: Tuple[int, bytes]):
+        """Send one acknowledged request, raising OSError on failure."""
+        error = self.transact([message])[0]
+        if error:
+            raise OSError(error, os.strerror(error))
+    
+    def get_link(self, index: int) -> Optional[Dict]:
+        """
+        Fetch a single link by index.
+        
+        Returns:
+            Dictionary with 'index', 'flags' and 'attrs' or None
+        """
+        message = self.build_link_message(index, msg_type=self.RTM_GETLINK, nl_flags=self.NLM_F_REQUEST)
+        with self.lock:
+            self.sock.send(message[1])
+            while True:
+                data = self.sock.recv(65536)
+                for msg_type, _flags, seq, payload in self._messages(data):
+                    if seq != message[0]:
+                        continue
+                    if msg_type == self.NLMSG_ERROR:
+                        error = -struct.unpack_from('=i', payload)[0]
+                        if error:
+                            raise OSError(error, os.strerror(error))
+                        return None
+                    if msg_type == self.RTM_NEWLINK:
+                        return self.parse_link(payload)
+    
+    def dump(self, msg_type: int, body: bytes) -> List[Tuple[int, bytes]]:
+        """
+        Run an NLM_F_DUMP request and collect every reply.
+        
+        Args:
+            msg_type: Request type, e.g. RTM_GETLINK or RTM_GETADDR
+            body: Family specific request header (ifinfomsg, ifaddrmsg, ...)
+            
+        Returns:
+            List of (message_type, payload) tuples
+        """
+        seq = self._next_seq()
+        header = self.NLMSG_HEADER.pack(self.NLMSG_HEADER.size + len(body), msg_type,
+                                        self.NLM_F_REQUEST | self.NLM_F_DUMP, seq, 0)
+        replies = []
+        with self.lock:
+            self.sock.send(header + body)
+            while True:
+                data = self.sock.recv(1 << 16)
+                for reply_type, _flags, reply_seq, payload in self._messages(data):
+                    if reply_seq != seq:
+                        continue
+                    if reply_type == self.NLMSG_DONE:
+                        return replies
+                    if reply_type == self.NLMSG_ERROR:
+                        error = -struct.unpack_from('=i', payload)[0]
+                        raise OSError(error, os.strerror(error))
+                    replies.append((reply_type, payload))
+    
+    def dump_links(self) -> List[Dict]:
+        """Dump every link in the namespace."""
+        body = self.IFINFOMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0)
+        return [self.parse_link(payload) for msg_type, payload in self.dump(self.RTM_GETLINK, body)
+                if msg_type == self.RTM_NEWLINK]
+    
+    def dump_addresses(self, family: int = socket.AF_INET) -> List[Dict]:
+        """Dump every address of the given family."""
+        body = self.IFADDRMSG.pack(family, 0, 0, 0, 0)
+        return [self.parse_address(payload) for msg_type, payload in self.dump(self.RTM_GETADDR, body)
+                if msg_type == self.RTM_NEWADDR]
+    
+    def dump_neighbors(self, family: int = socket.AF_UNSPEC) -> List[Dict]:
+        """Dump the neighbor (ARP/NDP) table."""
+        body = self.NDMSG.pack(family, 0, 0, 0, 0)
+        neighbors = []
+        for msg_type, payload in self.dump(self.RTM_GETNEIGH, body):
+            if msg_type != self.RTM_NEWNEIGH:
+                continue
+            _family, index, state, _flags, _type = self.NDMSG.unpack_from(payload)
+            attrs = self.parse_attrs(payload, self.NDMSG.size)
+            neighbors.append({'index': index, 'state': state, 'lladdr': attrs.get(self.NDA_LLADDR)})
+        return neighbors
+    
+    @classmethod
+    def parse_address(cls, payload: bytes) -> Dict:
+        """Decode an RTM_NEWADDR payload."""
+        family, prefixlen, _flags, _scope, index = cls.IFADDRMSG.unpack_from(payload)
+        attrs = cls.parse_attrs(payload, cls.IFADDRMSG.size)
+        raw = attrs.get(cls.IFA_LOCAL) or attrs.get(cls.IFA_ADDRESS)
+        return {
+            'index': index,
+            'family': family,
+            'prefixlen': prefixlen,
+            'address': socket.inet_ntop(family, raw) if raw else None
+        }
+    
+    @classmethod
+    def parse_link(cls, payload: bytes) -> Dict:
+        """Decode an RTM_NEWLINK payload."""
+        _family, link_type, index, flags, _change = cls.IFINFOMSG.unpack_from(payload)
+        return {
+            'index': index,
+            'type': link_type,
+            'flags': flags,
+            'attrs': cls.parse_attrs(payload, cls.IFINFOMSG.size)
+        }
+    
+    @staticmethod
+    def format_mac(raw: Optional[bytes]) -> Optional[str]:
+        """Format a raw 6-byte hardware address as a colon separated string."""
+        if not raw or len(raw) != 6:
+            return None
+        return ':'.join(f'{b:02x}' for b in raw)
+
+
+class MACBackend:
+    """
+    Base class for MAC change backends.
+    
+    A backend knows how to read the current and permanent address of a link,
+    toggle its administrative state and write a new hardware address.
+    MACChanger drives the down/set/up/read-back sequence through it.
+    """
+    
+    name = 'base'
+    
+    # Backends that can generate addresses themselves (macchanger -r/-a/-p)
+    native_modes = False
+    
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
+        self.logger = logging.getLogger(__name__)
+        self.allow_live = True
+        self._live_supported: Dict[str, bool] = {}
+    
+    def is_available(self) -> bool:
+        """Return True if the backend can be used on this system."""
+        raise NotImplementedError
+    
+    def get_mac(self, interface: str) -> Optional[str]:
+        """Return the current MAC address of the interface."""
+        raise NotImplementedError
+    
+    def get_permanent_mac(self, interface: str) -> Optional[str]:
+        """Return the permanent (burned-in) MAC address of the interface."""
+        raise NotImplementedError
+    
+    def set_link_state(self, interface: str, up: bool) -> bool:
+        """Bring the interface up or down."""
+        raise NotImplementedError
+    
+    def set_mac(self, interface: str, mac: str) -> bool:
+        """Write a new hardware address to the interface."""
+        raise NotImplementedError
+    
+    def set_mac_live(self, interface: str, mac: str) -> Optional[bool]:
+        """
+        Try to change the address while the link stays up.
+        
+        Returns:
+            True on success, False if the driver refuses live changes
+            (EBUSY, no IFF_LIVE_ADDR_CHANGE), None if not attempted or
+            the failure says nothing about live change support
+        """
+        return None
+    
+    @staticmethod
+    def _outcome() -> Dict:
+        return {'success': False, 'live': False, 'downtime_ms': 0.0, 'rolled_back': False}
+    
+    def _try_live(self, interface: str, mac: str) -> bool:
+        """Attempt a live change unless the interface is known to refuse it."""
+        if not self.allow_live or self._live_supported.get(interface) is False:
+            return False
+        started = time.perf_counter()
+        live = self.set_mac_live(interface, mac)
+        if live:
+            METRICS.observe('macspoofx_phase_seconds', time.perf_counter() - started, ('set', self.name))
+        if live is not None:
+            self._live_supported[interface] = live
+        return bool(live)
+    
+    def _cycle(self, interface: str, setter, old_mac: Optional[str]) -> Dict:
+        """
+        Run down/set/up, rolling back to old_mac if the link cannot come back.
+        
+        Args:
+            interface: Network interface name
+            setter: Callable performing the address write, returning bool
+            old_mac: Address to restore on failure
+            
+        Returns:
+            Outcome dictionary with success, live, downtime_ms, rolled_back
+        """
+        outcome = self._outcome()
+        start = time.perf_counter()
+        if not self.set_link_state(interface, False):
+            return outcome
+        down_done = time.perf_counter()
+        changed = setter()
+        set_done = time.perf_counter()
+        up = self.set_link_state(interface, True)
+        up_done = time.perf_counter()
+        METRICS.observe('macspoofx_phase_seconds', down_done - start, ('down', self.name))
+        METRICS.observe('macspoofx_phase_seconds', set_done - down_done, ('set', self.name))
+        METRICS.observe('macspoofx_phase_seconds', up_done - set_done, ('up', self.name))
+        if changed and not up and old_mac:
+            self.logger.error(f"{interface} did not come back up; rolling back to {old_mac}")
+            self.set_link_state(interface, False)
+            self.set_mac(interface, old_mac)
+            outcome['rolled_back'] = True
+            up = self.set_link_state(interface, True)
+            changed = False
+        outcome['downtime_ms'] = round((time.perf_counter() - start) * 1000, 3)
+        outcome['success'] = changed and up
+        return outcome
+    
+    def apply_mac(self, interface: str, mac: str, old_mac: Optional[str] = None) -> Dict:
+        """
+        Change the address with the shortest possible down window.
+        
+        A live change is tried first; drivers that refuse it get the
+        down/set/up cycle, with the old address restored on failure.
+        
+        Args:
+            interface: Network interface name
+            mac: New MAC address
+            old_mac: Current MAC address, restored on failure
+            
+        Returns:
+            Outcome dictionary with success, live, downtime_ms, rolled_back
+        """
+        if self._try_live(interface, mac):
+            outcome = self._outcome()
+            outcome.update(success=True, live=True)
+            return outcome
+        return self._cycle(interface, lambda: self.set_mac(interface, mac), old_mac)
+
+
+class MacchangerBackend(MACBackend):
+    """
+    Original subprocess backend built on macchanger and iproute2.
+    
+    Every step forks a process ('ip link set', 'macchanger', 'ip link show'),
+    which is slow but only depends on the standard Kali tool set.
+    """
+    
+    name = 'macchanger'
+    native_modes = True
+    
+    def __init__(self, verbose: bool = False, interface_manager: 'NetworkInterfaceManager' = None):
+        super().__init__(verbose)
+        self.interface_manager = interface_manager or NetworkInterfaceManager(verbose)
+        self._available: Optional[bool] = None
+    
+    def is_available(self) -> bool:
+        """Check for macchanger once and cache the answer."""
+        if self._available is None:
+            try:
+                run_command(
+                    ['macchanger', '--version'],
+                    capture_output=True,
+                    check=True
+                )
+                self._available = True
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                self.logger.error("macchanger is not installed. Install with: apt install macchanger")
+                self._available = False
+        return self._available
+    
+    def get_mac(self, interface: str) -> Optional[str]:
+        return self.interface_manager.get_current_mac(interface)
+    
+    def get_permanent_mac(self, interface: str) -> Optional[str]:
+        return self.interface_manager.get_permanent_mac(interface)
+    
+    def set_link_state(self, interface: str, up: bool) -> bool:
+        if up:
+            return self.interface_manager.interface_up(interface)
+        return self.interface_manager.interface_down(interface)
+    
+    def set_mac(self, interface: str, mac: str) -> bool:
+        return self.run_macchanger(interface, ['-m', mac])
+    
+    def apply_flags(self, interface: str, flags: List[str], old_mac: Optional[str] = None) -> Dict:
+        """Run macchanger with flags inside the down/set/up cycle."""
+        return self._cycle(interface, lambda: self.run_macchanger(interface, flags), old_mac)
+    
+    def run_macchanger(self, interface: str, flags: List[str]) -> bool:
+        """
+        Run macchanger with the given flags against the interface.
+        
+        Args:
+            interface: Network interface name
+            flags: macchanger flags, e.g. ['-r'] or ['-m', '00:11:22:33:44:55']
+            
+        Returns:
+            True if successful
+        """
+        try:
+            run_command(
+                ['macchanger'] + flags + [interface],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            return True
+        except subprocess.CalledProcessError as e:
+            self.logger.error(f"macchanger failed: {e}")
+            return False
+
+
+class NetlinkBackend(MACBackend):
+    """
+    In-process backend that talks rtnetlink directly.
+    
+    The down/set-address/up/read-back sequence is a handful of sendmsg/recvmsg
+    calls on one NETLINK_ROUTE socket, with no process spawns at all.
+    """
+    
+    name = 'netlink'
+    
+    def __init__(self, verbose: bool = False):
+        super().__init__(verbose)
+        self._netlink: Optional[RtnetlinkSocket] = None
+        self._available: Optional[bool] = None
+    
+    @property
+    def netlink(self) -> RtnetlinkSocket:
+        if self._netlink is None:
+            self._netlink = RtnetlinkSocket()
+        return self._netlink
+    
+    def is_available(self) -> bool:
+        if self._available is None:
+            try:
+                self.netlink
+                self._available = True
+            except (OSError, AttributeError) as e:
+                self.logger.debug(f"rtnetlink unavailable: {e}")
+                self._available = False
+        return self._available
+    
+    def _link(self, interface: str) -> Optional[Dict]:
+        try:
+            return self.netlink.get_link(socket.if_nametoindex(interface))
+        except OSError as e:
+            self.logger.error(f"Error reading link {interface}: {e}")
+            return None
+    
+    def get_mac(self, interface: str) -> Optional[str]:
+        link = self._link(interface)
+        if link:
+            return RtnetlinkSocket.format_mac(link['attrs'].get(RtnetlinkSocket.IFLA_ADDRESS))
+        return None
+    
+    def get_permanent_mac(self, interface: str) -> Optional[str]:
+        link = self._link(interface)
+        if link:
+            mac = RtnetlinkSocket.format_mac(link['attrs'].get(RtnetlinkSocket.IFLA_PERM_ADDRESS))
+            if mac and mac != '00:00:00:00:00:00':
+                return mac
+        # Kernels older than 5.6 do not report IFLA_PERM_ADDRESS
+        return IoctlBackend.ethtool_permanent_mac(interface)
+    
+    def set_link_state(self, interface: str, up: bool) -> bool:
+        try:
+            self.netlink.request(self.netlink.build_link_message(
+                socket.if_nametoindex(interface),
+                flags=RtnetlinkSocket.IFF_UP if up else 0,
+                change=RtnetlinkSocket.IFF_UP
+            ))
+            if self.verbose:
+                self.logger.info(f"Interface {interface} brought {'up' if up else 'down'}")
+            return True
+        except OSError as e:
+            self.logger.error(f"Failed to bring {'up' if up else 'down'} {interface}: {e}")
+            return False
+    
+    def _address_message(self, index: int, mac: str) -> Tuple[int, bytes]:
+        return self.netlink.build_link_message(
+            index,
+            attrs=RtnetlinkSocket.pack_attr(RtnetlinkSocket.IFLA_ADDRESS, bytes.fromhex(mac.replace(':', '')))
+        )
+    
+    def _state_message(self, index: int, up: bool) -> Tuple[int, bytes]:
+        return self.netlink.build_link_message(
+            index, flags=RtnetlinkSocket.IFF_UP if up else 0, change=RtnetlinkSocket.IFF_UP
+        )
+    
+    def set_mac(self, interface: str, mac: str) -> bool:
+        try:
+            self.netlink.request(self._address_message(socket.if_nametoindex(interface), mac))
+            return True
+        except OSError as e:
+            self.logger.error(f"Failed to set MAC on {interface}: {e}")
+            return False
+    
+    def set_mac_live(self, interface: str, mac: str) -> Optional[bool]:
+        try:
+            index = socket.if_nametoindex(interface)
+            link = self.netlink.get_link(index)
+            if not link or not link['flags'] & RtnetlinkSocket.IFF_UP:
+                return None
+            error = self.netlink.transact([self._address_message(index, mac)])[0]
+        except OSError:
+            return None
+        if error and error != errno.EBUSY:
+            self.logger.debug(f"Live MAC change on {interface} failed: {os.strerror(error)}")
+            return None
+        return error == 0
+    
+    def apply_mac(self, interface: str, mac: str, old_mac: Optional[str] = None) -> Dict:
+        """
+        Change the address live, or with a netlink down/set/up cycle.
+        
+        The down request is acknowledged on its own so a refusal aborts the
+        change before the address is touched; set and up then travel in a
+        single datagram, keeping the down window to two round trips. Once
+        the link is down, any failure (including a lost reply) ends with a
+        best-effort attempt to bring it back up, on the old address when
+        the new one may have been written and old_mac is known.
+        """
+        outcome = self._outcome()
+        if self._try_live(interface, mac):
+            outcome.update(success=True, live=True)
+            return outcome
+        
+        index = None
+        down_done = False
+        set_error = None
+        try:
+            index = socket.if_nametoindex(interface)
+            start = time.perf_counter()
+            down_error = self.netlink.transact([self._state_message(index, False)])[0]
+            if down_error:
+                self.logger.error(f"Failed to bring down {interface}: {os.strerror(down_error)}")
+                return outcome
+            down_done = True
+            set_error, up_error = self.netlink.transact([
+                self._address_message(index, mac),
+                self._state_message(index, True)
+            ])
+            elapsed = time.perf_counter() - start
+            outcome['downtime_ms'] = round(elapsed * 1000, 3)
+            METRICS.observe('macspoofx_phase_seconds', elapsed, ('transaction', self.name))
+            
+            for error, step in ((set_error, 'set MAC on'), (up_error, 'bring up')):
+                if error:
+                    self.logger.error(f"Failed to {step} {interface}: {os.strerror(error)}")
+            outcome['success'] = not (set_error or up_error)
+        except OSError as e:
+            self.logger.error(f"Failed to change MAC on {interface}: {e}")
+        
+        if down_done and not outcome['success']:
+            # set_error is None when the reply was lost: the new address may be in place
+            restore = old_mac if not set_error else None
+            recovered = self._recover_link(interface, index, restore)
+            outcome['rolled_back'] = recovered and bool(set_error or restore)
+        return outcome
+    
+    def _recover_link(self, interface: str, index: int, restore_mac: Optional[str]) -> bool:
+        """
+        Bring a link left down by a failed cycle back up, best effort.
+        
+        Args:
+            interface: Network interface name (for logging)
+            index: Interface index
+            restore_mac: Address to write back first, if any
+            
+        Returns:
+            True if the link is up again (on restore_mac when given)
+        """
+        messages = [self._state_message(index, True)]
+        if restore_mac:
+            self.logger.error(f"Rolling back {interface} to {restore_mac}")
+            messages[:0] = [self._state_message(index, False), self._address_message(index, restore_mac)]
+        try:
+            errors = self.netlink.transact(messages)
+        except OSError as e:
+            self.logger.error(f"Could not bring {interface} back up: {e}")
+            return False
+        failed = [error for error in errors if error]
+        if failed:
+            self.logger.error(f"Could not bring {interface} back up: {os.strerror(failed[0])}")
+            return False
+        return True
+
+
+class IoctlBackend(MACBackend):
+    """
+    In-process fallback backend using the classic SIOC* interface ioctls.
+    
+    Used where rtnetlink is unavailable (restricted seccomp profiles, very
+    old kernels). SIOCSIFHWADDR requires the link to be down on most drivers.
+    """
+    
+    name = 'ioctl'
+    
+    SIOCGIFFLAGS = 0x8913
+    SIOCSIFFLAGS = 0x8914
+    SIOCGIFHWADDR = 0x8927
+    SIOCSIFHWADDR = 0x8924
+    SIOCETHTOOL = 0x8946
+    
+    ETHTOOL_GPERMADDR = 0x20
+    ARPHRD_ETHER = 1
+    IFF_UP = 0x1
+    
+    def __init__(self, verbose: bool = False):
+        super().__init__(verbose)
+        self._sock: Optional[socket.socket] = None
+    
+    @property
+    def sock(self) -> socket.socket:
+        if self._sock is None:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        return self._sock
+    
+    @staticmethod
+    def _ifreq(interface: str, payload: bytes = b'') -> bytes:
+        return struct.pack('16s', interface.encode()) + payload.ljust(24, b'\0')
+    
+    def is_available(self) -> bool:
+        try:
+            self.sock
+            return True
+        except OSError:
+            return False
+    
+    def get_mac(self, interface: str) -> Optional[str]:
+        try:
+            result = fcntl.ioctl(self.sock, self.SIOCGIFHWADDR, self._ifreq(interface))
+            return RtnetlinkSocket.format_mac(result[18:24])
+        except OSError as e:
+            self.logger.error(f"Error getting MAC for {interface}: {e}")
+            return None
+    
+    def get_permanent_mac(self, interface: str) -> Optional[str]:
+        return self.ethtool_permanent_mac(interface)
+    
+    @classmethod
+    def ethtool_permanent_mac(cls, interface: str) -> Optional[str]:
+        """Read the permanent address with the ETHTOOL_GPERMADDR ioctl."""
+        buf = ctypes.create_string_buffer(struct.pack('II', cls.ETHTOOL_GPERMADDR, 32) + b'\0' * 32)
+        request = struct.pack('16sP', interface.encode(), ctypes.addressof(buf)).ljust(40, b'\0')
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                fcntl.ioctl(sock, cls.SIOCETHTOOL, request)
+        except OSError:
+            return None
+        size = struct.unpack_from('I', buf.raw, 4)[0]
+        mac = RtnetlinkSocket.format_mac(buf.raw[8:8 + size])
+        if mac and mac != '00:00:00:00:00:00':
+            return mac
+        return None
+    
+    def set_link_state(self, interface: str, up: bool) -> bool:
+        try:
+            result = fcntl.ioctl(self.sock, self.SIOCGIFFLAGS, self._ifreq(interface))
+            flags = struct.unpack_from('H', result, 16)[0]
+            flags = flags | self.IFF_UP if up else flags & ~self.IFF_UP
+            fcntl.ioctl(self.sock, self.SIOCSIFFLAGS, self._ifreq(interface, struct.pack('H', flags)))
+            if self.verbose:
+                self.logger.info(f"Interface {interface} brought {'up' if up else 'down'}")
+            return True
+        except OSError as e:
+            self.logger.error(f"Failed to bring {'up' if up else 'down'} {interface}: {e}")
+            return False
+    
+    def set_mac_live(self, interface: str, mac: str) -> Optional[bool]:
+        address = struct.pack('H6s', self.ARPHRD_ETHER, bytes.fromhex(mac.replace(':', '')))
+        try:
+            result = fcntl.ioctl(self.sock, self.SIOCGIFFLAGS, self._ifreq(interface))
+            if not struct.unpack_from('H', result, 16)[0] & self.IFF_UP:
+                return None
+            fcntl.ioctl(self.sock, self.SIOCSIFHWADDR, self._ifreq(interface, address))
+            return True
+        except OSError as e:
+            if e.errno != errno.EBUSY:
+                self.logger.debug(f"Live MAC change on {interface} failed: {e}")
+                return None
+            return False
+    
+    def set_mac(self, interface: str, mac: str) -> bool:
+        address = struct.pack('H6s', self.ARPHRD_ETHER, bytes.fromhex(mac.replace(':', '')))
+        try:
+            fcntl.ioctl(self.sock, self.SIOCSIFHWADDR, self._ifreq(interface, address))
+            return True
+        except OSError as e:
+            self.logger.error(f"Failed to set MAC on {interface}: {e}")
+            return False
+
+
+class SimulatedKernel:
+    """
+    In-memory link table standing in for the kernel, for scale testing.
+    
+    Model:
+    - count Ethernet links named <prefix>0..N-1, with permanent addresses
+      under 00:16:3e and a 10.x.y.z IPv4 address each
+    - per-operation latency in milliseconds (dump, get, down, set, up),
+      optionally jittered by +/- jitter (a fraction), spent in time.sleep
+      so concurrency and scheduling behave as against real links
+    - per-operation failure rates
+    - driver quirks assigned to a fraction of the links:
+      no_live (refuses address changes while up, like drivers without
+      IFF_LIVE_ADDR_CHANGE), refuse_down (cannot be brought down) and
+      sticky_mac (accepts a new address but keeps the old one)
+    
+    Every link draws from its own random.Random seeded from (seed, name),
+    so quirks, latencies and failures are the same on every run with the
+    same seed, whatever order threads reach the links in.
+    
+    Config files are JSON with the keys 'latency_ms', 'failure_rate',
+    'quirks' (quirk -> fraction of links), 'jitter', 'prefix' and 'seed'.
+    """
+    
+    OPERATIONS = ('dump', 'get', 'down', 'set', 'up')
+    QUIRKS = ('no_live', 'refuse_down', 'sticky_mac')
+    DEFAULT_LATENCY_MS = {'dump': 0.0, 'get': 0.0, 'down': 0.02, 'set': 0.02, 'up': 0.05}
+    BASE_MAC = 0x00163E000000
+    
+    def __init__(self, count: int = 16, prefix: str = 'sim', latency_ms: Dict[str, float] = None,
+                 failure_rate: Dict[str, float] = None, quirks: Dict[str, float] = None,
+                 jitter: float = 0.0, seed: int = 0):
+        unknown = set(latency_ms or {}) | set(failure_rate or {})
+        unknown -= set(self.OPERATIONS)
+        unknown |= set(quirks or {}) - set(self.QUIRKS)
+        if unknown:
+            raise ValueError(f"Unknown simulation keys: {', '.join(sorted(unknown))}")
+        self.latency_ms = dict(self.DEFAULT_LATENCY_MS, **(latency_ms or {}))
+        self.failure_rate = dict.fromkeys(self.OPERATIONS, 0.0)
+        self.failure_rate.update(failure_rate or {})
+        self.jitter = jitter
+        self.seed = seed
+        self.lock = threading.Lock()
+        self.stats = {op: [0, 0] for op in self.OPERATIONS}
+        self.links: Dict[str, Dict] = {}
+        for index in range(count):
+            name = f'{prefix}{index}'
+            rng = random.Random(f'{seed}:{name}')
+            link_quirks = {quirk for quirk, fraction in sorted((quirks or {}).items()) if rng.random() < fraction}
+            self.links[name] = {
+                'index': index + 1000,
+                'mac': self.BASE_MAC + index,
+                'permanent_mac': self.BASE_MAC + index,
+                'up': True,
+                'ip': f'10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}',
+                'driver': 'sim-' + '-'.join(sorted(link_quirks)) if link_quirks else 'sim',
+                'quirks': link_quirks,
+                'rng': rng,
+                'lock': threading.Lock(),
+            }
+    
+    @classmethod
+    def from_config(cls, path: Optional[str], count: int, seed: int = None) -> 'SimulatedKernel':
+        """Build a simulation from a JSON config file (or defaults if path is None)."""
+        config = {}
+        if path:
+            with open(path) as f:
+                config = json.load(f)
+        return cls(
+            count=count,
+            prefix=config.get('prefix', 'sim'),
+            latency_ms=config.get('latency_ms'),
+            failure_rate=config.get('failure_rate'),
+            quirks=config.get('quirks'),
+            jitter=config.get('jitter', 0.0),
+            seed=seed if seed is not None else config.get('seed', 0)
+        )
+    
+    def _link(self, name: str) -> Dict:
+        link = self.links.get(name)
+        if link is None:
+            raise OSError(errno.ENODEV, f"No such device: {name}")
+        return link
+    
+    def _op(self, link: Optional[Dict], op: str) -> bool:
+        """Spend the operation's latency and roll for failure; True if it succeeds."""
+        rng = link['rng'] if link else None
+        latency = self.latency_ms[op]
+        if latency and self.jitter and rng:
+            latency *= 1 + self.jitter * (2 * rng.random() - 1)
+        if latency > 0:
+            time.sleep(latency / 1000)
+        failed = bool(self.failure_rate[op] and rng and rng.random() < self.failure_rate[op])
+        with self.lock:
+            self.stats[op][0] += 1
+            self.stats[op][1] += failed
+        return not failed
+    
+    @staticmethod
+    def _format(value: int) -> str:
+        return value.to_bytes(6, 'big').hex(':')
+    
+    def dump(self) -> List[Dict]:
+        """Snapshot every link, ordered by index."""
+        self._op(None, 'dump')
+        return [
+            {'interface': name, 'index': link['index'], 'mac': self._format(link['mac']),
+             'permanent_mac': self._format(link['permanent_mac']), 'up': link['up'],
+             'ip': link['ip'], 'driver': link['driver']}
+            for name, link in self.links.items()
+        ]
+    
+    def get(self, name: str) -> Dict:
+        link = self._link(name)
+        with link['lock']:
+            if not self._op(link, 'get'):
+                raise OSError(errno.EIO, f"Simulated read failure on {name}")
+            return {'mac': self._format(link['mac']), 'up': link['up']}
+    
+    def set_state(self, name: str, up: bool) -> bool:
+        link = self._link(name)
+        with link['lock']:
+            ok = self._op(link, 'up' if up else 'down')
+            if not up and 'refuse_down' in link['quirks']:
+                return False
+            if ok:
+                link['up'] = up
+            return ok
+    
+    def set_mac(self, name: str, mac: str, live: bool = False) -> Optional[bool]:
+        """
+        Write an address.
+        
+        Returns:
+            True on success, False if refused because the link is up
+            (live change on a no_live link), None on a simulated failure
+        """
+        link = self._link(name)
+        with link['lock']:
+            if link['up'] and (not live or 'no_live' in link['quirks']):
+                return False
+            if not self._op(link, 'set'):
+                return None
+            if 'sticky_mac' not in link['quirks']:
+                link['mac'] = MacAddress.parse(mac).value
+            return True
+    
+    def addresses(self) -> set:
+        """Current addresses of all links as 48-bit values (the simulated segment)."""
+        return {link['mac'] for link in list(self.links.values())}
+    
+    def summary(self) -> Dict:
+        """Operation and failure counts, plus how many links carry each quirk."""
+        with self.lock:
+            operations = {op: {'calls': calls, 'failures': failures}
+                          for op, (calls, failures) in self.stats.items() if calls}
+        quirks = {quirk: sum(1 for link in self.links.values() if quirk in link['quirks'])
+                  for quirk in self.QUIRKS}
+        return {'links': len(self.links), 'operations': operations, 'quirks': quirks}
+
+
+class SimulatedBackend(MACBackend):
+    """
+    MAC change backend driving a SimulatedKernel instead of real links.
+    
+    Goes through the same live-change attempt, down/set/up cycle and
+    rollback logic in MACBackend as the netlink and ioctl backends.
+    """
+    
+    name = 'simulated'
+    
+    def __init__(self, kernel: SimulatedKernel, verbose: bool = False):
+        super().__init__(verbose)
+        self.kernel = kernel
+    
+    def is_available(self) -> bool:
+        return True
+    
+    def get_mac(self, interface: str) -> Optional[str]:
+        try:
+            return self.kernel.get(interface)['mac']
+        except OSError as e:
+            self.logger.error(f"Error reading MAC of {interface}: {e}")
+            return None
+    
+    def get_permanent_mac(self, interface: str) -> Optional[str]:
+        link = self.kernel.links.get(interface)
+        return SimulatedKernel._format(link['permanent_mac']) if link else None
+    
+    def set_link_state(self, interface: str, up: bool) -> bool:
+        try:
+            return self.kernel.set_state(interface, up)
+        except OSError as e:
+            self.logger.error(f"Failed to bring {'up' if up else 'down'} {interface}: {e}")
+            return False
+    
+    def set_mac(self, interface: str, mac: str) -> bool:
+        try:
+            return bool(self.kernel.set_mac(interface, mac))
+        except OSError as e:
+            self.logger.error(f"Failed to set MAC on {interface}: {e}")
+            return False
+    
+    def set_mac_live(self, interface: str, mac: str) -> Optional[bool]:
+        try:
+            return self.kernel.set_mac(interface, mac, live=True)
+        except OSError:
+            return None
+
+
+class SimulatedInterfaceManager(NetworkInterfaceManager):
+    """NetworkInterfaceManager reading link state from a SimulatedKernel."""
+    
+    def __init__(self, kernel: SimulatedKernel, verbose: bool = False, oui_db: OUIDatabase = None,
+                 cache_ttl: float = 5.0):
+        super().__init__(verbose, oui_db, cache_ttl)
+        self.kernel = kernel
+    
+    def get_all_interfaces(self) -> List[str]:
+        return list(self.kernel.links)
+    
+    def get_inventory(self) -> Dict[str, Dict]:
+        inventory = {}
+        for link in self.kernel.dump():
+            info = self._record(link['interface'], link['mac'], link['permanent_mac'], link['up'], link['ip'])
+            info['vendor'] = self.get_vendor(link['mac'])
+            info['driver'] = link['driver']
+            inventory[link['interface']] = info
+            self.cache.update(link['interface'], {
+                field: info[field]
+                for field in InterfaceStateCache.VOLATILE_FIELDS + InterfaceStateCache.IMMUTABLE_FIELDS
+            })
+        return inventory
+    
+    def _query_current_mac(self, interface: str) -> Optional[str]:
+        try:
+            return self.kernel.get(interface)['mac']
+        except OSError as e:
+            self.logger.error(f"Error getting MAC for {interface}: {e}")
+            return None
+    
+    def _query_permanent_mac(self, interface: str) -> Optional[str]:
+        link = self.kernel.links.get(interface)
+        return SimulatedKernel._format(link['permanent_mac']) if link else None
+    
+    def _query_status(self, interface: str) -> str:
+        try:
+            return 'UP' if self.kernel.get(interface)['up'] else 'DOWN'
+        except OSError:
+            return 'UNKNOWN'
+    
+    def _query_ip_address(self, interface: str) -> Optional[str]:
+        link = self.kernel.links.get(interface)
+        return link['ip'] if link else None
+    
+    def _query_driver(self, interface: str) -> Optional[str]:
+        link = self.kernel.links.get(interface)
+        return link['driver'] if link else None
+    
+    def interface_down(self, interface: str) -> bool:
+        self.cache.invalidate(interface, ('status',))
+        try:
+            return self.kernel.set_state(interface, False)
+        except OSError as e:
+            self.logger.error(f"Failed to bring down {interface}: {e}")
+            return False
+    
+    def interface_up(self, interface: str) -> bool:
+        self.cache.invalidate(interface, ('status',))
+        try:
+            return self.kernel.set_state(interface, True)
+        except OSError as e:
+            self.logger.error(f"Failed to bring up {interface}: {e}")
+            return False
+
+
+BACKENDS = {
+    'netlink': NetlinkBackend,
+    'ioctl': IoctlBackend,
+    'macchanger': MacchangerBackend,
+}
+
+
+def create_backend(name: str = 'auto', verbose: bool = False,
+                   interface_manager: 'NetworkInterfaceManager' = None) -> MACBackend:
+    """
+    Instantiate a MAC change backend by name.
+    
+    'auto' prefers the in-process netlink backend, then ioctl, and finally
+    the original macchanger subprocess chain.
+    
+    Args:
+        name: One of 'auto', 'netlink', 'ioctl', 'macchanger'
+        verbose: Enable verbose logging in the backend
+        interface_manager: Shared manager used by the macchanger backend
+        
+    Returns:
+        MACBackend instance
+    """
+    if name == 'macchanger':
+        return MacchangerBackend(verbose, interface_manager)
+    if name != 'auto':
+        return BACKENDS[name](verbose)
+    
+    for candidate in ('netlink', 'ioctl'):
+        backend = BACKENDS[candidate](verbose)
+        if backend.is_available():
+            return backend
+    return MacchangerBackend(verbose, interface_manager)
+
+
+class HistoryStore:
+    """
+    Persistent, append-only MAC change history backed by SQLite in WAL mode.
+    
+    Storage Details:
+    - Rows are buffered and committed in batches (every batch_size records
+      or flush_interval seconds), so the fsync cost is paid per batch
+    - Indexed by (interface, timestamp) and timestamp for range queries
+    - Retention: rows older than retention_days, or beyond max_rows, are
+      deleted by compact(), which also truncates the WAL
+    - Queries stream rows from a cursor, so memory use stays constant no
+      matter how long the rotation has been running
+    """
+    
+    FIELDS = ('timestamp', 'interface', 'mode', 'old_mac', 'new_mac', 'custom_mac', 'downtime_ms')
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS history (
+            id INTEGER PRIMARY KEY,
+            ts REAL NOT NULL,
+            interface TEXT NOT NULL,
+            mode TEXT,
+            old_mac TEXT,
+            new_mac TEXT,
+            custom_mac TEXT,
+            downtime_ms REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_history_interface_ts ON history (interface, ts);
+        CREATE INDEX IF NOT EXISTS idx_history_ts ON history (ts);
+    """
+    
+    def __init__(self, path: str = None, batch_size: int = 64, flush_interval: float = 1.0,
+                 retention_days: float = 30.0, max_rows: int = 1000000):
+        self.path = path or os.path.join(STATE_DIR, 'history.db')
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retention_days = retention_days
+        self.max_rows = max_rows
+        self.logger = logging.getLogger(__name__)
+        self.lock = threading.RLock()
+        self._pending: List[Tuple] = []
+        self._last_flush = time.monotonic()
+        self._timer: Optional[threading.Timer] = None
+        self._appended = 0
+        
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=FULL')
+        self.conn.executescript(self.SCHEMA)
+        self.compact()
+    
+    @staticmethod
+    def _to_epoch(value) -> Optional[float]:
+        """Accept epoch seconds, datetime or ISO-8601 strings."""
+        if value is None or isinstance(value, (int, float)):
+            return value
+        if isinstance(value, datetime):
+            return value.timestamp()
+        try:
+            return float(value)
+        except ValueError:
+            return datetime.fromisoformat(value).timestamp()
+    
+    def append(self, entry: Dict):
+        """
+        Buffer one history entry for the next batched commit.
+        
+        Args:
+            entry: Dictionary with the FIELDS keys (timestamp as ISO-8601)
+        """
+        row = (self._to_epoch(entry['timestamp']),) + tuple(entry.get(field) for field in self.FIELDS[1:])
+        with self.lock:
+            self._pending.append(row)
+            if len(self._pending) >= self.batch_size or \
+                    time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    def flush(self):
+        """Commit buffered rows in a single transaction."""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._last_flush = time.monotonic()
+            if not self._pending:
+                return
+            rows, self._pending = self._pending, []
+            try:
+                with self.conn:
+                    self.conn.execute('BEGIN')
+                    self.conn.executemany(
+                        'INSERT INTO history (ts, interface, mode, old_mac, new_mac, custom_mac, downtime_ms) '
+                        'VALUES (?, ?, ?, ?, ?, ?, ?)', rows
+                    )
+            except sqlite3.Error as e:
+                self.logger.error(f"Failed to write history: {e}")
+                return
+            self._appended += len(rows)
+            if self._appended >= 10000:
+                self._appended = 0
+                self.compact()
+    
+    def compact(self):
+        """Apply retention limits and truncate the write-ahead log."""
+        with self.lock:
+            try:
+                if self.retention_days and self.retention_days > 0:
+                    self.conn.execute('DELETE FROM history WHERE ts < ?',
+                                      (time.time() - self.retention_days * 86400,))
+                if self.max_rows and self.max_rows > 0:
+                    self.conn.execute(
+                        'DELETE FROM history WHERE id <= '
+                        '(SELECT id FROM history ORDER BY id DESC LIMIT 1 OFFSET ?)', (self.max_rows,)
+                    )
+                self.conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            except sqlite3.Error as e:
+                self.logger.error(f"Failed to compact history: {e}")
+    
+    def query(self, interface: str = None, since=None, until=None,
+              limit: int = None, offset: int = 0, descending: bool = False):
+        """
+        Stream history entries matching the filters.
+        
+        Args:
+            interface: Only this interface
+            since: Start of the time range (epoch, datetime or ISO-8601)
+            until: End of the time range (exclusive)
+            limit: Maximum number of rows
+            offset: Rows to skip
+            descending: Newest first
+            
+        Yields:
+            History entry dictionaries
+        """
+        self.flush()
+        where, params = self._where(interface, since, until)
+        sql = 'SELECT ts, interface, mode, old_mac, new_mac, custom_mac, downtime_ms FROM history' + where
+        sql += ' ORDER BY ts DESC, id DESC' if descending else ' ORDER BY ts, id'
+        sql += ' LIMIT ? OFFSET ?'
+        params += [limit if limit is not None else -1, offset]
+        
+        # A dedicated connection keeps long reads independent of writers
+        reader = sqlite3.connect(self.path, check_same_thread=False)
+        try:
+            for row in reader.execute(sql, params):
+                entry = dict(zip(self.FIELDS, row))
+                entry['timestamp'] = datetime.fromtimestamp(row[0]).isoformat()
+                yield entry
+        finally:
+            reader.close()
+    
+    def _where(self, interface: str = None, since=None, until=None) -> Tuple[str, List]:
+        """WHERE clause and parameters for the common filters (uses the indexes)."""
+        clauses, params = [], []
+        if interface:
+            clauses.append('interface = ?')
+            params.append(interface)
+        if since is not None:
+            clauses.append('ts >= ?')
+            params.append(self._to_epoch(since))
+        if until is not None:
+            clauses.append('ts < ?')
+            params.append(self._to_epoch(until))
+        return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), params
+    
+    def count(self, interface: str = None, since=None, until=None) -> int:
+        """Count entries matching the filters in SQLite (no rows are materialized)."""
+        self.flush()
+        where, params = self._where(interface, since, until)
+        with self.lock:
+            return self.conn.execute('SELECT COUNT(*) FROM history' + where, params).fetchone()[0]
+    
+    def recent_macs(self, since=None, limit: int = 10000) -> List[str]:
+        """New MAC addresses of the latest changes, newest first (one column, one fetch)."""
+        self.flush()
+        sql = 'SELECT new_mac FROM history WHERE new_mac IS NOT NULL'
+        params: List = []
+        if since is not None:
+            sql += ' AND ts >= ?'
+            params.append(self._to_epoch(since))
+        sql += ' ORDER BY ts DESC, id DESC LIMIT ?'
+        params.append(limit)
+        with self.lock:
+            return [row[0] for row in self.conn.execute(sql, params)]
+    
+    def close(self):
+        """Flush pending rows and close the database."""
+        with self.lock:
+            self.flush()
+            self.conn.close()
+
+
+class HistoryExporter:
+    """
+    Base class for streaming history exporters.
+    
+    Records are written as they are produced instead of at exit, so a crash
+    loses at most the unflushed tail and memory use does not grow with the
+    length of the run.
+    
+    File Rotation:
+    - rotate_bytes: start a new file once the current one reaches this size
+    - rotate_seconds: start a new file after this many seconds
+    - Rotated files are renamed to <stem>-<YYYYmmddTHHMMSS>[-N]<suffix>
+    """
+    
+    suffixes: Tuple[str, ...] = ()
+    mode = 'w'
+    newline = None
+    
+    def __init__(self, path: str, rotate_bytes: int = None, rotate_seconds: float = None,
+                 flush_every: int = 32, flush_interval: float = 1.0):
+        self.path = Path(path)
+        self.rotate_bytes = rotate_bytes
+        self.rotate_seconds = rotate_seconds
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.fields = HistoryStore.FIELDS
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+        self.records = 0
+        self.rotated: List[str] = []
+        self._file = None
+        self._open()
+    
+    def _open(self):
+        self._file = open(self.path, self.mode, newline=self.newline)
+        self._opened = time.monotonic()
+        self._last_flush = self._opened
+        self._unflushed = 0
+        self._start_file()
+    
+    def _start_file(self):
+        """Write any per-file header."""
+    
+    def _end_file(self):
+        """Write any buffered rows or footer before the file is closed."""
+    
+    def _write(self, entry: Dict):
+        raise NotImplementedError
+    
+    def _rotate_name(self) -> Path:
+        stamp = datetime.now().strftime('%Y%m%dT%H%M%S')
+        candidate = self.path.with_name(f"{self.path.stem}-{stamp}{self.path.suffix}")
+        n = 1
+        while candidate.exists():
+            candidate = self.path.with_name(f"{self.path.stem}-{stamp}-{n}{self.path.suffix}")
+            n += 1
+        return candidate
+    
+    def _should_rotate(self) -> bool:
+        if self.rotate_bytes and self._file.tell() >= self.rotate_bytes:
+            return True
+        return bool(self.rotate_seconds and time.monotonic() - self._opened >= self.rotate_seconds)
+    
+    def rotate(self):
+        """Close the current file under a timestamped name and start a new one."""
+        with self.lock:
+            self._close_file()
+            target = self._rotate_name()
+            os.replace(self.path, target)
+            self.rotated.append(str(target))
+            self._open()
+    
+    def write(self, entry: Dict):
+        """
+        Append one history record.
+        
+        Args:
+            entry: History entry dictionary (HistoryStore.FIELDS keys)
+        """
+        with self.lock:
+            self._write(entry)
+            self.records += 1
+            self._unflushed += 1
+            if self._unflushed >= self.flush_every or \
+                    time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush()
+            rotate = self._should_rotate()
+        if rotate:
+            self.rotate()
+    
+    def write_all(self, entries: Iterable[Dict]) -> int:
+        """Write every record from an iterable; returns the number written."""
+        count = 0
+        for count, entry in enumerate(entries, 1):
+            self.write(entry)
+        return count
+    
+    def _flush(self):
+        self._file.flush()
+        self._last_flush = time.monotonic()
+        self._unflushed = 0
+    
+    def flush(self):
+        """Flush buffered records to the file."""
+        with self.lock:
+            if self._file:
+                self._flush()
+    
+    def _close_file(self):
+        self._end_file()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+    
+    def close(self):
+        """Flush and close the current file."""
+        with self.lock:
+            if self._file:
+                self._close_file()
+
+
+class NDJSONExporter(HistoryExporter):
+    """Newline-delimited JSON, one history record per line."""
+    
+    suffixes = ('.ndjson', '.jsonl')
+    
+    def _write(self, entry: Dict):
+        self._file.write(json.dumps({field: entry.get(field) for field in self.fields}) + '\n')
+
+
+class CSVExporter(HistoryExporter):
+    """CSV with a fixed header, repeated at the top of every rotated file."""
+    
+    suffixes = ('.csv',)
+    newline = ''
+    
+    def _start_file(self):
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.fields)
+    
+    def _write(self, entry: Dict):
+        self._writer.writerow([entry.get(field) for field in self.fields])
+
+
+class ColumnarExporter(HistoryExporter):
+    """
+    Compact columnar binary format for long runs.
+    
+    File Layout:
+    - Header: MAGIC (8 bytes)
+    - Row groups appended as they fill (or on flush), each:
+        'RGRP', row count (uint32), byte length of the body (uint32), body
+    - Body columns, in order:
+        timestamp    float64 epoch seconds
+        interface    dictionary encoded: uint16 dict size, length-prefixed
+                     UTF-8 strings, then uint16 ids per row
+        mode         dictionary encoded (as interface)
+        old_mac      uint64, NULL_MAC for missing values
+        new_mac      uint64
+        custom_mac   uint64
+        downtime_ms  float64, NaN for missing values
+    
+    A record costs 44 bytes (8 timestamp + 2 x 2 dictionary ids + 3 x 8
+    MACs + 8 downtime) instead of ~200 as JSON, plus a 12-byte header and
+    the dictionaries once per row group. A truncated file is still
+    readable up to its last complete row group.
+    """
+    
+    suffixes = ('.msxc',)
+    mode = 'wb'
+    
+    MAGIC = b'MSXCOL01'
+    GROUP = struct.Struct('=4sII')
+    NULL_MAC = 0xFFFFFFFFFFFFFFFF
+    MAC_FIELDS = ('old_mac', 'new_mac', 'custom_mac')
+    DICT_FIELDS = ('interface', 'mode')
+    
+    def __init__(self, path: str, rotate_bytes: int = None, rotate_seconds: float = None,
+                 flush_every: int = 4096, flush_interval: float = 5.0):
+        super().__init__(path, rotate_bytes, rotate_seconds, flush_every, flush_interval)
+    
+    def _start_file(self):
+        self._file.write(self.MAGIC)
+        self._reset_group()
+    
+    def _reset_group(self):
+        self._columns = {
+            'timestamp': array('d'),
+            'interface': array('H'),
+            'mode': array('H'),
+            'old_mac': array('Q'),
+            'new_mac': array('Q'),
+            'custom_mac': array('Q'),
+            'downtime_ms': array('d'),
+        }
+        self._dicts = {field: {} for field in self.DICT_FIELDS}
+    
+    @classmethod
+    def _mac_to_int(cls, mac: Optional[str]) -> int:
+        if not mac:
+            return cls.NULL_MAC
+        return int(re.sub(r'[^0-9A-Fa-f]', '', mac), 16)
+    
+    def _write(self, entry: Dict):
+        timestamp = entry.get('timestamp')
+        self._columns['timestamp'].append(HistoryStore._to_epoch(timestamp) or 0.0)
+        for field in self.DICT_FIELDS:
+            values = self._dicts[field]
+            value = entry.get(field) or ''
+            self._columns[field].append(values.setdefault(value, len(values)))
+        for field in self.MAC_FIELDS:
+            self._columns[field].append(self._mac_to_int(entry.get(field)))
+        downtime = entry.get('downtime_ms')
+        self._columns['downtime_ms'].append(float('nan') if downtime is None else downtime)
+    
+    def _write_group(self):
+        rows = len(self._columns['timestamp'])
+        if not rows:
+            return
+        body = bytearray(self._columns['timestamp'].tobytes())
+        for field in self.DICT_FIELDS:
+            body += struct.pack('=H', len(self._dicts[field]))
+            for value in self._dicts[field]:
+                encoded = value.encode()
+                body += struct.pack('=H', len(encoded)) + encoded
+            body += self._columns[field].tobytes()
+        for field in self.MAC_FIELDS + ('downtime_ms',):
+            body += self._columns[field].tobytes()
+        self._file.write(self.GROUP.pack(b'RGRP', rows, len(body)) + body)
+        self._reset_group()
+    
+    def _flush(self):
+        self._write_group()
+        super()._flush()
+    
+    def _end_file(self):
+        self._write_group()
+    
+    @classmethod
+    def read(cls, path: str):
+        """
+        Stream records back from a columnar file.
+        
+        Yields:
+            History entry dictionaries
+        """
+        with open(path, 'rb') as f:
+            if f.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"{path} is not a MacSpoofX columnar file")
+            while True:
+                header = f.read(cls.GROUP.size)
+                if len(header) < cls.GROUP.size:
+                    return
+                tag, rows, length = cls.GROUP.unpack(header)
+                body = f.read(length)
+                if tag != b'RGRP' or len(body) < length:
+                    return
+                yield from cls._decode_group(body, rows)
+    
+    @classmethod
+    def _decode_group(cls, body: bytes, rows: int):
+        offset = 0
+        
+        def take(typecode: str) -> array:
+            nonlocal offset
+            column = array(typecode)
+            size = column.itemsize * rows
+            column.frombytes(body[offset:offset + size])
+            offset += size
+            return column
+        
+        columns = {'timestamp': take('d')}
+        dicts = {}
+        for field in cls.DICT_FIELDS:
+            (count,) = struct.unpack_from('=H', body, offset)
+            offset += 2
+            values = []
+            for _ in range(count):
+                (length,) = struct.unpack_from('=H', body, offset)
+                values.append(body[offset + 2:offset + 2 + length].decode())
+                offset += 2 + length
+            dicts[field] = values
+            columns[field] = take('H')
+        for field in cls.MAC_FIELDS:
+            columns[field] = take('Q')
+        columns['downtime_ms'] = take('d')
+        
+        for i in range(rows):
+            entry = {'timestamp': datetime.fromtimestamp(columns['timestamp'][i]).isoformat()}
+            for field in cls.DICT_FIELDS:
+                entry[field] = dicts[field][columns[field][i]] or None
+            for field in cls.MAC_FIELDS:
+                value = columns[field][i]
+                entry[field] = None if value == cls.NULL_MAC else \
+                    ':'.join(f'{b:02x}' for b in value.to_bytes(6, 'big'))
+            downtime = columns['downtime_ms'][i]
+            entry['downtime_ms'] = None if downtime != downtime else downtime
+            yield entry
+
+
+EXPORTERS = (NDJSONExporter, CSVExporter, ColumnarExporter)
+
+
+def create_exporter(path: str, rotate_bytes: int = None,
+                    rotate_seconds: float = None) -> Optional[HistoryExporter]:
+    """
+    Create the streaming exporter matching a file extension.
+    
+    Returns:
+        Exporter instance, or None if the extension has no streaming format
+    """
+    suffix = Path(path).suffix.lower()
+    for exporter in EXPORTERS:
+        if suffix in exporter.suffixes:
+            return exporter(path, rotate_bytes, rotate_seconds)
+    return None
+
+
+class ConvergenceVerifier:
+    """
+    Event-driven check that a link has converged after a MAC change.
+    
+    A watch subscribes to rtnetlink link and IPv4 address events before the
+    change is applied, then blocks in select() on that socket until:
+    - Carrier: the link reports IFF_UP and IFF_RUNNING (operstate UP, or
+      UNKNOWN for drivers without carrier reporting)
+    - IP: an IPv4 address is assigned while the carrier is up (required
+      when the interface had one before the change, or with require_ip)
+    
+    Times are measured from the start of the change. Nothing sleeps or
+    polls: a state snapshot taken after the change covers links that never
+    went down, and every later transition arrives as an event.
+    """
+    
+    IFF_RUNNING = 0x40
+    
+    def __init__(self, deadline: float = 10.0, require_ip: bool = None):
+        """
+        Args:
+            deadline: Seconds allowed for convergence
+            require_ip: True/False to force; None requires an IP only if
+                the interface had one before the change
+        """
+        self.deadline = deadline
+        self.require_ip = require_ip
+        self.logger = logging.getLogger(__name__)
+        # Shared socket for state snapshots; event sockets are per watch
+        self.netlink = RtnetlinkSocket()
+    
+    def addresses(self, index: int) -> set:
+        return {a['address'] for a in self.netlink.dump_addresses(socket.AF_INET) if a['index'] == index}
+    
+    def watch(self, interface: str) -> 'ConvergenceWatch':
+        """Start watching an interface; call before applying the change."""
+        return ConvergenceWatch(self, interface)
+    
+    def close(self):
+        self.netlink.close()
+
+
+class ConvergenceWatch:
+    """
+    One pending convergence check (see ConvergenceVerifier).
+    
+    With require_ip forced on (--require-ip), only an address announced
+    (RTM_NEWADDR) after carrier returned counts as re-acquired, so a lease
+    left over from before the change is not mistaken for a new one.
+    Otherwise any address still present once carrier is back will do.
+    """
+    
+    def __init__(self, verifier: ConvergenceVerifier, interface: str):
+        self.verifier = verifier
+        self.interface = interface
+        self.started = time.perf_counter()
+        self.index = socket.if_nametoindex(interface)
+        self.events = RtnetlinkSocket(groups=InterfaceStateCache.RTMGRP_LINK |
+                                      InterfaceStateCache.RTMGRP_IPV4_IFADDR)
+        self.addresses = verifier.addresses(self.index)
+        self.baseline = set(self.addresses)
+        self.require_ip = verifier.require_ip if verifier.require_ip is not None else bool(self.addresses)
+        self.strict = verifier.require_ip is True
+        self.fresh = False
+        self.carrier_at: Optional[float] = None
+        self.ip_at: Optional[float] = None
+    
+    def _carrier(self, flags: int, now: float):
+        up = flags & RtnetlinkSocket.IFF_UP and flags & ConvergenceVerifier.IFF_RUNNING
+        if up and self.carrier_at is None:
+            self.carrier_at = now
+        elif not up:
+            self.carrier_at = None
+            self.ip_at = None
+            self.fresh = False
+    
+    def _update(self, now: float):
+        acquired = self.fresh if self.strict else bool(self.addresses)
+        if self.carrier_at is not None and acquired and self.ip_at is None:
+            self.ip_at = now
+    
+    def _converged(self) -> bool:
+        return self.carrier_at is not None and (not self.require_ip or self.ip_at is not None)
+    
+    def _handle(self, data: bytes, now: float):
+        netlink = self.events
+        for msg_type, _flags, _seq, payload in netlink._messages(data):
+            if msg_type == netlink.RTM_NEWLINK:
+                link = netlink.parse_link(payload)
+                if link['index'] == self.index:
+                    self._carrier(link['flags'], now)
+            elif msg_type in (netlink.RTM_NEWADDR, netlink.RTM_DELADDR):
+                address = netlink.parse_address(payload)
+                if address['index'] != self.index or address['family'] != socket.AF_INET:
+                    continue
+                if msg_type == netlink.RTM_NEWADDR:
+                    self.addresses.add(address['address'])
+                    self.fresh = True
+                else:
+                    self.addresses.discard(address['address'])
+                    if not self.addresses:
+                        self.ip_at = None
+        self._update(now)
+    
+    def wait(self) -> Dict:
+        """
+        Block until the link converges or the deadline passes.
+        
+        Returns:
+            Dictionary with carrier_ms, ip_ms, converged and timed_out
+        """
+        try:
+            now = time.perf_counter()
+            link = self.verifier.netlink.get_link(self.index)
+            if link:
+                self._carrier(link['flags'], now)
+            self.addresses = self.verifier.addresses(self.index)
+            self._update(now)
+            
+            end = self.started + self.verifier.deadline
+            while not self._converged():
+                remaining = end - time.perf_counter()
+                if remaining <= 0:
+                    break
+                ready, _, _ = select.select([self.events.sock], [], [], remaining)
+                if not ready:
+                    break
+                try:
+                    data = self.events.sock.recv(1 << 16)
+                except OSError as e:
+                    if e.errno != errno.ENOBUFS:
+                        raise
+                    # Dropped events: resynchronise from a fresh snapshot
+                    link = self.verifier.netlink.get_link(self.index)
+                    if link:
+                        self._carrier(link['flags'], time.perf_counter())
+                    self.addresses = self.verifier.addresses(self.index)
+                    # A lost RTM_NEWADDR can only be inferred from an address not seen before the change
+                    if self.carrier_at is not None and self.addresses - self.baseline:
+                        self.fresh = True
+                    data = b''
+                self._handle(data, time.perf_counter())
+        except OSError as e:
+            self.verifier.logger.error(f"Convergence check on {self.interface} failed: {e}")
+        finally:
+            self.events.close()
+        
+        converged = self._converged()
+        return {
+            'carrier_ms': round((self.carrier_at - self.started) * 1000, 3) if self.carrier_at else None,
+            'ip_ms': round((self.ip_at - self.started) * 1000, 3) if self.ip_at else None,
+            'converged': converged,
+            'timed_out': not converged,
+        }
+
+
+class AdmissionController:
+    """
+    Global admission control for link flaps.
+    
+    Every MAC change takes a token from a token bucket refilled at rate
+    changes per second (holding at most burst tokens) and one of max_down
+    slots, held until the change completes. The link is down during the
+    change for drivers without live address changes, and DHCP and
+    gratuitous ARP follow right after, so this caps both the rate at
+    which switches and DHCP servers see new addresses and how many links
+    are flapping at once. A rate or max_down of 0 means unlimited.
+    
+    Waiters are admitted strictly in arrival order (ticket queue), so a
+    burst of rotations drains at the configured rate without starving
+    anyone. phase() gives each interface a deterministic offset within a
+    period, used to spread timers that would otherwise fire together.
+    """
+    
+    def __init__(self, rate: float = 0.0, burst: int = None, max_down: int = 0):
+        if rate < 0 or max_down < 0:
+            raise ValueError("Rate and max_down must not be negative")
+        self.rate = rate
+        self.burst = max(1, burst if burst else math.ceil(rate))
+        self.max_down = max_down
+        self.down = 0
+        self._tokens = float(self.burst)
+        self._stamp = time.monotonic()
+        self._cond = threading.Condition()
+        self._next_ticket = 0
+        self._serving = 0
+        self.admitted = 0
+        self.max_queue = 0
+        self.max_down_seen = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.wait_samples = deque(maxlen=4096)
+    
+    @staticmethod
+    def phase(interface: str, period: float) -> float:
+        """Deterministic offset in [0, period) for an interface (CRC32 of its name)."""
+        return zlib.crc32(interface.encode()) / 2 ** 32 * period
+    
+    @property
+    def queue_depth(self) -> int:
+        """Changes currently waiting for admission."""
+        return self._next_ticket - self._serving
+    
+    def _refill(self, now: float):
+        if self.rate:
+            self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+    
+    def acquire(self, interface: str = None) -> float:
+        """
+        Block until a change may start.
+        
+        Args:
+            interface: Interface about to change (for logging only)
+            
+        Returns:
+            Seconds spent waiting for admission
+        """
+        started = time.monotonic()
+        with self._cond:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self.max_queue = max(self.max_queue, self._next_ticket - self._serving)
+            while True:
+                timeout = None
+                if ticket == self._serving:
+                    now = time.monotonic()
+                    self._refill(now)
+                    token = not self.rate or self._tokens >= 1
+                    slot = not self.max_down or self.down < self.max_down
+                    if token and slot:
+                        break
+                    if not token:
+                        timeout = (1 - self._tokens) / self.rate
+                self._cond.wait(timeout)
+            if self.rate:
+                self._tokens -= 1
+            self._serving += 1
+            self.down += 1
+            self.max_down_seen = max(self.max_down_seen, self.down)
+            waited = time.monotonic() - started
+            self.admitted += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            self.wait_samples.append(waited)
+            self._cond.notify_all()
+        METRICS.observe('macspoofx_admission_wait_seconds', waited)
+        if waited > 0.001:
+            logging.getLogger(__name__).debug(f"Admitted {interface} after {waited * 1000:.1f} ms")
+        return waited
+    
+    def release(self):
+        """Free the slot taken by acquire() once the change has completed."""
+        with self._cond:
+            self.down -= 1
+            self._cond.notify_all()
+    
+    def stats(self) -> Dict:
+        """
+        Queue and wait statistics, waits in milliseconds.
+        
+        Returns:
+            Dictionary with admitted count, current and maximum queue depth,
+            peak concurrent changes and mean, p99 and max admission wait
+        """
+        with self._cond:
+            samples = sorted(self.wait_samples)
+            admitted = self.admitted
+            return {
+                'admitted': admitted,
+                'queue_depth': self.queue_depth,
+                'max_queue': self.max_queue,
+                'max_down': self.max_down_seen,
+                'wait_mean_ms': round(self.wait_total / admitted * 1000, 3) if admitted else None,
+                'wait_p99_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000, 3)
+                if samples else None,
+                'wait_max_ms': round(self.wait_max * 1000, 3) if admitted else None
+            }
+
+
+class ChangeJournal:
+    """
+    Write-ahead journal of MAC changes, used to restore links after a crash.
+    
+    Every change appends a 'begin' record (interface, old and new MAC, pid)
+    that is flushed to disk with fdatasync() before the link is touched,
+    and an 'end' record once the change has finished or been rolled back.
+    A begin without an end is an in-flight change: the process died
+    between taking the link down and bringing it back up.
+    
+    The journal also remembers the original MAC of every interface it has
+    seen, so recover() can put a host with hundreds of rotated interfaces
+    back to its original addresses in one parallel pass.
+    
+    The file is JSON lines shared by every running instance (entries are
+    keyed on pid and id). Each instance holds a shared flock on it; the
+    journal is only compacted on open when no other instance holds it. A
+    torn last line from a crash is ignored.
+    
+    A journal opened with netns (a namespace file path, used by --netns
+    workers) tags its records with it. Such interfaces are keyed as
+    'name@/path' and restored from a thread that enters the namespace.
+    """
+    
+    COMPACT_THRESHOLD = 4096
+    
+    def __init__(self, path: str = None, sync: bool = True, netns: str = None):
+        self.path = path or os.path.join(STATE_DIR, 'journal.log')
+        self.sync = sync
+        self.netns = netns
+        self.logger = logging.getLogger(__name__)
+        self.lock = threading.Lock()
+        self.originals: Dict[str, str] = {}
+        self.inflight: Dict[Tuple[int, int], Dict] = {}
+        self._next_id = 1
+        # pid plus start time identifies a process even when pids are reused
+        self.owner = (os.getpid(), self._start_time(os.getpid()))
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.fd = self._open()
+    
+    def _open(self) -> int:
+        while True:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                exclusive = True
+            except BlockingIOError:
+                fcntl.flock(fd, fcntl.LOCK_SH)
+                exclusive = False
+            try:
+                current = os.stat(self.path).st_ino
+            except FileNotFoundError:
+                current = None
+            if current != os.fstat(fd).st_ino:
+                # Another instance compacted the journal while we waited
+                os.close(fd)
+                continue
+            
+            self.originals.clear()
+            self.inflight.clear()
+            records = self._load()
+            live = len(self.originals) + len(self.inflight)
+            if exclusive and (records > self.COMPACT_THRESHOLD or records > 2 * live + 64):
+                self._compact()
+                os.close(fd)
+                continue
+            if exclusive:
+                fcntl.flock(fd, fcntl.LOCK_SH)
+            return fd
+    
+    def _load(self) -> int:
+        records = 0
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    records += 1
+                    self._replay(record)
+        except FileNotFoundError:
+            pass
+        return records
+    
+    @staticmethod
+    def key(interface: str, netns: Optional[str] = None) -> str:
+        """Journal key of an interface: its name, qualified as 'name@/path' in another namespace."""
+        return f"{interface}@{netns}" if netns else interface
+    
+    @staticmethod
+    def split(key: str) -> Tuple[str, Optional[str]]:
+        """Inverse of key(); interface names cannot contain '/'."""
+        interface, sep, netns = key.partition('@/')
+        return interface, '/' + netns if sep else None
+    
+    def _replay(self, record: Dict):
+        if record.get('op') == 'begin':
+            self._next_id = max(self._next_id, record['id'] + 1)
+            if record.get('old_mac'):
+                self.originals.setdefault(self.key(record['interface'], record.get('netns')), record['old_mac'])
+            self.inflight[(record['pid'], record['id'])] = record
+        elif record.get('op') == 'end':
+            self.inflight.pop((record['pid'], record['id']), None)
+        elif record.get('op') == 'forget':
+            self.originals.pop(self.key(record['interface'], record.get('netns')), None)
+    
+    def _compact(self):
+        """Rewrite the journal as the minimal set of records for the current state."""
+        records = []
+        for key, mac in self.originals.items():
+            interface, netns = self.split(key)
+            record = {'op': 'begin', 'id': 0, 'interface': interface, 'old_mac': mac,
+                      'new_mac': None, 'pid': 0, 'ts': time.time()}
+            if netns:
+                record['netns'] = netns
+            records.append(record)
+            records.append({'op': 'end', 'id': 0, 'pid': 0})
+        records.extend(self.inflight.values())
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(',', ':')) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+    
+    def _append(self, record: Dict, durable: bool):
+        os.write(self.fd, (json.dumps(record, separators=(',', ':')) + '\n').encode())
+        if durable and self.sync:
+            os.fdatasync(self.fd)
+    
+    def begin(self, interface: str, old_mac: Optional[str], new_mac: Optional[str]) -> int:
+        """
+        Record an intended change before the link is touched.
+        
+        Returns:
+            Journal entry id to pass to end()
+        """
+        with self.lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            record = {'op': 'begin', 'id': entry_id, 'interface': interface, 'old_mac': old_mac,
+                      'new_mac': new_mac, 'pid': self.owner[0], 'start': self.owner[1], 'ts': time.time()}
+            if self.netns:
+                record['netns'] = self.netns
+            self._append(record, durable=True)
+            self._replay(record)
+        return entry_id
+    
+    def end(self, entry_id: int):
+        """Mark a change as finished (applied or rolled back)."""
+        with self.lock:
+            # Losing an end record only makes recovery restore a known-good address
+            self._append({'op': 'end', 'id': entry_id, 'pid': self.owner[0]}, durable=False)
+            self.inflight.pop((self.owner[0], entry_id), None)
+    
+    def forget(self, interfaces: Iterable[str]):
+        """Drop restored interfaces (journal keys) so the next run records fresh originals."""
+        with self.lock:
+            for key in interfaces:
+                if self.originals.pop(key, None) is not None:
+                    interface, netns = self.split(key)
+                    record = {'op': 'forget', 'interface': interface}
+                    if netns:
+                        record['netns'] = netns
+                    self._append(record, durable=False)
+    
+    @staticmethod
+    def _start_time(pid: int) -> Optional[int]:
+        """Process start time in clock ticks since boot, or None if it is gone."""
+        try:
+            with open(f'/proc/{pid}/stat') as f:
+                return int(f.read().rsplit(')', 1)[1].split()[19])
+        except (OSError, ValueError, IndexError):
+            return None
+    
+    def orphaned(self) -> List[Dict]:
+        """In-flight entries whose process is gone (crashed or killed)."""
+        with self.lock:
+            entries = list(self.inflight.values())
+        return [entry for entry in entries
+                if (entry['pid'], entry.get('start')) != self.owner
+                and self._start_time(entry['pid']) != entry.get('start')]
+    
+    def pending(self) -> List[Dict]:
+        """In-flight entries of this process (changes interrupted by a signal)."""
+        with self.lock:
+            return [entry for entry in self.inflight.values()
+                    if (entry['pid'], entry.get('start')) == self.owner]
+    
+    def restore(self, backend: 'MACBackend', targets: Dict[str, str], workers: int = 16) -> List[Dict]:
+        """
+        Restore interfaces to the given addresses in one parallel pass.
+        
+        Links already carrying their target address are only brought up.
+        Interfaces in other namespaces are restored from a short-lived
+        thread that enters the namespace, with a fresh backend of the same
+        kind (pool threads are never moved between namespaces).
+        
+        Args:
+            backend: Backend used for the changes
+            targets: Journal key (see key()) to MAC address
+            workers: Concurrent restores
+            
+        Returns:
+            One result dictionary per interface
+        """
+        def apply(link_backend: 'MACBackend', interface: str, mac: str, result: Dict):
+            try:
+                current = link_backend.get_mac(interface)
+                if current == mac:
+                    result['success'] = link_backend.set_link_state(interface, True)
+                else:
+                    result['success'] = link_backend.apply_mac(interface, mac, current)['success']
+                if not result['success']:
+                    result['error'] = 'restore failed'
+            except Exception as e:
+                result['error'] = str(e)
+        
+        def apply_in_namespace(netns: str, interface: str, mac: str, result: Dict):
+            try:
+                NamespaceRotator.setns(netns)
+            except OSError as e:
+                result['error'] = f"setns {netns} failed: {e}"
+                return
+            apply(create_backend(backend.name), interface, mac, result)
+        
+        def restore_one(key: str, mac: str) -> Dict:
+            result = {'interface': key, 'mac': mac, 'success': False, 'error': None}
+            interface, netns = self.split(key)
+            if netns:
+                thread = threading.Thread(target=apply_in_namespace, args=(netns, interface, mac, result),
+                                          name=f'restore-{interface}', daemon=True)
+                thread.start()
+                thread.join()
+            else:
+                apply(backend, interface, mac, result)
+            return result
+        
+        if not targets:
+            return []
+        with futures.ThreadPoolExecutor(max_workers=max(1, min(workers, len(targets))),
+                                        thread_name_prefix='restore') as executor:
+            results = list(executor.map(lambda item: restore_one(*item), sorted(targets.items())))
+        
+        restored = {r['interface'] for r in results if r['success']}
+        with self.lock:
+            for key, entry in list(self.inflight.items()):
+                if self.key(entry['interface'], entry.get('netns')) in restored:
+                    self._append({'op': 'end', 'id': entry['id'], 'pid': entry['pid']}, durable=False)
+                    del self.inflight[key]
+        return results
+    
+    def close(self):
+        """Close the journal file."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+class MACChanger:
+    """
+    Core MAC address spoofing engine.
+    
+    Backends:
+    - netlink: in-process rtnetlink RTM_NEWLINK/IFLA_ADDRESS (default)
+    - ioctl: in-process SIOCSIFHWADDR/SIOCSIFFLAGS fallback
+    - macchanger: the GNU/Linux macchanger utility driven through subprocesses
+    
+    Technical Process:
+    1. Interface must be brought down (ip link set down or IFF_UP cleared)
+    2. The new MAC address is written in kernel space
+    3. Interface is brought back up
+    4. New MAC is active for all network communications
+    """
+    
+    # Recent changes kept in memory; the full history lives in the HistoryStore
+    HISTORY_LIMIT = 1000
+    
+    def __init__(self, interface: str, verbose: bool = False, stealth: bool = False,
+                 backend: MACBackend = None, generator: MACGenerator = None,
+                 interface_manager: NetworkInterfaceManager = None,
+                 history_store: HistoryStore = None, exporter: HistoryExporter = None,
+                 verifier: ConvergenceVerifier = None, journal: ChangeJournal = None,
+                 limiter: AdmissionController = None):
+        self.interface = interface
+        self.verbose = verbose
+        self.stealth = stealth
+        self.logger = logging.getLogger(__name__)
+        self.interface_manager = interface_manager or NetworkInterfaceManager(verbose)
+        self.backend = backend or create_backend('auto', verbose, self.interface_manager)
+        self.generator = generator or MACGenerator()
+        self.history_store = history_store
+        self.exporter = exporter
+        self.verifier = verifier
+        self.journal = journal
+        self.limiter = limiter
+        self.history = deque(maxlen=self.HISTORY_LIMIT)
+        self.last_change: Optional[Dict] = None
+    
+    def check_macchanger_installed(self) -> bool:
+        """
+        Verify macchanger is installed on the system.
+        
+        Returns:
+            True if macchanger is available
+        """
+        if isinstance(self.backend, MacchangerBackend):
+            return self.backend.is_available()
+        return MacchangerBackend(self.verbose).is_available()
+    
+    def _apply_change(self, mode: str, target_mac: Optional[str] = None,
+                      macchanger_flags: Optional[List[str]] = None,
+                      custom_mac: str = None) -> Tuple[bool, Optional[str]]:
+        """
+        Run the down/set/up/read-back sequence through the backend.
+        
+        Args:
+            mode: Mode name recorded in history
+            target_mac: Address to write
+            macchanger_flags: Flags used instead when the backend is macchanger
+                (only needed where no address can be computed, i.e. reset)
+            custom_mac: User supplied address recorded in history
+            
+        Returns:
+            Tuple of (success, new_mac_address)
+        """
+        if not self.backend.is_available():
+            return False, None
+        
+        if not target_mac and not (self.backend.native_modes and macchanger_flags):
+            self.logger.error(f"No target MAC for mode {mode}")
+            return False, None
+        
+        started = time.perf_counter()
+        # Read from the link, not the cache: this is the address journaled and rolled back to
+        old_mac = self.backend.get_mac(self.interface)
+        self.interface_manager.cache.set(self.interface, 'current_mac', old_mac)
+        
+        watch = None
+        entry_id = None
+        if self.limiter:
+            self.limiter.acquire(self.interface)
+        try:
+            watch = self._watch()
+            entry_id = self.journal.begin(self.interface, old_mac, target_mac) if self.journal else None
+            if self.backend.native_modes and macchanger_flags:
+                outcome = self.backend.apply_flags(self.interface, macchanger_flags, old_mac)
+            else:
+                outcome = self.backend.apply_mac(self.interface, target_mac, old_mac)
+        except Exception as e:
+            self.logger.error(f"Failed to change MAC on {self.interface}: {e}")
+            outcome = MACBackend._outcome()
+        finally:
+            if self.limiter:
+                self.limiter.release()
+        
+        self.interface_manager.cache.invalidate(self.interface, InterfaceStateCache.VOLATILE_FIELDS)
+        self.last_change = outcome
+        
+        if not outcome['success']:
+            if entry_id is not None:
+                self.journal.end(entry_id)
+            if watch:
+                watch.events.close()
+            METRICS.inc('macspoofx_rotations_total', (mode, self.interface, 'failure'))
+            return False, None
+        
+        verify_start = time.perf_counter()
+        new_mac = self.interface_manager.cached(self.interface, 'current_mac', self.backend.get_mac)
+        finished = time.perf_counter()
+        METRICS.observe('macspoofx_phase_seconds', finished - verify_start, ('verify', self.backend.name))
+        
+        if target_mac and new_mac != target_mac and old_mac:
+            self.logger.error(f"Verification failed on {self.interface}: expected {target_mac}, "
+                              f"found {new_mac}; rolling back to {old_mac}")
+            try:
+                rollback = self.backend.apply_mac(self.interface, old_mac)
+            except Exception as e:
+                self.logger.error(f"Failed to roll back {self.interface}: {e}")
+                rollback = MACBackend._outcome()
+            self.interface_manager.cache.invalidate(self.interface, InterfaceStateCache.VOLATILE_FIELDS)
+            outcome['rolled_back'] = rollback['success']
+            if entry_id is not None:
+                if rollback['success']:
+                    self.journal.end(entry_id)
+                else:
+                    # Left in flight: recovery restores old_mac from the begin record
+                    self.logger.error(f"Rollback of {self.interface} to {old_mac} failed; "
+                                      f"journal entry {entry_id} kept for recovery")
+            if watch:
+                watch.events.close()
+            METRICS.inc('macspoofx_rotations_total', (mode, self.interface, 'failure'))
+            return False, None
+        
+        METRICS.observe('macspoofx_phase_seconds', finished - started, ('total', self.backend.name))
+        if entry_id is not None:
+            self.journal.end(entry_id)
+        
+        # Log the change
+        self._log_change(mode, old_mac, new_mac, custom_mac, outcome['downtime_ms'])
+        
+        if self.verbose and not self.stealth:
+            verb = 'reset' if mode == 'reset' else 'changed'
+            how = 'live' if outcome['live'] else f"{outcome['downtime_ms']} ms down"
+            print(f"{Fore.GREEN}[+] MAC {verb} from {old_mac} to {new_mac} ({how}){Style.RESET_ALL}")
+        
+        if watch and not self._converge(watch, outcome):
+            METRICS.inc('macspoofx_rotations_total', (mode, self.interface, 'failure'))
+            return False, new_mac
+        
+        METRICS.inc('macspoofx_rotations_total', (mode, self.interface, 'success'))
+        return True, new_mac
+    
+    def _watch(self) -> Optional[ConvergenceWatch]:
+        """Subscribe to link events before the change, if verification is on."""
+        if not self.verifier:
+            return None
+        try:
+            return self.verifier.watch(self.interface)
+        except OSError as e:
+            self.logger.error(f"Cannot watch {self.interface} for convergence: {e}")
+            return None
+    
+    def _converge(self, watch: ConvergenceWatch, outcome: Dict) -> bool:
+        """Wait for carrier (and IP) and record the times in the outcome."""
+        result = watch.wait()
+        outcome['convergence'] = result
+        for phase in ('carrier', 'ip'):
+            if result[f'{phase}_ms'] is not None:
+                METRICS.observe('macspoofx_phase_seconds', result[f'{phase}_ms'] / 1000,
+                                (phase, self.backend.name))
+        
+        if not result['converged']:
+            missing = 'carrier' if result['carrier_ms'] is None else 'an IPv4 address'
+            self.logger.error(f"{self.interface} did not regain {missing} within "
+                              f"{self.verifier.deadline}s")
+            if not self.stealth:
+                print(f"{Fore.RED}[-] {self.interface} did not regain {missing} within "
+                      f"{self.verifier.deadline}s{Style.RESET_ALL}")
+            return False
+        
+        if self.verbose and not self.stealth:
+            ip = f", IP {result['ip_ms']} ms" if result['ip_ms'] is not None else ''
+            print(f"{Fore.GREEN}[+] {self.interface} converged: carrier {result['carrier_ms']} ms{ip}"
+                  f"{Style.RESET_ALL}")
+        return True
+    
+    def change_mac_random(self) -> Tuple[bool, Optional[str]]:
+        """
+        Change MAC to a random locally administered unicast address.
+        
+        Process:
+        - The address is drawn from the in-process MACGenerator pool
+        - Automatically handles interface down/up cycle
+        
+        Returns:
+            Tuple of (success, new_mac_address)
+        """
+        try:
+            target_mac = self.generator.next('random')
+        except ValueError as e:
+            self.logger.error(str(e))
+            return False, None
+        return self._apply_change('random', target_mac)
+    
+    def change_mac_custom(self, custom_mac: str) -> Tuple[bool, Optional[str]]:
+        """
+        Change MAC to a specific custom address.
+        
+        Args:
+            custom_mac: Custom MAC address to set
+            
+        Returns:
+            Tuple of (success, new_mac_address)
+        """
+        if not MACAddressValidator.is_valid_mac(custom_mac):
+            self.logger.error(f"Invalid MAC address format: {custom_mac}")
+            return False, None
+        
+        normalized_mac = MACAddressValidator.normalize_mac(custom_mac)
+        return self._apply_change('custom', normalized_mac, ['-m', normalized_mac], custom_mac)
+    
+    def change_mac_vendor(self, vendor: str = None) -> Tuple[bool, Optional[str]]:
+        """
+        Change MAC to a vendor-specific address.
+        
+        Args:
+            vendor: Vendor name (optional, random vendor if None)
+            
+        Returns:
+            Tuple of (success, new_mac_address)
+        """
+        try:
+            target_mac = self.generator.next('vendor', vendor)
+        except ValueError as e:
+            self.logger.error(str(e))
+            return False, None
+        return self._apply_change('vendor', target_mac)
+    
+    def change_mac_sequence(self) -> Tuple[bool, Optional[str]]:
+        """Change MAC to the next address of the persisted sequence."""
+        try:
+            target_mac = self.generator.next('sequence')
+        except ValueError as e:
+            self.logger.error(str(e))
+            return False, None
+        return self._apply_change('sequence', target_mac)
+    
+    def reset_mac(self) -> Tuple[bool, Optional[str]]:
+        """
+        Reset MAC to permanent hardware address.
+        
+        Returns:
+            Tuple of (success, permanent_mac_address)
+        """
+        if self.backend.native_modes:
+            return self._apply_change('reset', None, ['-p'])
+        
+        permanent_mac = self.backend.get_permanent_mac(self.interface)
+        if not permanent_mac:
+            self.logger.error(f"Permanent MAC unavailable for {self.interface}")
+            return False, None
+        return self._apply_change('reset', permanent_mac)
+    
+    def change(self, mode: str, custom_mac: str = None, vendor: str = None) -> Tuple[bool, Optional[str]]:
+        """
+        Change the MAC using the named mode.
+        
+        Args:
+            mode: One of 'random', 'custom', 'vendor', 'sequence', 'reset'
+            custom_mac: Address for custom mode
+            vendor: Vendor name for vendor mode
+            
+        Returns:
+            Tuple of (success, new_mac_address)
+        """
+        if mode == 'random':
+            return self.change_mac_random()
+        if mode == 'custom':
+            if not custom_mac:
+                self.logger.error("Custom mode requires a MAC address")
+                return False, None
+            return self.change_mac_custom(custom_mac)
+        if mode == 'vendor':
+            return self.change_mac_vendor(vendor)
+        if mode == 'sequence':
+            return self.change_mac_sequence()
+        if mode == 'reset':
+            return self.reset_mac()
+        self.logger.error(f"Unknown mode: {mode}")
+        return False, None
+    
+    def _log_change(self, mode: str, old_mac: str, new_mac: str, custom_mac: str = None,
+                    downtime_ms: Optional[float] = None):
+        """Log MAC address change to history."""
+        entry = {
+            'timestamp': datetime.now().isoformat(),
+            'interface': self.interface,
+            'mode': mode,
+            'old_mac': old_mac,
+            'new_mac': new_mac,
+            'custom_mac': custom_mac,
+            'downtime_ms': downtime_ms
+        }
+        self.history.append(entry)
+        if self.history_store:
+            self.history_store.append(entry)
+        if self.exporter:
+            self.exporter.write(entry)
+    
+    def get_history(self) -> List[Dict]:
+        """Get recent MAC change history held in memory."""
+        return list(self.history)
+
+
+class AsyncRtnetlink:
+    """
+    asyncio wrapper around a non-blocking rtnetlink socket.
+    
+    A single reader task demultiplexes replies by sequence number, so any
+    number of coroutines can have requests in flight on one socket.
+    """
+    
+    def __init__(self):
+        self.netlink = RtnetlinkSocket()
+        self.netlink.sock.setblocking(False)
+        self._waiters: Dict[int, asyncio.Future] = {}
+        self._reader: Optional[asyncio.Task] = None
+    
+    def close(self):
+        """Stop the reader and close the socket."""
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        self.netlink.close()
+    
+    def _ensure_reader(self):
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.get_running_loop().create_task(self._read_loop())
+    
+    async def _read_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                data = await loop.sock_recv(self.netlink.sock, 1 << 16)
+            except OSError as e:
+                for future in self._waiters.values():
+                    if not future.done():
+                        future.set_exception(e)
+                self._waiters.clear()
+                return
+            for msg_type, _flags, seq, payload in self.netlink._messages(data):
+                future = self._waiters.pop(seq, None)
+                if future is not None and not future.done():
+                    future.set_result((msg_type, payload))
+    
+    async def _send(self, messages: List[Tuple[int, bytes]]) -> List[Tuple[int, bytes]]:
+        loop = asyncio.get_running_loop()
+        self._ensure_reader()
+        futures = []
+        for seq, _msg in messages:
+            future = loop.create_future()
+            self._waiters[seq] = future
+            futures.append(future)
+        await loop.sock_sendall(self.netlink.sock, b''.join(msg for _seq, msg in messages))
         try:
-            subprocess.run(
-                ['ip', 'link', 'set', interface, 'down'],
-                check=True,
-                capture_output=True
-            )
-            if self.verbose:
-                self.logger.info(f"Interface {interface} brought down")
-            return True
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to bring down {interface}: {e}")
-            return False
+            return await asyncio.wait_for(asyncio.gather(*futures), RtnetlinkSocket.REPLY_TIMEOUT)
+        except asyncio.TimeoutError:
+            for seq, _msg in messages:
+                self._waiters.pop(seq, None)
+            raise OSError(errno.ETIMEDOUT, os.strerror(errno.ETIMEDOUT))
     
-    def interface_up(self, interface: str) -> bool:
+    async def transact(self, messages: List[Tuple[int, bytes]]) -> List[int]:
+        """Async counterpart of RtnetlinkSocket.transact()."""
+        replies = await self._send(messages)
+        return [-struct.unpack_from('=i', payload)[0] for _msg_type, payload in replies]
+    
+    async def request(self, message: Tuple[int, bytes]):
+        """Send one acknowledged request, raising OSError on failure."""
+        error = (await self.transact([message]))[0]
+        if error:
+            raise OSError(error, os.strerror(error))
+    
+    async def get_link(self, index: int) -> Optional[Dict]:
+        """Async counterpart of RtnetlinkSocket.get_link()."""
+        message = self.netlink.build_link_message(index, msg_type=RtnetlinkSocket.RTM_GETLINK,
+                                                  nl_flags=RtnetlinkSocket.NLM_F_REQUEST)
+        msg_type, payload = (await self._send([message]))[0]
+        if msg_type == RtnetlinkSocket.NLMSG_ERROR:
+            error = -struct.unpack_from('=i', payload)[0]
+            if error:
+                raise OSError(error, os.strerror(error))
+            return None
+        return RtnetlinkSocket.parse_link(payload)
+
+
+class AsyncMACChanger(MACChanger):
+    """
+    Non-blocking MAC changer for the asyncio core.
+    
+    The link down/set/up/read-back sequence runs over AsyncRtnetlink when
+    rtnetlink is available, otherwise through asyncio subprocesses
+    ('ip link set', 'macchanger -m', 'ip link show'), so one event loop can
+    drive thousands of interfaces without a thread per interface.
+    """
+    
+    def __init__(self, interface: str, verbose: bool = False, stealth: bool = False,
+                 generator: MACGenerator = None, interface_manager: NetworkInterfaceManager = None,
+                 netlink: AsyncRtnetlink = None, history_store: HistoryStore = None,
+                 exporter: HistoryExporter = None, verifier: ConvergenceVerifier = None,
+                 journal: ChangeJournal = None, limiter: AdmissionController = None):
+        super().__init__(interface, verbose, stealth, MacchangerBackend(verbose, interface_manager),
+                         generator, interface_manager, history_store, exporter, verifier, journal,
+                         limiter)
+        self.netlink = netlink
+        self.allow_live = True
+        self._live_supported: Optional[bool] = None
+    
+    async def _exec(self, *command: str) -> Tuple[int, str]:
+        started = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        METRICS.observe('macspoofx_subprocess_seconds', time.perf_counter() - started, (command[0],))
+        if process.returncode != 0:
+            self.logger.error(f"{' '.join(command)} failed: {stderr.decode().strip()}")
+        return process.returncode, stdout.decode()
+    
+    async def _get_mac(self) -> Optional[str]:
+        if self.netlink:
+            try:
+                link = await self.netlink.get_link(socket.if_nametoindex(self.interface))
+            except OSError as e:
+                self.logger.error(f"Error reading link {self.interface}: {e}")
+                return None
+            return RtnetlinkSocket.format_mac(link['attrs'].get(RtnetlinkSocket.IFLA_ADDRESS)) if link else None
+        returncode, output = await self._exec('ip', 'link', 'show', self.interface)
+        mac_match = re.search(r'link/ether\s+([0-9a-fA-F:]{17})', output) if returncode == 0 else None
+        return mac_match.group(1).lower() if mac_match else None
+    
+    async def _set_link_state(self, up: bool) -> bool:
+        if self.netlink:
+            try:
+                await self.netlink.request(self.netlink.netlink.build_link_message(
+                    socket.if_nametoindex(self.interface),
+                    flags=RtnetlinkSocket.IFF_UP if up else 0,
+                    change=RtnetlinkSocket.IFF_UP
+                ))
+                return True
+            except OSError as e:
+                self.logger.error(f"Failed to bring {'up' if up else 'down'} {self.interface}: {e}")
+                return False
+        returncode, _ = await self._exec('ip', 'link', 'set', self.interface, 'up' if up else 'down')
+        return returncode == 0
+    
+    async def _set_mac(self, mac: str) -> bool:
+        if self.netlink:
+            try:
+                await self.netlink.request(self.netlink.netlink.build_link_message(
+                    socket.if_nametoindex(self.interface),
+                    attrs=RtnetlinkSocket.pack_attr(RtnetlinkSocket.IFLA_ADDRESS,
+                                                    bytes.fromhex(mac.replace(':', '')))
+                ))
+                return True
+            except OSError as e:
+                self.logger.error(f"Failed to set MAC on {self.interface}: {e}")
+                return False
+        returncode, _ = await self._exec('macchanger', '-m', mac, self.interface)
+        return returncode == 0
+    
+    async def _apply_netlink(self, mac: str, old_mac: Optional[str]) -> Dict:
         """
-        Bring interface up using 'ip link set' command.
+        Live change, else the down/set/up cycle of NetlinkBackend.apply_mac().
+        
+        The down request is acknowledged before set and up are sent, and
+        any failure after it (including a lost reply) ends with a
+        best-effort attempt to bring the link back up.
+        """
+        outcome = MACBackend._outcome()
+        netlink = self.netlink.netlink
+        
+        def address(value: str) -> bytes:
+            return RtnetlinkSocket.pack_attr(RtnetlinkSocket.IFLA_ADDRESS, bytes.fromhex(value.replace(':', '')))
+        
+        def state(up: bool) -> Tuple[int, bytes]:
+            return netlink.build_link_message(index, flags=RtnetlinkSocket.IFF_UP if up else 0,
+                                              change=RtnetlinkSocket.IFF_UP)
+        
+        index = None
+        down_done = False
+        set_error = None
+        try:
+            index = socket.if_nametoindex(self.interface)
+            if self.allow_live and self._live_supported is not False:
+                link = await self.netlink.get_link(index)
+                if link and link['flags'] & RtnetlinkSocket.IFF_UP:
+                    error = (await self.netlink.transact([netlink.build_link_message(index, attrs=address(mac))]))[0]
+                    if error in (0, errno.EBUSY):
+                        self._live_supported = error == 0
+                    if not error:
+                        outcome.update(success=True, live=True)
+                        return outcome
+            
+            start = time.perf_counter()
+            down_error = (await self.netlink.transact([state(False)]))[0]
+            if down_error:
+                self.logger.error(f"Failed to bring down {self.interface}: {os.strerror(down_error)}")
+                return outcome
+            down_done = True
+            set_error, up_error = await self.netlink.transact([
+                netlink.build_link_message(index, attrs=address(mac)),
+                state(True)
+            ])
+            outcome['downtime_ms'] = round((time.perf_counter() - start) * 1000, 3)
+            for error, step in ((set_error, 'set MAC on'), (up_error, 'bring up')):
+                if error:
+                    self.logger.error(f"Failed to {step} {self.interface}: {os.strerror(error)}")
+            outcome['success'] = not (set_error or up_error)
+        except OSError as e:
+            self.logger.error(f"Failed to change MAC on {self.interface}: {e}")
+        
+        if down_done and not outcome['success']:
+            # set_error is None when the reply was lost: the new address may be in place
+            restore = old_mac if not set_error else None
+            messages = [state(True)]
+            if restore:
+                self.logger.error(f"Rolling back {self.interface} to {restore}")
+                messages[:0] = [state(False), netlink.build_link_message(index, attrs=address(restore))]
+            try:
+                errors = await self.netlink.transact(messages)
+            except OSError as e:
+                errors = [e.errno or errno.EIO]
+            if any(errors):
+                self.logger.error(f"Could not bring {self.interface} back up: "
+                                  f"{os.strerror(next(error for error in errors if error))}")
+            else:
+                outcome['rolled_back'] = bool(set_error or restore)
+        return outcome
+    
+    async def _apply_subprocess(self, mac: str, old_mac: Optional[str]) -> Dict:
+        """Down/set/up through asyncio subprocesses with rollback."""
+        outcome = MACBackend._outcome()
+        start = time.perf_counter()
+        if not await self._set_link_state(False):
+            return outcome
+        changed = await self._set_mac(mac)
+        up = await self._set_link_state(True)
+        if changed and not up and old_mac:
+            self.logger.error(f"{self.interface} did not come back up; rolling back to {old_mac}")
+            await self._set_link_state(False)
+            restored = await self._set_mac(old_mac)
+            outcome['rolled_back'] = await self._set_link_state(True) and restored
+            changed = False
+        outcome['downtime_ms'] = round((time.perf_counter() - start) * 1000, 3)
+        outcome['success'] = changed and up
+        return outcome
+    
+    async def _apply(self, mac: str, old_mac: Optional[str]) -> Dict:
+        if self.netlink:
+            return await self._apply_netlink(mac, old_mac)
+        return await self._apply_subprocess(mac, old_mac)
+    
+    async def _target_mac(self, mode: str, custom_mac: str = None, vendor: str = None) -> Optional[str]:
+        if mode == 'custom':
+            if not custom_mac or not MACAddressValidator.is_valid_mac(custom_mac):
+                self.logger.error(f"Invalid MAC address format: {custom_mac}")
+                return None
+            return MACAddressValidator.normalize_mac(custom_mac)
+        if mode == 'reset':
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.interface_manager.get_permanent_mac, self.interface)
+        try:
+            return self.generator.next(mode, vendor)
+        except ValueError as e:
+            self.logger.error(str(e))
+            return None
+    
+    async def rotate(self, mode: str = 'random', custom_mac: str = None,
+                     vendor: str = None) -> Tuple[bool, Optional[str]]:
+        """
+        Change the MAC without blocking the event loop.
         
         Args:
-            interface: Network interface name
+            mode: One of 'random', 'custom', 'vendor', 'sequence', 'reset'
+            custom_mac: Address for custom mode
+            vendor: Vendor name for vendor mode
             
         Returns:
-            True if successful
+            Tuple of (success, new_mac_address)
         """
+        target_mac = await self._target_mac(mode, custom_mac, vendor)
+        if not target_mac:
+            return False, None
+        
+        started = time.perf_counter()
+        backend = 'netlink' if self.netlink else 'subprocess'
+        loop = asyncio.get_running_loop()
+        # Read from the link, not the cache: this is the address journaled and rolled back to
+        old_mac = await self._get_mac()
+        self.interface_manager.cache.set(self.interface, 'current_mac', old_mac)
+        
+        watch = None
+        entry_id = None
+        if self.limiter:
+            # Blocking admission runs on the default executor, off the event loop
+            await loop.run_in_executor(None, self.limiter.acquire, self.interface)
         try:
-            subprocess.run(
-                ['ip', 'link', 'set', interface, 'up'],
-                check=True,
-                capture_output=True
-            )
-            if self.verbose:
-                self.logger.info(f"Interface {interface} brought up")
-            return True
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to bring up {interface}: {e}")
-            return False
+            # Subscribing binds a netlink socket and begin() fdatasyncs: both stay off the loop
+            watch = await loop.run_in_executor(None, self._watch)
+            if self.journal:
+                entry_id = await loop.run_in_executor(None, self.journal.begin, self.interface,
+                                                      old_mac, target_mac)
+            outcome = await self._apply(target_mac, old_mac)
+        except Exception as e:
+            self.logger.error(f"Failed to change MAC on {self.interface}: {e}")
+            outcome = MACBackend._outcome()
+        finally:
+            if self.limiter:
+                self.limiter.release()
+        
+        try:
+            self.interface_manager.cache.invalidate(self.interface, InterfaceStateCache.VOLATILE_FIELDS)
+            self.last_change = outcome
+            new_mac = None
+            if outcome['success']:
+                verify_start = time.perf_counter()
+                new_mac = await self._get_mac()
+                METRICS.observe('macspoofx_phase_seconds', time.perf_counter() - verify_start,
+                                ('verify', backend))
+                if new_mac != target_mac and old_mac:
+                    self.logger.error(f"Verification failed on {self.interface}: expected {target_mac}, "
+                                      f"found {new_mac}; rolling back to {old_mac}")
+                    outcome['success'] = False
+                    # Only a confirmed rollback ends the entry; otherwise recovery
+                    # restores old_mac from the begin record
+                    rollback_entry, entry_id = entry_id, None
+                    rollback = await self._apply(old_mac, None)
+                    self.interface_manager.cache.invalidate(self.interface, InterfaceStateCache.VOLATILE_FIELDS)
+                    outcome['rolled_back'] = rollback['success']
+                    if rollback_entry is not None:
+                        if rollback['success']:
+                            self.journal.end(rollback_entry)
+                        else:
+                            self.logger.error(f"Rollback of {self.interface} to {old_mac} failed; "
+                                              f"journal entry {rollback_entry} kept for recovery")
+        except Exception as e:
+            self.logger.error(f"Failed to verify MAC on {self.interface}: {e}")
+            outcome['success'] = False
+        finally:
+            if entry_id is not None:
+                self.journal.end(entry_id)
+        
+        if not outcome['success']:
+            if watch:
+                watch.events.close()
+            METRICS.inc('macspoofx_rotations_total', (mode, self.interface, 'failure'))
+            return False, None
+        
+        METRICS.observe('macspoofx_phase_seconds', time.perf_counter() - started, ('total', backend))
+        self.interface_manager.cache.set(self.interface, 'current_mac', new_mac)
+        self._log_change(mode, old_mac, new_mac, custom_mac if mode == 'custom' else None,
+                         outcome['downtime_ms'])
+        
+        if self.verbose and not self.stealth:
+            how = 'live' if outcome['live'] else f"{outcome['downtime_ms']} ms down"
+            print(f"{Fore.GREEN}[+] {self.interface}: MAC changed from {old_mac} to {new_mac} "
+                  f"({how}){Style.RESET_ALL}")
+        
+        # The watch blocks in select(), so it runs on the default executor
+        if watch and not await asyncio.get_running_loop().run_in_executor(None, self._converge, watch, outcome):
+            METRICS.inc('macspoofx_rotations_total', (mode, self.interface, 'failure'))
+            return False, new_mac
+        
+        METRICS.inc('macspoofx_rotations_total', (mode, self.interface, 'success'))
+        return True, new_mac
 
 
-class MACChanger:
+class BatchResult:
     """
-    Core MAC address spoofing engine using macchanger utility.
+    Result set of a batch rotation.
     
-    macchanger Integration:
-    - macchanger is a GNU/Linux utility for viewing/manipulating MAC addresses
-    - Supports random, specific, and vendor-specific MAC generation
-    - Operates by modifying the network interface controller's address in memory
-    - Changes are temporary and reset on reboot or interface restart
+    Each entry is a dictionary with the interface, mode, outcome, old and new
+    MAC, error text, link downtime and total duration in milliseconds.
+    """
     
-    Technical Process:
-    1. Interface must be brought down (ifconfig down or ip link set down)
-    2. macchanger modifies the MAC address in kernel space
-    3. Interface is brought back up
-    4. New MAC is active for all network communications
+    def __init__(self, results: List[Dict], elapsed: float):
+        self.results = sorted(results, key=lambda r: r['interface'])
+        self.elapsed = elapsed
+    
+    @property
+    def succeeded(self) -> List[Dict]:
+        return [r for r in self.results if r['success']]
+    
+    @property
+    def failed(self) -> List[Dict]:
+        return [r for r in self.results if not r['success']]
+    
+    def summary(self) -> Dict:
+        """Aggregate counts and latency percentiles."""
+        durations = sorted(r['duration_ms'] for r in self.results if r['duration_ms'] is not None)
+        
+        def percentile(p: float) -> Optional[float]:
+            if not durations:
+                return None
+            return round(durations[min(len(durations) - 1, int(p * len(durations)))], 2)
+        
+        return {
+            'jobs': len(self.results),
+            'succeeded': len(self.succeeded),
+            'failed': len(self.failed),
+            'timed_out': sum(1 for r in self.results if r['error'] == 'timeout'),
+            'elapsed_s': round(self.elapsed, 3),
+            'p50_ms': percentile(0.50),
+            'p99_ms': percentile(0.99),
+            'max_ms': round(durations[-1], 2) if durations else None
+        }
+
+
+class BatchRotator:
     """
+    Rotates MACs on many interfaces with a bounded worker pool.
     
-    def __init__(self, interface: str, verbose: bool = False, stealth: bool = False):
-        self.interface = interface
-        self.verbose = verbose
+    Jobs are dictionaries with 'interface' and optional 'mode', 'custom_mac'
+    and 'vendor' keys. At most max_workers rotations run at once; a job that
+    has not finished job_timeout seconds after it started is reported as
+    timed out and its late result is discarded.
+    
+    A timed-out job keeps running in its thread until the backend returns.
+    It is tracked as a straggler (see straggler() and drain()) so callers
+    can hold the interface, or wait for it before closing the journal and
+    history store it writes to.
+    """
+    
+    def __init__(self, backend: MACBackend, generator: MACGenerator,
+                 interface_manager: NetworkInterfaceManager, max_workers: int = 8,
+                 job_timeout: float = 30.0, stealth: bool = False, history=None,
+                 history_store: HistoryStore = None, exporter: HistoryExporter = None,
+                 verifier: ConvergenceVerifier = None, journal: ChangeJournal = None,
+                 limiter: AdmissionController = None):
+        self.backend = backend
+        self.generator = generator
+        self.interface_manager = interface_manager
+        self.max_workers = max(1, max_workers)
+        self.job_timeout = job_timeout
         self.stealth = stealth
+        self.history = history if history is not None else deque(maxlen=MACChanger.HISTORY_LIMIT)
+        self.history_store = history_store
+        self.exporter = exporter
+        self.verifier = verifier
+        self.journal = journal
+        self.limiter = limiter
         self.logger = logging.getLogger(__name__)
-        self.interface_manager = NetworkInterfaceManager(verbose)
-        self.history: List[Dict] = []
+        self.stragglers: Dict[str, futures.Future] = {}
+        self._straggler_lock = threading.Lock()
+        self._stopped = threading.Event()
     
-    def check_macchanger_installed(self) -> bool:
+    def stop(self):
+        """Skip jobs that have not started yet; running ones finish normally."""
+        self._stopped.set()
+    
+    def straggler(self, interface: str) -> Optional[futures.Future]:
+        """Future of a timed-out change still running on the interface, if any."""
+        with self._straggler_lock:
+            return self.stragglers.get(interface)
+    
+    def _add_straggler(self, interface: str, future: futures.Future):
+        def forget(done: futures.Future):
+            with self._straggler_lock:
+                if self.stragglers.get(interface) is done:
+                    del self.stragglers[interface]
+        
+        with self._straggler_lock:
+            self.stragglers[interface] = future
+        future.add_done_callback(forget)
+    
+    def drain(self, timeout: float = None) -> int:
         """
-        Verify macchanger is installed on the system.
+        Wait for timed-out changes that are still running.
         
         Returns:
-            True if macchanger is available
+            Number still running when the timeout expired
         """
+        with self._straggler_lock:
+            pending = list(self.stragglers.values())
+        if not pending:
+            return 0
+        _, not_done = futures.wait(pending, timeout=timeout)
+        return len(not_done)
+    
+    @staticmethod
+    def parse_spec(spec: str, default_mode: str = 'random') -> List[Dict]:
+        """
+        Parse an --interfaces specification.
+        
+        Items are comma separated and take the forms 'eth0' (default mode),
+        'eth0:vendor' (explicit mode) or 'eth0=00:11:22:33:44:55' (custom MAC).
+        
+        Args:
+            spec: Interface specification string
+            default_mode: Mode for items without one
+            
+        Returns:
+            List of job dictionaries
+        """
+        jobs = []
+        for item in spec.split(','):
+            item = item.strip()
+            if not item:
+                continue
+            if '=' in item:
+                interface, mac = item.split('=', 1)
+                jobs.append({'interface': interface, 'mode': 'custom', 'custom_mac': mac})
+            elif ':' in item:
+                interface, mode = item.split(':', 1)
+                jobs.append({'interface': interface, 'mode': mode})
+            else:
+                jobs.append({'interface': item, 'mode': default_mode})
+        return jobs
+    
+    def _run_job(self, job: Dict, started: Dict[int, float], index: int) -> Dict:
+        started[index] = time.monotonic()
+        changer = MACChanger(job['interface'], False, self.stealth, self.backend,
+                             self.generator, self.interface_manager, self.history_store, self.exporter,
+                             self.verifier, self.journal, self.limiter)
+        result = {
+            'interface': job['interface'],
+            'mode': job.get('mode', 'random'),
+            'success': False,
+            'old_mac': None,
+            'new_mac': None,
+            'error': None,
+            'downtime_ms': None,
+            'duration_ms': None
+        }
+        if self._stopped.is_set():
+            result['error'] = 'cancelled'
+            result['duration_ms'] = 0.0
+            return result
         try:
-            subprocess.run(
-                ['macchanger', '--version'],
-                capture_output=True,
-                check=True
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            self.logger.error("macchanger is not installed. Install with: apt install macchanger")
-            return False
+            success, new_mac = changer.change(result['mode'], job.get('custom_mac'), job.get('vendor'))
+            result['success'] = success
+            result['new_mac'] = new_mac
+            if changer.last_change:
+                result['downtime_ms'] = changer.last_change['downtime_ms']
+                if 'convergence' in changer.last_change:
+                    result['carrier_ms'] = changer.last_change['convergence']['carrier_ms']
+                    result['ip_ms'] = changer.last_change['convergence']['ip_ms']
+            if changer.history:
+                result['old_mac'] = changer.history[-1]['old_mac']
+                self.history.extend(changer.history)
+            if not success:
+                result['error'] = 'change failed'
+        except Exception as e:
+            self.logger.error(f"Batch job for {job['interface']} failed: {e}")
+            result['error'] = str(e)
+        result['duration_ms'] = round((time.monotonic() - started[index]) * 1000, 2)
+        return result
     
-    def change_mac_random(self) -> Tuple[bool, Optional[str]]:
+    def rotate(self, jobs: List[Dict]) -> BatchResult:
         """
-        Change MAC to a random address using macchanger.
+        Run the jobs and wait for all of them to finish or time out.
         
-        Process:
-        - Uses macchanger -r flag for fully random MAC
-        - Automatically handles interface down/up cycle
+        Args:
+            jobs: Job dictionaries (see parse_spec)
+            
+        Returns:
+            BatchResult with one entry per job
+        """
+        start = time.monotonic()
+        started: Dict[int, float] = {}
+        results = []
+        limited = bool(self.job_timeout and self.job_timeout > 0)
+        executor = futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='rotate')
+        try:
+            pending = {
+                executor.submit(self._run_job, job, started, i): (i, job)
+                for i, job in enumerate(jobs)
+            }
+            while pending:
+                timeout = None
+                if limited:
+                    # Nearest deadline of a started job; queued jobs cannot expire before now + job_timeout
+                    now = time.monotonic()
+                    deadlines = [started[i] + self.job_timeout for i, _ in pending.values() if i in started]
+                    timeout = max(0.0, min(deadlines, default=now + self.job_timeout) - now)
+                done, _ = futures.wait(list(pending), timeout=timeout, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    pending.pop(future)
+                    results.append(future.result())
+                
+                if limited:
+                    now = time.monotonic()
+                    for future, (i, job) in list(pending.items()):
+                        if i in started and now - started[i] >= self.job_timeout:
+                            pending.pop(future)
+                            if not future.cancel():
+                                self._add_straggler(job['interface'], future)
+                            self.logger.error(f"Rotation of {job['interface']} timed out")
+                            results.append({
+                                'interface': job['interface'],
+                                'mode': job.get('mode', 'random'),
+                                'success': False,
+                                'old_mac': None,
+                                'new_mac': None,
+                                'error': 'timeout',
+                                'downtime_ms': None,
+                                'duration_ms': round((now - started[i]) * 1000, 2)
+                            })
+        finally:
+            executor.shutdown(wait=False)
+        return BatchResult(results, time.monotonic() - start)
+
+
+class NamespaceRotator:
+    """
+    Rotates MACs across network namespaces with a process pool.
+    
+    Namespaces come from /run/netns (named, 'ip netns add') and
+    /proc/<pid>/ns/net (container and other unnamed namespaces),
+    deduplicated by namespace inode. Each namespace is one pool task: the
+    worker process enters it with setns(2) once and rotates all of its
+    target interfaces through an in-namespace BatchRotator, then returns
+    the results and history entries. No 'ip netns exec' process is forked
+    per interface.
+    
+    Workers only use namespace-scoped kernel interfaces (rtnetlink and
+    ioctl sockets opened after setns). History, export and display happen
+    in the parent, with interfaces recorded as 'name@namespace'.
+    
+    Each worker journals its changes (tagged with the namespace, so crash
+    recovery restores them in the right place) and gets an even share of
+    the --max-flap-rate/--max-down limits; the pool never has more
+    processes than --max-down slots.
+    """
+    
+    NETNS_DIR = '/run/netns'
+    CLONE_NEWNET = 0x40000000
+    
+    def __init__(self, args, max_workers: int = None):
+        self.args = args
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.logger = logging.getLogger(__name__)
+    
+    @classmethod
+    def enumerate(cls) -> List[Dict]:
+        """
+        List every network namespace on the host.
         
         Returns:
-            Tuple of (success, new_mac_address)
+            Dictionaries with 'name', 'path' and 'inode', named namespaces
+            first; unnamed ones are labelled 'pid:<lowest pid>' and the
+            caller's own namespace 'self'
         """
-        if not self.check_macchanger_installed():
-            return False, None
+        namespaces: Dict[Tuple[int, int], Dict] = {}
+        # The caller's pid, not /proc/self: pool workers resolve the path after their own setns
+        own_path = f'/proc/{os.getpid()}/ns/net'
+        own = os.stat(own_path)
+        namespaces[(own.st_dev, own.st_ino)] = {'name': 'self', 'path': own_path, 'inode': own.st_ino}
+        try:
+            names = sorted(os.listdir(cls.NETNS_DIR))
+        except OSError:
+            names = []
+        for name in names:
+            path = os.path.join(cls.NETNS_DIR, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            key = (st.st_dev, st.st_ino)
+            if key not in namespaces or namespaces[key]['name'] == 'self':
+                namespaces[key] = {'name': name, 'path': path, 'inode': st.st_ino}
+        
+        for pid in sorted(int(entry) for entry in os.listdir('/proc') if entry.isdigit()):
+            path = f'/proc/{pid}/ns/net'
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            namespaces.setdefault((st.st_dev, st.st_ino), {'name': f'pid:{pid}', 'path': path,
+                                                           'inode': st.st_ino})
+        return list(namespaces.values())
+    
+    @classmethod
+    def resolve(cls, spec: str) -> List[Dict]:
+        """
+        Resolve a --netns specification.
         
-        old_mac = self.interface_manager.get_current_mac(self.interface)
+        Items are comma separated: 'all', a name under /run/netns, a pid, or
+        a path to a namespace file.
         
+        Raises:
+            ValueError: If an item does not name an existing namespace
+        """
+        items = [item.strip() for item in spec.split(',') if item.strip()]
+        if 'all' in items:
+            return cls.enumerate()
+        
+        namespaces: Dict[Tuple[int, int], Dict] = {}
+        for item in items:
+            if item.isdigit():
+                path, name = f'/proc/{item}/ns/net', f'pid:{item}'
+            elif '/' in item:
+                path, name = item, item
+            else:
+                path, name = os.path.join(cls.NETNS_DIR, item), item
+            try:
+                st = os.stat(path)
+            except OSError as e:
+                raise ValueError(f"Unknown network namespace {item}: {e.strerror}")
+            namespaces.setdefault((st.st_dev, st.st_ino), {'name': name, 'path': path, 'inode': st.st_ino})
+        return list(namespaces.values())
+    
+    @classmethod
+    def setns(cls, path: str):
+        """Move the calling thread into the network namespace at path."""
+        fd = os.open(path, os.O_RDONLY)
         try:
-            # Bring interface down
-            if not self.interface_manager.interface_down(self.interface):
-                return False, None
-            
-            # Apply random MAC using macchanger
-            result = subprocess.run(
-                ['macchanger', '-r', self.interface],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            # Bring interface up
-            self.interface_manager.interface_up(self.interface)
-            
-            new_mac = self.interface_manager.get_current_mac(self.interface)
-            
-            # Log the change
-            self._log_change('random', old_mac, new_mac)
-            
-            if self.verbose and not self.stealth:
-                print(f"{Fore.GREEN}[+] MAC changed from {old_mac} to {new_mac}{Style.RESET_ALL}")
-            
-            return True, new_mac
-            
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"macchanger failed: {e}")
-            # Attempt to bring interface back up
-            self.interface_manager.interface_up(self.interface)
-            return False, None
+            if hasattr(os, 'setns'):
+                os.setns(fd, cls.CLONE_NEWNET)
+                return
+            libc = ctypes.CDLL(None, use_errno=True)
+            if libc.setns(fd, cls.CLONE_NEWNET) != 0:
+                error = ctypes.get_errno()
+                raise OSError(error, os.strerror(error))
+        finally:
+            os.close(fd)
     
-    def change_mac_custom(self, custom_mac: str) -> Tuple[bool, Optional[str]]:
+    @staticmethod
+    def run_worker(namespace: Dict, args, host_inode: int = None, share: int = 1) -> Dict:
         """
-        Change MAC to a specific custom address.
+        Pool task: enter one namespace and rotate its interfaces.
         
         Args:
-            custom_mac: Custom MAC address to set
+            namespace: Entry from enumerate()/resolve()
+            args: Parsed command-line arguments
+            host_inode: Inode of the parent's namespace (journaled untagged)
+            share: Number of pool processes splitting the admission limits
             
         Returns:
-            Tuple of (success, new_mac_address)
+            Dictionary with 'results' (BatchRotator entries tagged with
+            'netns'), 'history' entries and 'error'
         """
-        if not MACAddressValidator.is_valid_mac(custom_mac):
-            self.logger.error(f"Invalid MAC address format: {custom_mac}")
-            return False, None
+        outcome = {'netns': namespace['name'], 'results': [], 'history': [], 'error': None}
+        try:
+            NamespaceRotator.setns(namespace['path'])
+        except OSError as e:
+            outcome['error'] = f"setns failed: {e}"
+            return outcome
         
-        if not self.check_macchanger_installed():
-            return False, None
+        interface_manager = NetworkInterfaceManager(False, None, args.cache_ttl)
+        backend = create_backend(args.backend, False, interface_manager)
+        backend.allow_live = not args.no_live_change
+        oui_db = load_oui_database(args) if args.mode == 'vendor' else None
+        generator = create_generator(args, oui_db)
+        generator.guard = open_collision_guard(args)
+        verifier = ConvergenceVerifier(args.converge_deadline, True if args.require_ip else None) \
+            if args.converge else None
+        journal = open_journal(args, None if namespace['inode'] == host_inode else namespace['path'])
+        limiter = open_admission(args, share)
         
-        old_mac = self.interface_manager.get_current_mac(self.interface)
-        normalized_mac = MACAddressValidator.normalize_mac(custom_mac)
+        if args.interfaces:
+            jobs = BatchRotator.parse_spec(args.interfaces, args.mode)
+        elif args.interface:
+            jobs = [{'interface': args.interface, 'mode': args.mode}]
+        else:
+            jobs = [{'interface': name, 'mode': args.mode} for name in interface_manager.get_inventory()]
+        available = set(interface_manager.get_all_interfaces())
+        for job in jobs:
+            if job['mode'] == 'custom' and not job.get('custom_mac'):
+                job['custom_mac'] = args.custom_mac
+            job.setdefault('vendor', args.vendor)
         
+        rotator = BatchRotator(backend, generator, interface_manager, max_workers=args.workers,
+                               job_timeout=args.job_timeout, verifier=verifier, journal=journal,
+                               limiter=limiter)
         try:
-            # Bring interface down
-            if not self.interface_manager.interface_down(self.interface):
-                return False, None
-            
-            # Apply custom MAC using macchanger
-            result = subprocess.run(
-                ['macchanger', '-m', normalized_mac, self.interface],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            # Bring interface up
-            self.interface_manager.interface_up(self.interface)
-            
-            new_mac = self.interface_manager.get_current_mac(self.interface)
+            result = rotator.rotate([job for job in jobs if job['interface'] in available])
+        finally:
+            if verifier:
+                verifier.close()
+            if journal:
+                journal.close()
+        for r in result.results:
+            r['netns'] = namespace['name']
+        outcome['results'] = result.results
+        outcome['history'] = list(rotator.history)
+        return outcome
+    
+    def processes(self, namespaces: int) -> int:
+        """Pool size: one process per namespace, capped by max_workers and --max-down."""
+        count = min(self.max_workers, max(1, namespaces))
+        if self.args.max_down:
+            count = min(count, self.args.max_down)
+        return count
+    
+    def rotate(self, namespaces: List[Dict]) -> Tuple[BatchResult, List[Dict], List[Dict]]:
+        """
+        Run one task per namespace on the process pool.
+        
+        Returns:
+            Tuple of (aggregated BatchResult, history entries, per-namespace
+            errors as {'netns', 'error'} dictionaries)
+        """
+        start = time.monotonic()
+        results, history, errors = [], [], []
+        host_inode = os.stat(f'/proc/{os.getpid()}/ns/net').st_ino
+        processes = self.processes(len(namespaces))
+        # forkserver: workers start from a clean process, not a fork of this threaded one
+        context = multiprocessing.get_context('forkserver')
+        with futures.ProcessPoolExecutor(max_workers=processes, mp_context=context) as executor:
+            pending = {executor.submit(NamespaceRotator.run_worker, namespace, self.args, host_inode, processes):
+                       namespace for namespace in namespaces}
+            for future in futures.as_completed(pending):
+                namespace = pending[future]
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    self.logger.error(f"Namespace {namespace['name']} failed: {e}")
+                    errors.append({'netns': namespace['name'], 'error': str(e)})
+                    continue
+                if outcome['error']:
+                    errors.append({'netns': outcome['netns'], 'error': outcome['error']})
+                results.extend(outcome['results'])
+                for entry in outcome['history']:
+                    entry['interface'] = f"{entry['interface']}@{outcome['netns']}"
+                    history.append(entry)
+        result = BatchResult(results, time.monotonic() - start)
+        result.results.sort(key=lambda r: (r['netns'], r['interface']))
+        return result, history, errors
+
+
+class DeadlineScheduler:
+    """
+    Heap-based deadline scheduler for rotation timers.
+    
+    The scheduler sleeps exactly until the earliest due job (no polling),
+    supports fractional and per-job intervals, and randomizes each firing
+    within +/- jitter seconds of its nominal deadline. Deadlines are
+    absolute, so the time a rotation takes never accumulates as drift.
+    
+    Missed deadline policies:
+    - skip: drop missed slots and continue on the original grid
+    - catchup: run every missed slot back to back
+    """
+    
+    POLICIES = ('skip', 'catchup')
+    
+    def __init__(self, missed_policy: str = 'skip'):
+        if missed_policy not in self.POLICIES:
+            raise ValueError(f"Unknown missed deadline policy: {missed_policy}")
+        self.missed_policy = missed_policy
+        self.logger = logging.getLogger(__name__)
+        self.jobs: Dict[str, Dict] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._counter = 0
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+    
+    def _push(self, deadline: float, name: str):
+        self._counter += 1
+        heapq.heappush(self._heap, (deadline, self._counter, name))
+    
+    def _jittered(self, job: Dict) -> float:
+        if not job['jitter']:
+            return job['nominal']
+        return job['nominal'] + random.uniform(-job['jitter'], job['jitter'])
+    
+    def add(self, name: str, callback, interval: float, jitter: float = 0.0, delay: float = 0.0):
+        """
+        Register a recurring job.
+        
+        Args:
+            name: Unique job name (e.g. interface name)
+            callback: Callable run at each deadline
+            interval: Seconds between runs (fractions allowed)
+            jitter: Maximum random offset applied to each run, in seconds
+            delay: Seconds until the first run
+        """
+        if interval <= 0:
+            raise ValueError("Interval must be positive")
+        with self._lock:
+            job = {
+                'name': name,
+                'callback': callback,
+                'interval': interval,
+                'jitter': min(jitter, interval / 2),
+                'nominal': time.monotonic() + delay,
+                'runs': 0,
+                'missed': 0,
+                'drift_total': 0.0,
+                'drift_max': 0.0,
+                'drift_samples': deque(maxlen=1024)
+            }
+            self.jobs[name] = job
+            self._push(self._jittered(job), name)
+        self._wakeup.set()
+    
+    def remove(self, name: str):
+        """Unregister a job; its pending heap entry is discarded lazily."""
+        with self._lock:
+            self.jobs.pop(name, None)
+        self._wakeup.set()
+    
+    def stop(self):
+        """Stop run() at the next wakeup."""
+        self._stopped.set()
+        self._wakeup.set()
+    
+    def run(self):
+        """Run jobs until stop() is called or no jobs remain."""
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            with self._lock:
+                while self._heap and self._heap[0][2] not in self.jobs:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    return
+                deadline, _, name = self._heap[0]
             
-            # Log the change
-            self._log_change('custom', old_mac, new_mac, custom_mac)
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                self._wakeup.clear()
+                if self._wakeup.wait(delay):
+                    continue
             
-            if self.verbose and not self.stealth:
-                print(f"{Fore.GREEN}[+] MAC changed from {old_mac} to {new_mac}{Style.RESET_ALL}")
+            with self._lock:
+                if not self._heap or self._heap[0][2] != name or name not in self.jobs:
+                    continue
+                heapq.heappop(self._heap)
+                job = self.jobs[name]
             
-            return True, new_mac
+            started = time.monotonic()
+            self._record_drift(job, started - deadline)
+            METRICS.observe('macspoofx_scheduler_lag_seconds', max(0.0, started - deadline))
+            try:
+                job['callback']()
+            except Exception as e:
+                self.logger.error(f"Scheduled job {name} failed: {e}")
             
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"macchanger failed: {e}")
-            self.interface_manager.interface_up(self.interface)
-            return False, None
+            with self._lock:
+                if name not in self.jobs:
+                    continue
+                job['nominal'] += job['interval']
+                now = time.monotonic()
+                if job['nominal'] < now:
+                    behind = int((now - job['nominal']) // job['interval']) + 1
+                    if self.missed_policy == 'skip':
+                        job['missed'] += behind
+                        METRICS.inc('macspoofx_scheduler_missed_total', amount=behind)
+                        job['nominal'] += behind * job['interval']
+                self._push(self._jittered(job), name)
     
-    def change_mac_vendor(self, vendor: str = None) -> Tuple[bool, Optional[str]]:
+    @staticmethod
+    def _record_drift(job: Dict, drift: float):
+        drift = max(0.0, drift)
+        job['runs'] += 1
+        job['drift_total'] += drift
+        job['drift_max'] = max(job['drift_max'], drift)
+        job['drift_samples'].append(drift)
+    
+    def stats(self) -> Dict:
+        """
+        Drift statistics across all jobs, in milliseconds.
+        
+        Returns:
+            Dictionary with run/missed counts and mean, p99 and max drift
+        """
+        with self._lock:
+            jobs = list(self.jobs.values())
+        runs = sum(job['runs'] for job in jobs)
+        samples = sorted(s for job in jobs for s in job['drift_samples'])
+        return {
+            'jobs': len(jobs),
+            'runs': runs,
+            'missed': sum(job['missed'] for job in jobs),
+            'drift_mean_ms': round(sum(job['drift_total'] for job in jobs) / runs * 1000, 3) if runs else None,
+            'drift_p99_ms': round(samples[min(len(samples) - 1, int(0.99 * len(samples)))] * 1000, 3) if samples else None,
+            'drift_max_ms': round(max(job['drift_max'] for job in jobs) * 1000, 3) if jobs else None
+        }
+
+
+class RotationDaemon:
+    """
+    Long-running rotation service behind a local Unix domain socket.
+    
+    Keeps the interface cache, backend, generator and history store warm so
+    a rotation costs one socket round trip instead of a fresh process.
+    
+    Protocol (JSON lines, one request and one response per line):
+        -> {"cmd": "rotate", "interface": "eth0", "mode": "random"}
+        <- {"ok": true, "result": [{"interface": "eth0", "new_mac": ...}]}
+    
+    Commands:
+    - rotate: interface or interfaces, optional mode, custom_mac, vendor
+    - reset: interface or interfaces
+    - status: optional interface
+    - history: optional interface, since, until, limit (newest rows)
+    
+    Failures are answered with {"ok": false, "error": "..."}; an "id" in the
+    request is echoed back. The socket is created mode 0600 (root only).
+    """
+    
+    COMMANDS = ('rotate', 'reset', 'status', 'history')
+    DEFAULT_SOCKET = '/run/macspoofx.sock'
+    
+    def __init__(self, app: 'MacSpoofX', socket_path: str = None):
+        self.app = app
+        self.socket_path = socket_path or self.DEFAULT_SOCKET
+        self.logger = logging.getLogger(__name__)
+        self.rotator = BatchRotator(
+            app.backend, app.generator, app.interface_manager,
+            max_workers=app.args.workers,
+            job_timeout=app.args.job_timeout,
+            stealth=app.stealth,
+            history=app.mac_changer.history,
+            history_store=app.history_store,
+            exporter=app.exporter,
+            verifier=app.verifier,
+            journal=app.journal,
+            limiter=app.limiter
+        )
+        app.rotators.append(self.rotator)
+        self.locks: Dict[str, threading.Lock] = {}
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        self.rotations = 0
+        self.server = None
+        self.active = 0
+        self.stopping = False
+        self._idle = threading.Condition(self.lock)
+    
+    def _interface_lock(self, interface: str) -> threading.Lock:
+        with self.lock:
+            return self.locks.setdefault(interface, threading.Lock())
+    
+    @staticmethod
+    def _interfaces(request: Dict, default: Optional[str]) -> List[str]:
+        interfaces = request.get('interfaces') or ([request['interface']] if request.get('interface') else [])
+        if not isinstance(interfaces, list) or not all(isinstance(name, str) and name for name in interfaces):
+            raise ValueError('interfaces must be a list of interface names')
+        if not interfaces and default:
+            interfaces = [default]
+        if not interfaces:
+            raise ValueError('no interface given')
+        return list(dict.fromkeys(interfaces))
+    
+    def handle(self, request: Dict) -> Dict:
         """
-        Change MAC to a vendor-specific address using macchanger.
+        Execute one protocol request.
         
         Args:
-            vendor: Vendor name (optional, random vendor if None)
+            request: Decoded request object
             
         Returns:
-            Tuple of (success, new_mac_address)
+            Response object
         """
-        if not self.check_macchanger_installed():
-            return False, None
+        with self.lock:
+            self.requests += 1
+            stopping = self.stopping
+            if not stopping:
+                self.active += 1
+        cmd = request.get('cmd')
+        if stopping:
+            response = {'ok': False, 'error': 'daemon is shutting down'}
+        else:
+            try:
+                if cmd not in self.COMMANDS:
+                    response = {'ok': False, 'error': f"unknown command: {cmd!r}"}
+                else:
+                    response = {'ok': True, 'result': getattr(self, f'cmd_{cmd}')(request)}
+            except (ValueError, KeyError, TypeError, OSError) as e:
+                response = {'ok': False, 'error': str(e)}
+            except Exception as e:
+                # A bug in one command must not kill the connection handler
+                self.logger.exception(f"Daemon command {cmd!r} failed")
+                response = {'ok': False, 'error': f"internal error: {e}"}
+            finally:
+                with self.lock:
+                    self.active -= 1
+                    self._idle.notify_all()
+        if 'id' in request:
+            response['id'] = request['id']
+        return response
+    
+    def cmd_rotate(self, request: Dict) -> List[Dict]:
+        mode = request.get('mode') or self.app.mode
+        if mode == 'custom' and not request.get('custom_mac'):
+            raise ValueError('custom mode requires custom_mac')
+        jobs = [{'interface': interface, 'mode': mode, 'custom_mac': request.get('custom_mac'),
+                 'vendor': request.get('vendor') or self.app.args.vendor}
+                for interface in self._interfaces(request, self.app.interface)]
         
-        old_mac = self.interface_manager.get_current_mac(self.interface)
+        if self.app.stealth and mode != 'reset':
+            self.app.iptables_manager.enable_stealth_mode_batch([job['interface'] for job in jobs])
         
+        # Sorted acquisition so overlapping multi-interface requests cannot deadlock
+        interfaces = sorted(job['interface'] for job in jobs)
+        locks = [self._interface_lock(interface) for interface in interfaces]
+        for lock in locks:
+            lock.acquire()
         try:
-            if not self.interface_manager.interface_down(self.interface):
-                return False, None
-            
-            flag = '-a'
-            result = subprocess.run(
-                ['macchanger', flag, self.interface],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            self.interface_manager.interface_up(self.interface)
-            new_mac = self.interface_manager.get_current_mac(self.interface)
-            self._log_change('vendor', old_mac, new_mac)
-            
-            if self.verbose and not self.stealth:
-                print(f"{Fore.GREEN}[+] MAC changed from {old_mac} to {new_mac}{Style.RESET_ALL}")
-            
-            return True, new_mac
-            
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"macchanger failed: {e}")
-            self.interface_manager.interface_up(self.interface)
-            return False, None
+            result = self.rotator.rotate(jobs)
+        finally:
+            for interface, lock in reversed(list(zip(interfaces, locks))):
+                # A timed-out change still owns its interface until it really finishes
+                straggler = self.rotator.straggler(interface)
+                if straggler:
+                    straggler.add_done_callback(lambda _done, lock=lock: lock.release())
+                else:
+                    lock.release()
+        
+        with self.lock:
+            self.rotations += len(result.succeeded)
+        return result.results
     
-    def change_mac_sequence(self) -> Tuple[bool, Optional[str]]:
-        """Change MAC using sequential generation."""
-        return self.change_mac_random()
+    def cmd_reset(self, request: Dict) -> List[Dict]:
+        return self.cmd_rotate(dict(request, mode='reset'))
+    
+    def cmd_status(self, request: Dict) -> Dict:
+        status = {
+            'pid': os.getpid(),
+            'uptime_s': round(time.time() - self.started, 1),
+            'backend': self.app.backend.name,
+            'requests': self.requests,
+            'rotations': self.rotations,
+            'cache': {'hits': self.app.interface_manager.cache.hits,
+                      'misses': self.app.interface_manager.cache.misses},
+        }
+        interfaces = self._interfaces(request, self.app.interface)
+        status['interfaces'] = {
+            interface: self.app.interface_manager.get_interface_info(interface) for interface in interfaces
+        }
+        return status
+    
+    def cmd_history(self, request: Dict) -> List[Dict]:
+        limit = int(request.get('limit') or 100)
+        interface = request.get('interface')
+        if self.app.history_store:
+            rows = list(self.app.history_store.query(interface, request.get('since'), request.get('until'),
+                                                     limit, descending=True))
+            rows.reverse()
+            return rows
+        rows = [entry for entry in self.app.mac_changer.get_history()
+                if not interface or entry['interface'] == interface]
+        return rows[-limit:]
     
-    def reset_mac(self) -> Tuple[bool, Optional[str]]:
-        """
-        Reset MAC to permanent hardware address.
+    def _bind(self):
+        """Bind the control socket, replacing a stale one left by a crashed daemon."""
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+                raise OSError(errno.EADDRINUSE, f"daemon already running on {self.socket_path}")
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(self.socket_path)
+            finally:
+                probe.close()
         
-        Returns:
-            Tuple of (success, permanent_mac_address)
-        """
-        if not self.check_macchanger_installed():
-            return False, None
+        daemon = self
         
-        old_mac = self.interface_manager.get_current_mac(self.interface)
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    try:
+                        request = json.loads(line)
+                        if not isinstance(request, dict):
+                            raise ValueError('request must be a JSON object')
+                        response = daemon.handle(request)
+                    except ValueError as e:
+                        response = {'ok': False, 'error': f"bad request: {e}"}
+                    self.wfile.write(json.dumps(response).encode() + b'\n')
+                    self.wfile.flush()
         
+        os.makedirs(os.path.dirname(self.socket_path) or '.', exist_ok=True)
+        umask = os.umask(0o077)
         try:
-            if not self.interface_manager.interface_down(self.interface):
-                return False, None
-            
-            result = subprocess.run(
-                ['macchanger', '-p', self.interface],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            self.interface_manager.interface_up(self.interface)
-            new_mac = self.interface_manager.get_current_mac(self.interface)
-            self._log_change('reset', old_mac, new_mac)
-            
-            if self.verbose and not self.stealth:
-                print(f"{Fore.GREEN}[+] MAC reset from {old_mac} to {new_mac}{Style.RESET_ALL}")
-            
-            return True, new_mac
-            
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"macchanger reset failed: {e}")
-            self.interface_manager.interface_up(self.interface)
-            return False, None
+            self.server = socketserver.ThreadingUnixStreamServer(self.socket_path, Handler)
+        finally:
+            os.umask(umask)
+        self.server.daemon_threads = True
     
-    def _log_change(self, mode: str, old_mac: str, new_mac: str, custom_mac: str = None):
-        """Log MAC address change to history."""
-        entry = {
-            'timestamp': datetime.now().isoformat(),
-            'interface': self.interface,
-            'mode': mode,
-            'old_mac': old_mac,
-            'new_mac': new_mac,
-            'custom_mac': custom_mac
-        }
-        self.history.append(entry)
+    def serve(self):
+        """Serve requests until stop() is called or the process is signalled."""
+        self._bind()
+        print(f"{Fore.GREEN}[+] Daemon listening on {self.socket_path} (pid {os.getpid()}){Style.RESET_ALL}")
+        self.logger.info(f"Daemon listening on {self.socket_path}")
+        try:
+            self.server.serve_forever(poll_interval=0.5)
+        finally:
+            self.close()
     
-    def get_history(self) -> List[Dict]:
-        """Get MAC change history."""
-        return self.history
+    def stop(self):
+        """Ask serve() to return and refuse new requests; safe to call from another thread."""
+        with self.lock:
+            self.stopping = True
+        if self.server:
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+    
+    def wait_idle(self):
+        """Block until no request is being executed."""
+        with self.lock:
+            while self.active:
+                self._idle.wait()
+    
+    def close(self):
+        """Close the listening socket and remove its path."""
+        if self.server:
+            self.server.server_close()
+            self.server = None
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+
+
+class DaemonClient:
+    """Thin client for RotationDaemon: one JSON line out, one JSON line back."""
+    
+    def __init__(self, socket_path: str = None, timeout: float = 60.0):
+        self.socket_path = socket_path or RotationDaemon.DEFAULT_SOCKET
+        self.timeout = timeout
+        self._sock = None
+        self._reader = None
+    
+    def connect(self):
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(self.timeout)
+        self._sock.connect(self.socket_path)
+        self._reader = self._sock.makefile('rb')
+    
+    def request(self, cmd: str, **params) -> Dict:
+        """
+        Send one command and wait for its response.
+        
+        Args:
+            cmd: Command name (see RotationDaemon.COMMANDS)
+            **params: Command parameters; None values are omitted
+            
+        Returns:
+            Response object with 'ok' and 'result' or 'error'
+        """
+        if self._sock is None:
+            self.connect()
+        payload = {'cmd': cmd, **{k: v for k, v in params.items() if v is not None}}
+        self._sock.sendall(json.dumps(payload).encode() + b'\n')
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError('daemon closed the connection')
+        return json.loads(line)
+    
+    def close(self):
+        if self._sock:
+            self._reader.close()
+            self._sock.close()
+            self._sock = None
 
 
 class IPTablesManager:
     """
-    Manages iptables rules for advanced MAC spoofing scenarios.
+    Manages the stealth firewall rules applied during and after spoofing.
     
-    iptables Integration:
-    - iptables is a user-space utility for configuring Linux kernel firewall
-    - Can filter packets based on MAC addresses at the netfilter level
-    - Useful for preventing MAC address leakage or implementing stealth mode
-    - Rules operate at Layer 2/3 boundary for maximum control
+    A fresh MAC announces itself through discovery protocols as soon as the
+    link comes back. Stealth mode drops that outbound chatter on the spoofed
+    interfaces:
+    - LLMNR (UDP/TCP 5355), mDNS (UDP 5353), SSDP (UDP 1900)
+    - NetBIOS name and datagram services (UDP 137, 138)
+    
+    Engines:
+    - nftables (preferred): a private 'inet macspoofx' table whose output
+      chain matches a named set of interfaces. Enabling interfaces adds set
+      elements; the table is created on first use in the same atomic
+      'nft -f' batch
+    - iptables: a private MACSPOOFX_STEALTH chain, jumped to from OUTPUT,
+      rewritten as a whole with iptables-restore --noflush (and
+      ip6tables-restore for IPv6 mDNS/LLMNR)
+    
+    Rules are applied before the change and are idempotent, so enabling
+    many interfaces costs one batch and clear_rules() removes exactly the
+    private table or chain in one call per family, however many
+    interfaces were covered.
     """
     
-    def __init__(self, verbose: bool = False):
+    TABLE = 'macspoofx'
+    CHAIN = 'MACSPOOFX_STEALTH'
+    UDP_PORTS = (137, 138, 1900, 5353, 5355)
+    TCP_PORTS = (5355,)
+    
+    def __init__(self, verbose: bool = False, engine: str = 'auto'):
         self.verbose = verbose
         self.logger = logging.getLogger(__name__)
+        self.engine = self._detect_engine() if engine == 'auto' else engine
+        self.interfaces: set = set()
         self.applied_rules: List[str] = []
+        self._installed = False
+        self.lock = threading.Lock()
+    
+    @staticmethod
+    def _detect_engine() -> Optional[str]:
+        if shutil.which('nft'):
+            return 'nftables'
+        if shutil.which('iptables-restore'):
+            return 'iptables'
+        return None
     
     def check_iptables_installed(self) -> bool:
-        """Verify iptables is installed."""
+        """Verify a supported firewall tool (nft or iptables-restore) is installed."""
+        if not self.engine:
+            self.logger.error("Neither nft nor iptables-restore found")
+            return False
+        return True
+    
+    def _run(self, command: List[str], script: str) -> bool:
         try:
-            subprocess.run(['iptables', '--version'], capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            self.logger.error("iptables not found")
+            result = run_command(command, input=script, capture_output=True, text=True)
+        except FileNotFoundError:
+            self.logger.error(f"{command[0]} not found")
             return False
+        if result.returncode != 0:
+            self.logger.error(f"{' '.join(command)} failed: {result.stderr.strip()}")
+            return False
+        return True
+    
+    @staticmethod
+    def _ports(ports: Tuple[int, ...]) -> str:
+        return ', '.join(str(port) for port in ports)
+    
+    def _nft_script(self, interfaces: List[str]) -> str:
+        lines = []
+        if not self._installed:
+            # add+delete makes the definition idempotent across crashed runs
+            lines += [
+                f"add table inet {self.TABLE}",
+                f"delete table inet {self.TABLE}",
+                f"table inet {self.TABLE} {{",
+                "    set stealth_ifaces { type ifname; }",
+                "    chain stealth_out {",
+                "        type filter hook output priority 0; policy accept;",
+                f"        oifname @stealth_ifaces udp dport {{ {self._ports(self.UDP_PORTS)} }} drop",
+                f"        oifname @stealth_ifaces tcp dport {{ {self._ports(self.TCP_PORTS)} }} drop",
+                "    }",
+                "}",
+            ]
+        names = ', '.join(json.dumps(interface) for interface in interfaces)
+        lines.append(f"add element inet {self.TABLE} stealth_ifaces {{ {names} }}")
+        return '\n'.join(lines) + '\n'
+    
+    def _iptables_script(self, interfaces: List[str]) -> str:
+        lines = ['*filter', f':{self.CHAIN} - [0:0]']
+        if not self._installed:
+            lines.append(f'-I OUTPUT -j {self.CHAIN}')
+        udp = ','.join(str(port) for port in self.UDP_PORTS)
+        tcp = ','.join(str(port) for port in self.TCP_PORTS)
+        for interface in interfaces:
+            lines.append(f'-A {self.CHAIN} -o {interface} -p udp -m multiport --dports {udp} -j DROP')
+            lines.append(f'-A {self.CHAIN} -o {interface} -p tcp -m multiport --dports {tcp} -j DROP')
+        lines.append('COMMIT')
+        return '\n'.join(lines) + '\n'
+    
+    def _iptables_families(self):
+        families = [('iptables', 'iptables-restore')]
+        if shutil.which('ip6tables-restore'):
+            families.append(('ip6tables', 'ip6tables-restore'))
+        return families
     
     def enable_stealth_mode(self, interface: str) -> bool:
-        """Enable stealth mode by limiting broadcast traffic."""
+        """Enable stealth mode on one interface (see enable_stealth_mode_batch)."""
+        return self.enable_stealth_mode_batch([interface])
+    
+    def enable_stealth_mode_batch(self, interfaces: List[str]) -> bool:
+        """
+        Drop outbound discovery traffic on the interfaces in one atomic batch.
+        
+        Args:
+            interfaces: Interface names; already covered ones are skipped
+            
+        Returns:
+            True if the rules are in place
+        """
         if not self.check_iptables_installed():
             return False
         
+        with self.lock:
+            new = [i for i in dict.fromkeys(interfaces) if i and i not in self.interfaces]
+            if not new:
+                return True
+            
+            if self.engine == 'nftables':
+                script = self._nft_script(new)
+                ok = self._run(['nft', '-f', '-'], script)
+            else:
+                # The chain declaration flushes it, so the full rule set is rewritten
+                covered = sorted(self.interfaces | set(new))
+                script = self._iptables_script(covered)
+                ok = True
+                for tool, restore in self._iptables_families():
+                    if not self._installed and run_command([tool, '-C', 'OUTPUT', '-j', self.CHAIN],
+                                                           capture_output=True).returncode == 0:
+                        # Jump left behind by an earlier run: keep it, do not duplicate it
+                        ok = self._run([restore, '--noflush'], script.replace(f'-I OUTPUT -j {self.CHAIN}\n', '')) and ok
+                    else:
+                        ok = self._run([restore, '--noflush'], script) and ok
+            
+            if not ok:
+                return False
+            self._installed = True
+            self.interfaces.update(new)
+            self.applied_rules.append(script)
+        
         if self.verbose:
-            self.logger.info(f"Stealth mode enabled on {interface}")
+            self.logger.info(f"Stealth mode enabled on {', '.join(new)} ({self.engine})")
         return True
     
     def clear_rules(self) -> bool:
-        """Clear all applied iptables rules."""
-        try:
-            self.applied_rules.clear()
-            if self.verbose:
-                self.logger.info("Cleared all iptables rules")
-            return True
-        except Exception as e:
-            self.logger.error(f"Error clearing iptables rules: {e}")
-            return False
+        """Remove everything stealth mode added, in one call per address family."""
+        with self.lock:
+            if not self._installed:
+                self.applied_rules.clear()
+                return True
+            
+            if self.engine == 'nftables':
+                ok = self._run(['nft', '-f', '-'], f"delete table inet {self.TABLE}\n")
+            else:
+                script = (f'*filter\n-D OUTPUT -j {self.CHAIN}\n-F {self.CHAIN}\n'
+                          f'-X {self.CHAIN}\nCOMMIT\n')
+                ok = True
+                for _tool, restore in self._iptables_families():
+                    ok = self._run([restore, '--noflush'], script) and ok
+            
+            if ok:
+                self._installed = False
+                self.interfaces.clear()
+                self.applied_rules.clear()
+                if self.verbose:
+                    self.logger.info("Cleared all stealth rules")
+            return ok
 
 
-class OutputManager:
-    """Handles output formatting and export to various formats (JSON, CSV, table)."""
+class TableRenderer:
+    """
+    Streaming ASCII table renderer.
+    
+    Unlike building a whole table in memory before printing, rows are
+    written as they arrive from the source:
+    - Column widths come from a fixed schema (widths) when given, otherwise
+      from the first sample_size rows, which are the only rows buffered
+    - Values wider than their column are truncated with '~'
+    - limit/offset page through the source without rendering skipped rows
+    - plain mode writes tab-separated values with no width computation,
+      for scripts and pipes
+    """
+    
+    def __init__(self, title: str = None, fields: List[str] = None, widths: Dict[str, int] = None,
+                 sample_size: int = 64, max_width: int = 40, plain: bool = False, stream=None):
+        self.title = title
+        self.fields = list(fields) if fields else None
+        self.widths = dict(widths) if widths else None
+        self.sample_size = sample_size
+        self.max_width = max_width
+        self.plain = plain
+        self.stream = stream or sys.stdout
     
     @staticmethod
-    def print_table(data: List[Dict], title: str = "Results"):
-        """Print data in formatted table using PrettyTable."""
-        if not data:
-            print(f"{Fore.YELLOW}[!] No data to display{Style.RESET_ALL}")
-            return
+    def _text(value) -> str:
+        return '' if value is None else str(value)
+    
+    def _cell(self, value, width: int) -> str:
+        text = str(value)
+        if len(text) > width:
+            text = text[:width - 1] + '~'
+        return text.center(width)
+    
+    def _line(self, cells: List[str]) -> str:
+        return '| ' + ' | '.join(cells) + ' |\n'
+    
+    def render(self, rows: Iterable[Dict], limit: int = None, offset: int = 0) -> int:
+        """
+        Render rows from an iterable.
+        
+        Args:
+            rows: Row dictionaries
+            limit: Maximum number of rows to render
+            offset: Rows to skip first
+            
+        Returns:
+            Number of rows rendered
+        """
+        stop = offset + limit if limit is not None else None
+        rows = islice(rows, offset, stop)
+        write = self.stream.write
+        
+        if self.plain:
+            return self._render_plain(rows)
         
-        table = PrettyTable()
-        table.title = title
-        table.field_names = list(data[0].keys())
+        # A fixed schema only needs the first row, to avoid framing an empty table
+        sample = list(islice(rows, 1 if self.fields and self.widths else self.sample_size))
+        if not sample:
+            return 0
+        fields = self.fields or list(dict.fromkeys(key for row in sample for key in row))
+        widths = {field: len(field) for field in fields}
+        if self.widths:
+            widths.update(self.widths)
+        else:
+            for row in sample:
+                for field in fields:
+                    widths[field] = max(widths[field], len(str(row.get(field))))
+            for field in fields:
+                widths[field] = min(widths[field], max(self.max_width, len(field)))
+        column_widths = [widths[field] for field in fields]
+        
+        border = '+' + '+'.join('-' * (w + 2) for w in column_widths) + '+\n'
+        if self.title:
+            inner = len(border) - 5
+            write('+' + '-' * (inner + 2) + '+\n')
+            write('| ' + self._cell(self.title, inner) + ' |\n')
+        write(border)
+        write(self._line([self._cell(field, w) for field, w in zip(fields, column_widths)]))
+        write(border)
         
-        for entry in data:
-            table.add_row(list(entry.values()))
+        count = 0
+        for count, row in enumerate(chain(sample, rows), 1):
+            write(self._line([self._cell(row.get(field), w) for field, w in zip(fields, column_widths)]))
+            if count == len(sample):
+                self.stream.flush()
+        write(border)
+        self.stream.flush()
+        return count
+    
+    def _render_plain(self, rows) -> int:
+        write = self.stream.write
+        fields = self.fields
+        count = 0
+        for count, row in enumerate(rows, 1):
+            if count == 1:
+                fields = fields or list(row)
+                write('\t'.join(fields) + '\n')
+            write('\t'.join(self._text(row.get(field)) for field in fields) + '\n')
+        self.stream.flush()
+        return count
+
+
+class OutputManager:
+    """Handles output formatting and export to various formats (JSON, CSV, table)."""
+    
+    # Fixed schema for history tables, so rows stream without sampling
+    HISTORY_WIDTHS = {
+        'timestamp': 26, 'interface': 9, 'mode': 8, 'old_mac': 17,
+        'new_mac': 17, 'custom_mac': 17, 'downtime_ms': 11,
+    }
+    
+    @staticmethod
+    def print_table(data: Iterable[Dict], title: str = "Results", fields: List[str] = None,
+                    widths: Dict[str, int] = None, limit: int = None, offset: int = 0,
+                    plain: bool = False) -> int:
+        """
+        Print rows as a table while they are produced.
         
-        print(table)
+        Args:
+            data: Row dictionaries (any iterable, consumed once)
+            title: Table title (omitted in plain mode)
+            fields: Column order; taken from the rows when omitted
+            widths: Fixed column widths; sampled from the rows when omitted
+            limit: Maximum number of rows to print
+            offset: Rows to skip first
+            plain: Tab-separated output without formatting
+            
+        Returns:
+            Number of rows printed
+        """
+        renderer = TableRenderer(title, fields, widths, plain=plain)
+        count = renderer.render(data, limit, offset)
+        if not count and not plain:
+            print(f"{Fore.YELLOW}[!] No data to display{Style.RESET_ALL}")
+        return count
+    
+    @classmethod
+    def print_history(cls, data: Iterable[Dict], title: str = "MAC Change History",
+                      limit: int = None, offset: int = 0, plain: bool = False) -> int:
+        """Print history rows using the fixed history schema."""
+        return cls.print_table(data, title, list(cls.HISTORY_WIDTHS), cls.HISTORY_WIDTHS,
+                               limit, offset, plain)
     
     @staticmethod
-    def export_json(data: List[Dict], filepath: str) -> bool:
-        """Export data to JSON file."""
+    def export_json(data: Iterable[Dict], filepath: str) -> bool:
+        """Export data to a JSON array file, writing one record at a time."""
+        count = 0
         try:
             with open(filepath, 'w') as f:
-                json.dump(data, f, indent=4)
+                f.write('[')
+                for count, entry in enumerate(data, 1):
+                    f.write(',\n    ' if count > 1 else '\n    ')
+                    f.write(json.dumps(entry))
+                f.write('\n]\n' if count else ']\n')
+            if not count:
+                print(f"{Fore.YELLOW}[!] No data to export{Style.RESET_ALL}")
+                return False
             print(f"{Fore.GREEN}[+] Data exported to {filepath}{Style.RESET_ALL}")
             return True
         except Exception as e:
@@ -639,16 +6189,21 @@ class OutputManager:
             return False
     
     @staticmethod
-    def export_csv(data: List[Dict], filepath: str) -> bool:
-        """Export data to CSV file."""
-        if not data:
+    def export_csv(data: Iterable[Dict], filepath: str) -> bool:
+        """Export data to CSV file, writing one record at a time."""
+        iterator = iter(data)
+        first = next(iterator, None)
+        if first is None:
+            print(f"{Fore.YELLOW}[!] No data to export{Style.RESET_ALL}")
             return False
         
         try:
             with open(filepath, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=data[0].keys())
+                writer = csv.DictWriter(f, fieldnames=first.keys())
                 writer.writeheader()
-                writer.writerows(data)
+                writer.writerow(first)
+                for entry in iterator:
+                    writer.writerow(entry)
             print(f"{Fore.GREEN}[+] Data exported to {filepath}{Style.RESET_ALL}")
             return True
         except Exception as e:
@@ -678,18 +6233,58 @@ class MacSpoofX:
         self.verbose = args.verbose
         self.output = args.output
         self.stealth = args.stealth
+        self.batch_mode = bool(args.interfaces or args.all)
         
         self._setup_logging()
+        self._metrics_stop = threading.Event()
+        self._start_metrics()
         
-        self.interface_manager = NetworkInterfaceManager(self.verbose)
+        self.oui_db = load_oui_database(args)
+        self.simulation = open_simulation(args)
+        if self.simulation:
+            self._restrict_to_simulation()
+            self.interface_manager = SimulatedInterfaceManager(self.simulation, self.verbose, self.oui_db,
+                                                               args.cache_ttl)
+            self.backend = SimulatedBackend(self.simulation, self.verbose)
+        else:
+            self.interface_manager = NetworkInterfaceManager(self.verbose, self.oui_db, args.cache_ttl)
+            self.interface_manager.cache.start_listener()
+            self.backend = create_backend(args.backend, self.verbose, self.interface_manager)
         self.iptables_manager = IPTablesManager(self.verbose)
+        self.backend.allow_live = not args.no_live_change
+        self.generator = create_generator(args, self.oui_db)
+        self.sim_state_dir = None
+        if self.simulation:
+            # The sequence cursor of a simulation must not advance the real one
+            self.sim_state_dir = tempfile.mkdtemp(prefix='macspoofx-sim-')
+            self.generator.sequence_state = os.path.join(self.sim_state_dir, 'sequence.json')
         
-        if not self.interface:
-            self.interface = self._auto_detect_interface()
+        if not self.interface and not args.netns:
+            if self.simulation:
+                self.interface = next(iter(self.simulation.links), None)
+            else:
+                self.interface = self._auto_detect_interface()
+        
+        self.history_store = open_history_store(args)
+        self.generator.guard = open_collision_guard(
+            args, self.history_store, self.simulation.addresses if self.simulation else None)
+        self.session_start = time.time()
+        self.exporter = open_exporter(args)
+        self.verifier = ConvergenceVerifier(args.converge_deadline, True if args.require_ip else None) \
+            if args.converge else None
+        self.journal = open_journal(args)
+        self.limiter = open_admission(args)
         
-        self.mac_changer = MACChanger(self.interface, self.verbose, self.stealth)
+        self.mac_changer = MACChanger(self.interface, self.verbose, self.stealth,
+                                      self.backend, self.generator, self.interface_manager,
+                                      self.history_store, self.exporter, self.verifier, self.journal,
+                                      self.limiter)
         
         self.running = False
+        self.scheduler: Optional[DeadlineScheduler] = None
+        self.daemon: Optional[RotationDaemon] = None
+        self.rotators: List[BatchRotator] = []
+        self.stopping = False
         
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -710,36 +6305,167 @@ class MacSpoofX:
         
         self.logger = logging.getLogger(__name__)
     
+    def _start_metrics(self):
+        """Enable metrics when an exposition target was requested."""
+        if not (self.args.metrics_file or self.args.metrics_port):
+            return
+        METRICS.enabled = True
+        if self.args.metrics_port:
+            try:
+                METRICS.serve(self.args.metrics_port)
+                print(f"{Fore.CYAN}[*] Metrics on http://127.0.0.1:{self.args.metrics_port}/metrics"
+                      f"{Style.RESET_ALL}")
+            except OSError as e:
+                print(f"{Fore.RED}[-] Cannot serve metrics on port {self.args.metrics_port}: {e}"
+                      f"{Style.RESET_ALL}")
+        if self.args.metrics_file:
+            threading.Thread(target=self._write_metrics_loop, name='metrics-file', daemon=True).start()
+    
+    def _write_metrics_loop(self):
+        while not self._metrics_stop.wait(self.args.metrics_interval):
+            self._write_metrics()
+    
+    def _write_metrics(self):
+        try:
+            METRICS.write_file(self.args.metrics_file)
+        except OSError as e:
+            self.logger.error(f"Failed to write metrics to {self.args.metrics_file}: {e}")
+    
+    def _restrict_to_simulation(self):
+        """
+        Turn off the features that would touch real links or system state under --simulate.
+        
+        Besides these, the sequence cursor lives in a temporary directory
+        and the collision guard avoids the simulated links' addresses
+        instead of reading the host neighbor table.
+        """
+        args = self.args
+        disabled = []
+        if args.netns:
+            print(f"{Fore.RED}[-] --netns cannot be combined with --simulate{Style.RESET_ALL}")
+            sys.exit(1)
+        if self.stealth:
+            self.stealth = False
+            disabled.append('stealth rules')
+        if args.converge:
+            args.converge = False
+            disabled.append('convergence checks')
+        if args.use_async:
+            args.use_async = False
+            disabled.append('async core (using the thread pool)')
+        if not args.no_journal:
+            args.no_journal = True
+        if not args.history_db:
+            args.no_history = True
+        if disabled:
+            print(f"{Fore.YELLOW}[!] Simulation: {', '.join(disabled)} disabled{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}[*] Simulating {len(self.simulation.links)} links "
+              f"(seed {self.simulation.seed}){Style.RESET_ALL}")
+    
     def _auto_detect_interface(self) -> Optional[str]:
-        """Auto-detect active network interface."""
-        interfaces = self.interface_manager.get_all_interfaces()
+        """Auto-detect the interface carrying traffic (see InterfaceDetector)."""
+        iface, record = InterfaceDetector().detect()
+        if iface is None:
+            print(f"{Fore.RED}[-] No network interfaces found{Style.RESET_ALL}")
+            return None
+        
+        if record is None:
+            print(f"{Fore.CYAN}[*] Auto-detected interface: {iface} (cached){Style.RESET_ALL}")
+        else:
+            reasons = []
+            if record['route_metric'] is not None:
+                reasons.append(f"default route, metric {record['route_metric']}")
+            reasons.append('up' if record['oper_up'] else 'down')
+            reasons.append(f"{record['bytes']} bytes")
+            print(f"{Fore.CYAN}[*] Auto-detected interface: {iface} ({', '.join(reasons)}){Style.RESET_ALL}")
+        return iface
+    
+    def _signal_handler(self, signum, frame):
+        """
+        Handle interrupt signals for graceful shutdown.
         
-        for iface in interfaces:
-            if 'wlan' in iface or 'wlp' in iface:
-                print(f"{Fore.CYAN}[*] Auto-detected wireless interface: {iface}{Style.RESET_ALL}")
-                return iface
+        Only stops new work: changes already in flight (in worker threads,
+        daemon requests or the main thread itself) run to completion, then
+        run() restores anything left pending and cleans up. A second
+        signal exits at once; the journal restores the rest on next start.
+        """
+        if self.stopping:
+            print(f"\n{Fore.RED}[-] Received signal {signum} again, exiting now{Style.RESET_ALL}")
+            os._exit(1)
+        print(f"\n{Fore.YELLOW}[!] Received signal {signum}. Finishing in-flight changes...{Style.RESET_ALL}")
+        self.stopping = True
+        self.running = False
+        for rotator in self.rotators:
+            rotator.stop()
+        if self.scheduler:
+            self.scheduler.stop()
+        if self.daemon:
+            self.daemon.stop()
+    
+    def _finish_interrupted(self):
+        """After a signal: wait for in-flight changes, then restore those left pending."""
+        if self.daemon:
+            self.daemon.wait_idle()
+        for rotator in self.rotators:
+            rotator.drain()
+        if self.journal:
+            self._restore_entries(self.journal.pending(), "interrupted")
+    
+    def _restore_entries(self, entries: List[Dict], reason: str) -> List[Dict]:
+        """Put the links of journal entries back to their pre-change addresses."""
+        targets = {ChangeJournal.key(entry['interface'], entry.get('netns')): entry['old_mac']
+                   for entry in entries if entry.get('old_mac')}
+        if not targets:
+            return []
+        print(f"{Fore.YELLOW}[!] Restoring {len(targets)} {reason} change(s): "
+              f"{', '.join(sorted(targets))}{Style.RESET_ALL}")
+        results = self.journal.restore(self.backend, targets, self.args.workers)
+        for r in results:
+            if r['success']:
+                print(f"{Fore.GREEN}[+] {r['interface']}: restored {r['mac']}{Style.RESET_ALL}")
+            else:
+                print(f"{Fore.RED}[-] {r['interface']}: {r['error']}{Style.RESET_ALL}")
+        return results
+    
+    def recover(self) -> List[Dict]:
+        """
+        Restore every journaled interface to its original MAC in one pass.
         
-        for iface in interfaces:
-            if 'eth' in iface or 'enp' in iface or 'ens' in iface:
-                print(f"{Fore.CYAN}[*] Auto-detected ethernet interface: {iface}{Style.RESET_ALL}")
-                return iface
+        Restricted to --interfaces (or -i) when given. Restored interfaces
+        are dropped from the journal.
         
-        if interfaces:
-            print(f"{Fore.CYAN}[*] Auto-detected interface: {interfaces[0]}{Style.RESET_ALL}")
-            return interfaces[0]
+        Returns:
+            One result dictionary per interface
+        """
+        if not self.journal:
+            print(f"{Fore.RED}[-] Change journal unavailable{Style.RESET_ALL}")
+            return []
+        targets = dict(self.journal.originals)
+        if self.args.interfaces:
+            wanted = {job['interface'] for job in BatchRotator.parse_spec(self.args.interfaces)}
+            targets = {key: mac for key, mac in targets.items() if ChangeJournal.split(key)[0] in wanted}
+        elif self.args.interface:
+            targets = {key: mac for key, mac in targets.items()
+                       if ChangeJournal.split(key)[0] == self.args.interface}
+        if not targets:
+            print(f"{Fore.CYAN}[*] Nothing to recover{Style.RESET_ALL}")
+            return []
         
-        print(f"{Fore.RED}[-] No network interfaces found{Style.RESET_ALL}")
-        return None
-    
-    def _signal_handler(self, signum, frame):
-        """Handle interrupt signals for graceful shutdown."""
-        print(f"\n{Fore.YELLOW}[!] Received signal {signum}. Cleaning up...{Style.RESET_ALL}")
-        self.cleanup()
-        sys.exit(0)
+        print(f"{Fore.CYAN}[*] Recovering {len(targets)} interfaces "
+              f"({self.args.workers} workers){Style.RESET_ALL}\n")
+        start = time.monotonic()
+        results = self.journal.restore(self.backend, targets, self.args.workers)
+        self.journal.forget(r['interface'] for r in results if r['success'])
+        OutputManager.print_table(results, "Recovery Results")
+        restored = sum(1 for r in results if r['success'])
+        color = Fore.GREEN if restored == len(results) else Fore.YELLOW
+        print(f"{color}[+] {restored}/{len(results)} restored in "
+              f"{time.monotonic() - start:.3f}s{Style.RESET_ALL}\n")
+        return results
     
     def check_privileges(self) -> bool:
         """Check if script is running with root privileges."""
-        if os.geteuid() != 0:
+        if os.geteuid() != 0 and not self.simulation:
             print(f"{Fore.RED}[-] This script requires root privileges{Style.RESET_ALL}")
             print(f"{Fore.YELLOW}[!] Please run with: sudo python3 macspoofx.py{Style.RESET_ALL}")
             return False
@@ -771,6 +6497,7 @@ class MacSpoofX:
         print(f"\n{Fore.CYAN}[*] Interface Information:{Style.RESET_ALL}")
         print(f"    Interface:     {info['interface']}")
         print(f"    Current MAC:   {info['current_mac']}")
+        print(f"    Vendor:        {info['vendor']}")
         print(f"    Permanent MAC: {info['permanent_mac']}")
         print(f"    Status:        {info['status']}")
         print(f"    IP Address:    {info['ip_address']}")
@@ -789,6 +6516,9 @@ class MacSpoofX:
         print(f"{Fore.CYAN}[*] Starting MAC spoofing on {self.interface}...{Style.RESET_ALL}")
         print(f"{Fore.CYAN}[*] Mode: {self.mode}{Style.RESET_ALL}\n")
         
+        if self.stealth and self.mode != 'reset':
+            self._enable_stealth([self.interface])
+        
         if self.mode == 'random':
             success, new_mac = self.mac_changer.change_mac_random()
         elif self.mode == 'custom':
@@ -797,7 +6527,7 @@ class MacSpoofX:
                 return
             success, new_mac = self.mac_changer.change_mac_custom(self.custom_mac)
         elif self.mode == 'vendor':
-            success, new_mac = self.mac_changer.change_mac_vendor()
+            success, new_mac = self.mac_changer.change_mac_vendor(self.args.vendor)
         elif self.mode == 'sequence':
             success, new_mac = self.mac_changer.change_mac_sequence()
         elif self.mode == 'reset':
@@ -809,100 +6539,360 @@ class MacSpoofX:
         if success:
             print(f"{Fore.GREEN}[+] MAC spoofing successful!{Style.RESET_ALL}")
             print(f"{Fore.GREEN}[+] New MAC address: {new_mac}{Style.RESET_ALL}\n")
-            
-            if self.stealth:
-                self.iptables_manager.enable_stealth_mode(self.interface)
-                print(f"{Fore.CYAN}[*] Stealth mode enabled{Style.RESET_ALL}\n")
         else:
             print(f"{Fore.RED}[-] MAC spoofing failed{Style.RESET_ALL}\n")
     
+    def _enable_stealth(self, interfaces: List[str]):
+        """Install stealth rules before the change so the new MAC never announces itself."""
+        if self.iptables_manager.interfaces.issuperset(interfaces):
+            return
+        if self.iptables_manager.enable_stealth_mode_batch(interfaces):
+            print(f"{Fore.CYAN}[*] Stealth mode enabled ({self.iptables_manager.engine}){Style.RESET_ALL}\n")
+        else:
+            print(f"{Fore.YELLOW}[!] Stealth rules could not be applied{Style.RESET_ALL}\n")
+    
+    def _intervals(self) -> Dict[str, float]:
+        """Parse --intervals 'eth0=5,eth1=0.5' into per-interface intervals."""
+        intervals = {}
+        for item in (self.args.intervals or '').split(','):
+            if '=' in item:
+                name, seconds = item.split('=', 1)
+                intervals[name.strip()] = float(seconds)
+        return intervals
+    
     def execute_scheduled_spoofing(self):
-        """Execute MAC spoofing on a schedule."""
+        """
+        Execute MAC spoofing on a schedule.
+        
+        Each target interface gets its own timer in a DeadlineScheduler,
+        firing every --timeout seconds (or its --intervals override) with
+        optional --jitter.
+        """
         print(f"{Fore.CYAN}[*] Starting scheduled MAC spoofing{Style.RESET_ALL}")
         print(f"{Fore.CYAN}[*] Timeout: {self.timeout} seconds{Style.RESET_ALL}\n")
         
         self.running = True
+        self.scheduler = DeadlineScheduler(self.args.missed)
+        intervals = self._intervals()
         
-        def spoof_job():
-            if self.running:
-                self.execute_spoofing()
+        if self.batch_mode:
+            jobs = self._batch_jobs()
+        else:
+            jobs = [{'interface': self.interface, 'mode': self.mode,
+                     'custom_mac': self.custom_mac, 'vendor': self.args.vendor}]
         
-        schedule.every(self.timeout).seconds.do(spoof_job)
+        if any(job['interface'] is None for job in jobs):
+            print(f"{Fore.RED}[-] No valid interface available{Style.RESET_ALL}")
+            return
+        if self.stealth:
+            self._enable_stealth([job['interface'] for job in jobs if job['mode'] != 'reset'])
         
-        spoof_job()
+        for job in jobs:
+            if self.batch_mode:
+                changer = MACChanger(job['interface'], self.verbose, self.stealth, self.backend,
+                                     self.generator, self.interface_manager, self.history_store,
+                                     self.exporter, self.verifier, self.journal, self.limiter)
+                changer.history = self.mac_changer.history
+                
+                def spoof_job(changer=changer, job=job):
+                    if not self.running:
+                        return
+                    success, new_mac = changer.change(job['mode'], job.get('custom_mac'), job.get('vendor'))
+                    if success:
+                        print(f"{Fore.GREEN}[+] {job['interface']}: MAC changed to {new_mac}{Style.RESET_ALL}")
+                    else:
+                        print(f"{Fore.RED}[-] {job['interface']}: MAC change failed{Style.RESET_ALL}")
+            else:
+                def spoof_job():
+                    if self.running:
+                        self.execute_spoofing()
+            
+            interval = intervals.get(job['interface'], self.timeout)
+            # With admission control, spread timers over the interval instead of firing together
+            delay = AdmissionController.phase(job['interface'], interval) if self.limiter else 0.0
+            self.scheduler.add(job['interface'], spoof_job, interval, jitter=self.args.jitter, delay=delay)
         
-        while self.running:
-            schedule.run_pending()
-            time.sleep(1)
+        self.scheduler.run()
     
-    def execute_multithreaded_spoofing(self, interfaces: List[str]):
-        """Execute MAC spoofing on multiple interfaces concurrently."""
-        print(f"{Fore.CYAN}[*] Starting multi-threaded spoofing on {len(interfaces)} interfaces{Style.RESET_ALL}\n")
+    def _batch_jobs(self) -> List[Dict]:
+        """Build batch jobs from --interfaces / --all."""
+        if self.args.interfaces:
+            jobs = BatchRotator.parse_spec(self.args.interfaces, self.mode)
+        else:
+            jobs = [{'interface': name, 'mode': self.mode}
+                    for name in self.interface_manager.get_inventory()]
+        for job in jobs:
+            if job['mode'] == 'custom' and not job.get('custom_mac'):
+                job['custom_mac'] = self.custom_mac
+            job.setdefault('vendor', self.args.vendor)
+        return jobs
+    
+    def execute_batch_spoofing(self, jobs: List[Dict] = None) -> BatchResult:
+        """
+        Rotate MACs on many interfaces through the bounded worker pool.
         
-        threads = []
+        Args:
+            jobs: Job dictionaries (default: built from --interfaces / --all)
+            
+        Returns:
+            BatchResult with per-interface outcomes and timings
+        """
+        jobs = jobs if jobs is not None else self._batch_jobs()
+        print(f"{Fore.CYAN}[*] Rotating {len(jobs)} interfaces "
+              f"({self.args.workers} workers){Style.RESET_ALL}\n")
         
-        for iface in interfaces:
-            thread = threading.Thread(
-                target=self._spoof_interface,
-                args=(iface,)
-            )
-            threads.append(thread)
-            thread.start()
+        rotator = BatchRotator(
+            self.backend, self.generator, self.interface_manager,
+            max_workers=self.args.workers,
+            job_timeout=self.args.job_timeout,
+            stealth=self.stealth,
+            history=self.mac_changer.history,
+            history_store=self.history_store,
+            exporter=self.exporter,
+            verifier=self.verifier,
+            journal=self.journal,
+            limiter=self.limiter
+        )
+        self.rotators.append(rotator)
+        if self.stealth:
+            self._enable_stealth([job['interface'] for job in jobs if job['mode'] != 'reset'])
+        result = rotator.rotate(jobs)
         
-        for thread in threads:
-            thread.join()
+        columns = ['interface', 'mode', 'success', 'old_mac', 'new_mac', 'error', 'downtime_ms', 'duration_ms']
+        if self.verifier:
+            columns += ['carrier_ms', 'ip_ms']
+        OutputManager.print_table(
+            [{k: r.get(k) for k in columns} for r in result.results],
+            "Batch Rotation Results"
+        )
+        summary = result.summary()
+        color = Fore.GREEN if not summary['failed'] else Fore.YELLOW
+        print(f"{color}[+] {summary['succeeded']}/{summary['jobs']} rotated in {summary['elapsed_s']}s "
+              f"(p50 {summary['p50_ms']} ms, p99 {summary['p99_ms']} ms){Style.RESET_ALL}\n")
         
-        print(f"\n{Fore.GREEN}[+] Multi-threaded spoofing completed{Style.RESET_ALL}")
+        return result
     
-    def _spoof_interface(self, interface: str):
-        """Spoof MAC address on a single interface (thread worker)."""
-        changer = MACChanger(interface, self.verbose, self.stealth)
-        success, new_mac = changer.change_mac_random()
+    def execute_netns_spoofing(self) -> Optional[BatchResult]:
+        """
+        Rotate MACs in other network namespaces (--netns) on a process pool.
         
-        if success:
-            print(f"{Fore.GREEN}[+] {interface}: MAC changed to {new_mac}{Style.RESET_ALL}")
-        else:
-            print(f"{Fore.RED}[-] {interface}: MAC change failed{Style.RESET_ALL}")
+        Targets per namespace are --interfaces, -i, or every interface.
+        
+        Returns:
+            Aggregated BatchResult, or None if --netns did not resolve
+        """
+        try:
+            namespaces = NamespaceRotator.resolve(self.args.netns)
+        except ValueError as e:
+            print(f"{Fore.RED}[-] {e}{Style.RESET_ALL}")
+            return None
+        if self.stealth:
+            print(f"{Fore.YELLOW}[!] Stealth rules are not applied inside other namespaces{Style.RESET_ALL}")
+        
+        rotator = NamespaceRotator(self.args, self.args.netns_workers)
+        print(f"{Fore.CYAN}[*] Rotating across {len(namespaces)} namespaces "
+              f"({rotator.processes(len(namespaces))} processes){Style.RESET_ALL}\n")
+        result, history, errors = rotator.rotate(namespaces)
+        
+        for entry in history:
+            self.mac_changer.history.append(entry)
+            if self.history_store:
+                self.history_store.append(entry)
+            if self.exporter:
+                self.exporter.write(entry)
+        
+        columns = ['netns', 'interface', 'mode', 'success', 'old_mac', 'new_mac', 'error', 'downtime_ms',
+                   'duration_ms']
+        if self.verifier:
+            columns += ['carrier_ms', 'ip_ms']
+        OutputManager.print_table(
+            [{k: r.get(k) for k in columns} for r in result.results],
+            "Namespace Rotation Results"
+        )
+        for error in errors:
+            print(f"{Fore.RED}[-] {error['netns']}: {error['error']}{Style.RESET_ALL}")
+        summary = result.summary()
+        color = Fore.GREEN if not summary['failed'] and not errors else Fore.YELLOW
+        print(f"{color}[+] {summary['succeeded']}/{summary['jobs']} rotated in {len(namespaces)} namespaces "
+              f"in {summary['elapsed_s']}s (p50 {summary['p50_ms']} ms, p99 {summary['p99_ms']} ms)"
+              f"{Style.RESET_ALL}\n")
+        return result
     
-    def display_history(self):
-        """Display MAC change history."""
-        history = self.mac_changer.get_history()
+    def execute_multithreaded_spoofing(self, interfaces: List[str]) -> BatchResult:
+        """Execute random MAC spoofing on multiple interfaces concurrently."""
+        return self.execute_batch_spoofing([{'interface': iface, 'mode': 'random'} for iface in interfaces])
+    
+    async def run_async(self):
+        """
+        asyncio rotation core.
         
-        if not history:
-            print(f"{Fore.YELLOW}[!] No MAC change history available{Style.RESET_ALL}")
+        Every target interface gets its own rotation timer on one event loop.
+        With --timeout 0 each interface is rotated once (at most --workers at
+        a time); otherwise each timer fires every --timeout seconds against
+        absolute deadlines, so the time a change takes does not add drift.
+        """
+        jobs = self._batch_jobs() if self.batch_mode else [
+            {'interface': self.interface, 'mode': self.mode, 'custom_mac': self.custom_mac,
+             'vendor': self.args.vendor}
+        ]
+        jobs = [job for job in jobs if job['interface']]
+        if not jobs:
+            print(f"{Fore.RED}[-] No valid interface available{Style.RESET_ALL}")
             return
         
-        OutputManager.print_table(history, "MAC Change History")
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        
+        try:
+            netlink = AsyncRtnetlink() if self.backend.name != 'macchanger' else None
+        except OSError as e:
+            self.logger.warning(f"Async netlink unavailable, using subprocesses: {e}")
+            netlink = None
+        limit = asyncio.Semaphore(max(1, self.args.workers))
+        
+        async def rotate(changer: AsyncMACChanger, job: Dict):
+            async with limit:
+                success, new_mac = await changer.rotate(job['mode'], job.get('custom_mac'), job.get('vendor'))
+            if success:
+                print(f"{Fore.GREEN}[+] {job['interface']}: MAC changed to {new_mac}{Style.RESET_ALL}")
+            else:
+                print(f"{Fore.RED}[-] {job['interface']}: MAC change failed{Style.RESET_ALL}")
+        
+        async def timer(job: Dict):
+            changer = AsyncMACChanger(job['interface'], self.verbose, self.stealth, self.generator,
+                                      self.interface_manager, netlink, self.history_store,
+                                      self.exporter, self.verifier, self.journal, self.limiter)
+            changer.history = self.mac_changer.history
+            changer.allow_live = self.backend.allow_live
+            deadline = loop.time()
+            while not stop.is_set():
+                await rotate(changer, job)
+                if self.timeout <= 0 or job['mode'] == 'reset':
+                    return
+                deadline += self.timeout
+                try:
+                    await asyncio.wait_for(stop.wait(), max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    pass
+        
+        print(f"{Fore.CYAN}[*] Async rotation of {len(jobs)} interfaces{Style.RESET_ALL}\n")
+        if self.stealth:
+            self._enable_stealth([job['interface'] for job in jobs if job['mode'] != 'reset'])
+        self.running = True
+        try:
+            await asyncio.gather(*(timer(job) for job in jobs))
+        finally:
+            self.running = False
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(signum)
+            if netlink:
+                netlink.close()
+    
+    def _session_history(self):
+        """Stream this session's history from the store, or memory without one."""
+        if self.history_store:
+            return self.history_store.query(since=self.session_start)
+        return iter(self.mac_changer.get_history())
+    
+    def display_history(self):
+        """Display MAC change history."""
+        OutputManager.print_history(self._session_history(), limit=self.args.limit,
+                                    offset=self.args.offset, plain=self.args.plain)
     
     def export_results(self):
         """Export results to file based on output format."""
         if not self.output:
             return
         
-        history = self.mac_changer.get_history()
-        
-        if not history:
-            print(f"{Fore.YELLOW}[!] No data to export{Style.RESET_ALL}")
+        if self.exporter:
+            self.exporter.close()
+            print(f"{Fore.GREEN}[+] {self.exporter.records} records streamed to {self.output}"
+                  f"{Style.RESET_ALL}")
+            for rotated in self.exporter.rotated:
+                print(f"{Fore.CYAN}[*] Rotated: {rotated}{Style.RESET_ALL}")
             return
         
+        history = self._session_history()
+        
         if self.output.endswith('.json'):
             OutputManager.export_json(history, self.output)
         elif self.output.endswith('.csv'):
             OutputManager.export_csv(history, self.output)
         else:
-            print(f"{Fore.YELLOW}[!] Unsupported output format. Use .json or .csv{Style.RESET_ALL}")
+            print(f"{Fore.YELLOW}[!] Unsupported output format. "
+                  f"Use .json, .csv, .ndjson/.jsonl or .msxc{Style.RESET_ALL}")
     
     def cleanup(self):
         """Cleanup operations before exit."""
         self.running = False
         
+        if self.daemon:
+            self.daemon.close()
+            print(f"{Fore.CYAN}[*] Daemon served {self.daemon.requests} requests, "
+                  f"{self.daemon.rotations} rotations{Style.RESET_ALL}")
+            self.daemon = None
+        
+        if self.scheduler:
+            self.scheduler.stop()
+            stats = self.scheduler.stats()
+            if stats['runs']:
+                print(f"{Fore.CYAN}[*] Scheduler: {stats['runs']} runs, {stats['missed']} missed, "
+                      f"drift mean {stats['drift_mean_ms']} ms / p99 {stats['drift_p99_ms']} ms / "
+                      f"max {stats['drift_max_ms']} ms{Style.RESET_ALL}")
+        
+        # Timed-out batch changes still write to the journal and history store closed below
+        stragglers = sum(len(rotator.stragglers) for rotator in self.rotators)
+        if stragglers:
+            print(f"{Fore.YELLOW}[!] Waiting for {stragglers} timed-out change(s) to finish...{Style.RESET_ALL}")
+            for rotator in self.rotators:
+                rotator.drain()
+        
+        if self.limiter:
+            stats = self.limiter.stats()
+            if stats['admitted']:
+                print(f"{Fore.CYAN}[*] Admission: {stats['admitted']} changes, queue max {stats['max_queue']}, "
+                      f"{stats['max_down']} at once, wait mean {stats['wait_mean_ms']} ms / "
+                      f"p99 {stats['wait_p99_ms']} ms / max {stats['wait_max_ms']} ms{Style.RESET_ALL}")
+        
         if self.stealth:
-            print(f"{Fore.CYAN}[*] Cleaning up iptables rules...{Style.RESET_ALL}")
+            print(f"{Fore.CYAN}[*] Cleaning up stealth rules...{Style.RESET_ALL}")
             self.iptables_manager.clear_rules()
         
         if self.output:
             self.export_results()
         
+        if self.history_store:
+            self.history_store.close()
+            self.history_store = None
+        
+        if self.verifier:
+            self.verifier.close()
+            self.verifier = None
+        
+        if self.journal:
+            self.journal.close()
+            self.journal = None
+        
+        if self.sim_state_dir:
+            shutil.rmtree(self.sim_state_dir, ignore_errors=True)
+            self.sim_state_dir = None
+        
+        if self.simulation:
+            summary = self.simulation.summary()
+            operations = ', '.join(f"{op} {counts['calls']} ({counts['failures']} failed)"
+                                   for op, counts in summary['operations'].items())
+            quirks = ', '.join(f"{quirk} {count}" for quirk, count in summary['quirks'].items() if count)
+            print(f"{Fore.CYAN}[*] Simulated kernel: {operations or 'no operations'}"
+                  f"{'; quirks: ' + quirks if quirks else ''}{Style.RESET_ALL}")
+        
+        if METRICS.enabled:
+            self._metrics_stop.set()
+            if self.args.metrics_file:
+                self._write_metrics()
+            METRICS.close()
+        
         print(f"{Fore.GREEN}[+] Cleanup completed{Style.RESET_ALL}")
     
     def run(self):
@@ -911,17 +6901,136 @@ class MacSpoofX:
         
         if not self.check_privileges():
             sys.exit(1)
-        
-        self.display_interface_info()
-        
-        if self.timeout > 0 and self.mode != 'reset':
-            self.execute_scheduled_spoofing()
-        else:
-            self.execute_spoofing()
-        
-        self.display_history()
-        
-        self.cleanup()
+        
+        if self.journal:
+            # Changes left half done by a process that crashed or was killed
+            self._restore_entries(self.journal.orphaned(), "unfinished")
+        
+        if self.args.recover:
+            self.recover()
+            self.cleanup()
+            return
+        
+        if self.args.netns:
+            self.execute_netns_spoofing()
+        elif self.args.daemon:
+            self.daemon = RotationDaemon(self, self.args.socket)
+            try:
+                self.daemon.serve()
+            except OSError as e:
+                print(f"{Fore.RED}[-] Cannot start daemon: {e}{Style.RESET_ALL}")
+                self.daemon = None
+                self.cleanup()
+                sys.exit(1)
+        elif self.args.use_async:
+            asyncio.run(self.run_async())
+        elif self.timeout > 0 and self.mode != 'reset':
+            if not self.batch_mode:
+                self.display_interface_info()
+            self.execute_scheduled_spoofing()
+        elif self.batch_mode:
+            self.execute_batch_spoofing()
+        else:
+            self.display_interface_info()
+            self.execute_spoofing()
+        
+        if self.stopping:
+            self._finish_interrupted()
+        
+        self.display_history()
+        
+        self.cleanup()
+
+
+def load_oui_database(args) -> Optional[OUIDatabase]:
+    """Open (compiling if needed) the OUI vendor database."""
+    return OUIDatabase.load(args.oui_db)
+
+
+def open_history_store(args) -> Optional[HistoryStore]:
+    """Open the persistent history store, or None if disabled or unavailable."""
+    if args.no_history:
+        return None
+    try:
+        return HistoryStore(args.history_db, retention_days=args.retention_days)
+    except (OSError, sqlite3.Error) as e:
+        logging.getLogger(__name__).warning(f"History store unavailable, keeping history in memory: {e}")
+        return None
+
+
+def open_collision_guard(args, history_store: HistoryStore = None,
+                         neighbor_source=None) -> Optional[CollisionGuard]:
+    """Build the collision guard seeded from recent history, or None if disabled."""
+    if args.no_collision_check:
+        return None
+    guard = CollisionGuard(neighbor_source=neighbor_source)
+    guard.load_neighbors()
+    if history_store:
+        recent = history_store.recent_macs(time.time() - guard.SEED_WINDOW, guard.capacity)
+        guard.seed(recent[::-1])
+    return guard
+
+
+def open_simulation(args) -> Optional[SimulatedKernel]:
+    """Build the simulated link table for --simulate, or None for real links."""
+    if not args.simulate:
+        return None
+    try:
+        return SimulatedKernel.from_config(args.sim_config, args.simulate, args.sim_seed)
+    except (OSError, ValueError) as e:
+        print(f"{Fore.RED}[-] Invalid simulation config {args.sim_config}: {e}{Style.RESET_ALL}")
+        sys.exit(1)
+
+
+def open_journal(args, netns: str = None) -> Optional[ChangeJournal]:
+    """Open the write-ahead change journal, or None if disabled or unavailable."""
+    if args.no_journal:
+        return None
+    try:
+        return ChangeJournal(args.journal, netns=netns)
+    except OSError as e:
+        logging.getLogger(__name__).warning(f"Change journal unavailable, crash recovery disabled: {e}")
+        return None
+
+
+def open_admission(args, share: int = 1) -> Optional[AdmissionController]:
+    """
+    Build the flap admission controller, or None without --max-flap-rate/--max-down.
+    
+    share splits the limits evenly between that many processes (--netns workers).
+    """
+    if not (args.max_flap_rate or args.max_down):
+        return None
+    burst = math.ceil(args.flap_burst / share) if args.flap_burst else None
+    try:
+        return AdmissionController(args.max_flap_rate / share, burst, args.max_down // share)
+    except ValueError as e:
+        print(f"{Fore.RED}[-] {e}{Style.RESET_ALL}")
+        sys.exit(1)
+
+
+def open_exporter(args) -> Optional[HistoryExporter]:
+    """Open a streaming exporter for --output, or None for end-of-run formats."""
+    if not args.output:
+        return None
+    rotate_bytes = int(args.rotate_size * 1024 * 1024) if args.rotate_size else None
+    try:
+        return create_exporter(args.output, rotate_bytes, args.rotate_interval)
+    except OSError as e:
+        print(f"{Fore.RED}[-] Cannot open {args.output}: {e}{Style.RESET_ALL}")
+        sys.exit(1)
+
+
+def create_generator(args, oui_db: OUIDatabase = None) -> MACGenerator:
+    """Build the MAC generator from command-line arguments."""
+    vendor_ouis = None
+    if args.oui_table:
+        try:
+            vendor_ouis = MACGenerator.load_oui_table(args.oui_table)
+        except OSError as e:
+            print(f"{Fore.RED}[-] Failed to load OUI table: {e}{Style.RESET_ALL}")
+            sys.exit(1)
+    return MACGenerator(vendor_ouis, oui_db=oui_db)
 
 
 def parse_arguments():
@@ -935,6 +7044,7 @@ Examples:
   sudo python3 macspoofx.py --mode custom --custom-mac 00:11:22:33:44:55
   sudo python3 macspoofx.py --mode random --timeout 60 --verbose
   sudo python3 macspoofx.py --mode vendor --stealth --output results.json
+  sudo python3 macspoofx.py --interfaces eth0,eth1:vendor --workers 4
         '''
     )
     
@@ -945,6 +7055,78 @@ Examples:
         help='Network interface to spoof (auto-detect if not specified)'
     )
     
+    parser.add_argument(
+        '--interfaces',
+        type=str,
+        default=None,
+        help='Rotate several interfaces: eth0,eth1:vendor,eth2=00:11:22:33:44:55'
+    )
+    
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help='Rotate every interface except loopback'
+    )
+    
+    parser.add_argument(
+        '--netns',
+        type=str,
+        default=None,
+        metavar='SPEC',
+        help="Rotate inside network namespaces: 'all', or comma separated names (/run/netns), "
+             "pids or namespace paths"
+    )
+    
+    parser.add_argument(
+        '--netns-workers',
+        type=int,
+        default=None,
+        help='Worker processes for --netns, one namespace per task (default: CPU count)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Maximum concurrent rotations for --interfaces/--all (default: 8)'
+    )
+    
+    parser.add_argument(
+        '--job-timeout',
+        type=float,
+        default=30.0,
+        help='Seconds before a single batch rotation is reported as timed out (default: 30)'
+    )
+    
+    parser.add_argument(
+        '--max-flap-rate',
+        type=float,
+        default=0.0,
+        help='Maximum MAC changes started per second across all interfaces (default: unlimited)'
+    )
+    
+    parser.add_argument(
+        '--flap-burst',
+        type=int,
+        default=None,
+        help='Changes allowed back to back before --max-flap-rate applies (default: one second worth)'
+    )
+    
+    parser.add_argument(
+        '--max-down',
+        type=int,
+        default=0,
+        help='Maximum interfaces changing (link down) at once (default: unlimited); '
+             'scheduled timers are also spread over their interval'
+    )
+    
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Run rotations on the asyncio core (one event loop, one timer per interface)'
+    )
+    
     parser.add_argument(
         '--mode', '-m',
         type=str,
@@ -953,6 +7135,42 @@ Examples:
         help='Spoofing mode (default: random)'
     )
     
+    parser.add_argument(
+        '--backend', '-b',
+        type=str,
+        choices=['auto'] + list(BACKENDS),
+        default='auto',
+        help='MAC change backend: in-process netlink/ioctl or macchanger (default: auto)'
+    )
+    
+    parser.add_argument(
+        '--no-live-change',
+        action='store_true',
+        help='Always bounce the link instead of trying a live address change first'
+    )
+    
+    parser.add_argument(
+        '--simulate',
+        type=int,
+        default=None,
+        metavar='COUNT',
+        help='Run against COUNT simulated links instead of the kernel (no root needed)'
+    )
+    
+    parser.add_argument(
+        '--sim-config',
+        type=str,
+        default=None,
+        help='JSON file with simulated latencies, failure rates and driver quirks'
+    )
+    
+    parser.add_argument(
+        '--sim-seed',
+        type=int,
+        default=None,
+        help='Seed for simulated quirks, latencies and failures (default: config seed or 0)'
+    )
+    
     parser.add_argument(
         '--custom-mac', '-c',
         type=str,
@@ -961,10 +7179,104 @@ Examples:
     )
     
     parser.add_argument(
-        '--timeout', '-t',
+        '--vendor',
+        type=str,
+        default=None,
+        help='Vendor name for vendor mode (e.g., Apple; random vendor if omitted)'
+    )
+    
+    parser.add_argument(
+        '--oui-table',
+        type=str,
+        default=None,
+        help='OUI table used by vendor mode (lines of "00:1B:63 Vendor Name")'
+    )
+    
+    parser.add_argument(
+        '--oui-db',
+        type=str,
+        action='append',
+        default=None,
+        metavar='PATH',
+        help='IEEE OUI/MA-M/MA-S registry file to index (repeatable; default: system ieee-data)'
+    )
+    
+    parser.add_argument(
+        '--generate',
         type=int,
         default=0,
-        help='Time between MAC changes in seconds (0 = one-time change, default: 0)'
+        metavar='COUNT',
+        help='Print COUNT generated MAC addresses for the selected mode and exit'
+    )
+    
+    parser.add_argument(
+        '--normalize',
+        type=str,
+        default=None,
+        metavar='FILE',
+        help="Validate and normalize one MAC per line from FILE ('-' for stdin) and exit"
+    )
+    
+    parser.add_argument(
+        '--mac-format',
+        choices=MacAddress.STYLES,
+        default='colon',
+        help='Output format for --normalize (default: colon)'
+    )
+    
+    parser.add_argument(
+        '--timeout', '-t',
+        type=float,
+        default=0,
+        help='Time between MAC changes in seconds, fractions allowed (0 = one-time change, default: 0)'
+    )
+    
+    parser.add_argument(
+        '--intervals',
+        type=str,
+        default=None,
+        help='Per-interface rotation intervals overriding --timeout, e.g. eth0=5,eth1=0.5'
+    )
+    
+    parser.add_argument(
+        '--jitter',
+        type=float,
+        default=0.0,
+        help='Randomize each scheduled rotation by up to +/- this many seconds'
+    )
+    
+    parser.add_argument(
+        '--missed',
+        type=str,
+        choices=DeadlineScheduler.POLICIES,
+        default='skip',
+        help='What to do with missed rotation deadlines (default: skip)'
+    )
+    
+    parser.add_argument(
+        '--converge',
+        action='store_true',
+        help='After each change, wait for carrier (and IPv4 if the interface had one) via netlink events'
+    )
+    
+    parser.add_argument(
+        '--converge-deadline',
+        type=float,
+        default=10.0,
+        help='Seconds a change may take to converge before it counts as failed (default: 10)'
+    )
+    
+    parser.add_argument(
+        '--require-ip',
+        action='store_true',
+        help='With --converge, always wait for an IPv4 address (e.g. DHCP re-acquisition)'
+    )
+    
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=5.0,
+        help='Seconds volatile interface state stays cached (0 disables, default: 5)'
     )
     
     parser.add_argument(
@@ -977,7 +7289,153 @@ Examples:
         '--output', '-o',
         type=str,
         default=None,
-        help='Save results to file (JSON or CSV format, e.g., results.json)'
+        help='Save results to file (.json, or streamed as rotations happen: .csv, .ndjson/.jsonl, .msxc)'
+    )
+    
+    parser.add_argument(
+        '--rotate-size',
+        type=float,
+        default=None,
+        help='Start a new output file after this many MB (streamed formats)'
+    )
+    
+    parser.add_argument(
+        '--rotate-interval',
+        type=float,
+        default=None,
+        help='Start a new output file after this many seconds (streamed formats)'
+    )
+    
+    parser.add_argument(
+        '--history-db',
+        type=str,
+        default=None,
+        help='Persistent history database (default: /var/lib/macspoofx/history.db)'
+    )
+    
+    parser.add_argument(
+        '--retention-days',
+        type=float,
+        default=30.0,
+        help='Days of history to keep in the database (0 = forever, default: 30)'
+    )
+    
+    parser.add_argument(
+        '--no-history',
+        action='store_true',
+        help='Do not persist history (keep only recent changes in memory)'
+    )
+    
+    parser.add_argument(
+        '--no-collision-check',
+        action='store_true',
+        help='Do not screen generated MACs against the neighbor table and recent history'
+    )
+    
+    parser.add_argument(
+        '--journal',
+        type=str,
+        default=None,
+        help='Write-ahead change journal (default: /var/lib/macspoofx/journal.log)'
+    )
+    
+    parser.add_argument(
+        '--no-journal',
+        action='store_true',
+        help='Do not journal changes (disables crash recovery)'
+    )
+    
+    parser.add_argument(
+        '--recover',
+        action='store_true',
+        help='Restore original MACs of all journaled interfaces (or --interfaces) and exit'
+    )
+    
+    parser.add_argument(
+        '--show-history',
+        action='store_true',
+        help='Print stored history (filter with --interface, --since, --until) and exit'
+    )
+    
+    parser.add_argument(
+        '--since',
+        type=str,
+        default=None,
+        help='Start of the --show-history time range (ISO-8601 or epoch seconds)'
+    )
+    
+    parser.add_argument(
+        '--until',
+        type=str,
+        default=None,
+        help='End of the --show-history time range (ISO-8601 or epoch seconds)'
+    )
+    
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Run as a long-lived daemon accepting commands on a Unix socket'
+    )
+    
+    parser.add_argument(
+        '--socket',
+        type=str,
+        default=None,
+        help='Daemon control socket path (default: /run/macspoofx.sock)'
+    )
+    
+    parser.add_argument(
+        '--ctl',
+        choices=RotationDaemon.COMMANDS,
+        default=None,
+        help='Send a command to a running daemon (uses --interface/--interfaces, --mode, --custom-mac, --vendor)'
+    )
+    
+    parser.add_argument(
+        '--metrics-file',
+        type=str,
+        default=None,
+        help='Write Prometheus metrics to this file (periodically and on exit)'
+    )
+    
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        default=None,
+        help='Serve Prometheus metrics on http://127.0.0.1:PORT/metrics'
+    )
+    
+    parser.add_argument(
+        '--metrics-interval',
+        type=float,
+        default=15.0,
+        help='Seconds between --metrics-file updates (default: 15)'
+    )
+    
+    parser.add_argument(
+        '--startup-profile',
+        action='store_true',
+        help='Report where startup time was spent (imports, parsing, run) on exit'
+    )
+    
+    parser.add_argument(
+        '--limit',
+        type=int,
+        default=None,
+        help='Show at most this many rows in interface and history listings'
+    )
+    
+    parser.add_argument(
+        '--offset',
+        type=int,
+        default=0,
+        help='Skip this many rows in interface and history listings'
+    )
+    
+    parser.add_argument(
+        '--plain',
+        action='store_true',
+        help='Tab-separated listings without table formatting (for scripts)'
     )
     
     parser.add_argument(
@@ -995,27 +7453,151 @@ Examples:
     return parser.parse_args()
 
 
+def _process_age_ms() -> Optional[float]:
+    """Milliseconds since this process was exec'd (10 ms resolution), from /proc."""
+    try:
+        with open('/proc/self/stat') as f:
+            started = int(f.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return (uptime - started / os.sysconf('SC_CLK_TCK')) * 1000
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def report_startup_profile(main_start: float, args_parsed: float):
+    """Print where startup time went (registered at exit by --startup-profile)."""
+    now = time.perf_counter()
+    age = _process_age_ms()
+    total = (now - _MODULE_START) * 1000
+    lines = ["", "[*] Startup profile (ms):"]
+    if age is not None:
+        lines.append(f"    exec + interpreter     {max(age - total, 0.0):8.1f}   (approx., /proc)")
+    lines.append(f"    module imports         {(_MODULE_READY - _MODULE_START) * 1000:8.1f}")
+    lines.append(f"    argument parsing       {(args_parsed - main_start) * 1000:8.1f}")
+    lines.append(f"    run                    {(now - args_parsed) * 1000:8.1f}")
+    for name, elapsed in sorted(_LazyModule.loaded.items(), key=lambda item: -item[1]):
+        lines.append(f"      lazy import {name:<16} {elapsed:6.1f}")
+    if __spec__ is None:
+        lines.append("    [!] Running as a script recompiles macspoofx.py on every start; "
+                     "'python3 -m macspoofx' or the installed launcher uses cached bytecode")
+    print('\n'.join(lines), file=sys.stderr)
+
+
+def run_client(args) -> int:
+    """Send one --ctl command to a running daemon and print the response."""
+    client = DaemonClient(args.socket)
+    params = {'interface': args.interface}
+    if args.ctl == 'rotate':
+        params.update(mode=args.mode, custom_mac=args.custom_mac, vendor=args.vendor)
+    elif args.ctl == 'history':
+        params.update(since=args.since, until=args.until, limit=args.limit)
+    if args.interfaces:
+        params['interfaces'] = [job['interface'] for job in BatchRotator.parse_spec(args.interfaces)]
+    try:
+        response = client.request(args.ctl, **params)
+    except (OSError, ValueError) as e:
+        print(f"{Fore.RED}[-] Daemon at {client.socket_path} unavailable: {e}{Style.RESET_ALL}")
+        return 1
+    finally:
+        client.close()
+    
+    if not response.get('ok'):
+        print(f"{Fore.RED}[-] {response.get('error')}{Style.RESET_ALL}")
+        return 1
+    result = response['result']
+    if args.ctl in ('rotate', 'reset'):
+        for r in result:
+            if r['success']:
+                print(f"{Fore.GREEN}[+] {r['interface']}: {r['old_mac']} -> {r['new_mac']} "
+                      f"({r['duration_ms']} ms){Style.RESET_ALL}")
+            else:
+                print(f"{Fore.RED}[-] {r['interface']}: {r['error']}{Style.RESET_ALL}")
+        return 0 if all(r['success'] for r in result) else 1
+    if args.ctl == 'history':
+        OutputManager.print_history(result, plain=args.plain)
+    else:
+        print(json.dumps(result, indent=4))
+    return 0
+
+
 def main():
     """Main entry point."""
+    main_start = time.perf_counter()
     args = parse_arguments()
     
+    if args.startup_profile:
+        atexit.register(report_startup_profile, main_start, time.perf_counter())
+    
+    if args.ctl:
+        sys.exit(run_client(args))
+    
+    if args.generate > 0:
+        mode = args.mode if args.mode in MACGenerator.MODES else 'random'
+        try:
+            oui_db = load_oui_database(args) if mode == 'vendor' else None
+            for mac in create_generator(args, oui_db).generate(mode, args.generate, args.vendor):
+                print(mac)
+        except (ValueError, OSError) as e:
+            print(f"{Fore.RED}[-] {e}{Style.RESET_ALL}")
+            sys.exit(1)
+        sys.exit(0)
+    
+    if args.normalize:
+        try:
+            values, invalid = MacAddress.load_file(args.normalize)
+        except OSError as e:
+            print(f"{Fore.RED}[-] {e}{Style.RESET_ALL}")
+            sys.exit(1)
+        sys.stdout.write(MacAddress.format_many(values, args.mac_format))
+        for number, line in invalid:
+            print(f"{args.normalize}:{number}: invalid MAC address: {line!r}", file=sys.stderr)
+        sys.exit(1 if invalid else 0)
+    
+    if args.show_history:
+        store = open_history_store(args)
+        if not store:
+            print(f"{Fore.RED}[-] History store unavailable{Style.RESET_ALL}")
+            sys.exit(1)
+        if args.output:
+            history = store.query(args.interface, args.since, args.until)
+            exporter = open_exporter(args)
+            if exporter:
+                count = exporter.write_all(history)
+                exporter.close()
+                print(f"{Fore.GREEN}[+] {count} records exported to {args.output}{Style.RESET_ALL}")
+            elif args.output.endswith('.json'):
+                OutputManager.export_json(history, args.output)
+            else:
+                print(f"{Fore.YELLOW}[!] Unsupported output format{Style.RESET_ALL}")
+            store.close()
+            sys.exit(0)
+        history = store.query(args.interface, args.since, args.until, args.limit, args.offset)
+        OutputManager.print_history(history, plain=args.plain)
+        store.close()
+        sys.exit(0)
+    
     if args.list_interfaces:
-        manager = NetworkInterfaceManager(verbose=True)
-        interfaces = manager.get_all_interfaces()
-        
-        print(f"\n{Fore.CYAN}Available Network Interfaces:{Style.RESET_ALL}\n")
+        simulation = open_simulation(args)
+        if simulation:
+            manager = SimulatedInterfaceManager(simulation, verbose=True, oui_db=load_oui_database(args))
+        else:
+            manager = NetworkInterfaceManager(verbose=True, oui_db=load_oui_database(args))
+        data = manager.get_inventory().values()
         
-        data = []
-        for iface in interfaces:
-            info = manager.get_interface_info(iface)
-            data.append(info)
+        if not args.plain:
+            print(f"\n{Fore.CYAN}Available Network Interfaces:{Style.RESET_ALL}\n")
         
-        OutputManager.print_table(data, "Network Interfaces")
+        OutputManager.print_table(data, "Network Interfaces", limit=args.limit,
+                                  offset=args.offset, plain=args.plain)
         sys.exit(0)
     
     app = MacSpoofX(args)
     app.run()
 
 
+_MODULE_READY = time.perf_counter()
+
+
 if __name__ == '__main__':
     main()
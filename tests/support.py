@@ -0,0 +1,24 @@
+"""
+Shared setup for the MacSpoofX unit tests.
+
+Import this before macspoofx: it puts the repository root on sys.path and
+points MACSPOOFX_STATE_DIR (read at import time) at a throwaway directory,
+so no test touches /var/lib/macspoofx. The tests need no root and no links.
+
+Run with either runner from the repository root:
+    python3 -m pytest -q tests
+    python3 -m unittest discover tests
+"""
+
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+STATE_DIR = tempfile.mkdtemp(prefix='msxtest-state-')
+os.environ['MACSPOOFX_STATE_DIR'] = STATE_DIR
+atexit.register(shutil.rmtree, STATE_DIR, True)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""AdmissionController token bucket and max_down tests."""
+
+import threading
+import time
+import unittest
+
+import support  # noqa: F401  - path and state dir, must precede macspoofx
+from macspoofx import AdmissionController
+
+
+class AdmissionControllerTest(unittest.TestCase):
+
+    def test_rejects_negative_limits(self):
+        with self.assertRaises(ValueError):
+            AdmissionController(rate=-1)
+        with self.assertRaises(ValueError):
+            AdmissionController(max_down=-1)
+
+    def test_unlimited(self):
+        admission = AdmissionController()
+        for _ in range(100):
+            self.assertLess(admission.acquire(), 0.01)
+            admission.release()
+
+    def test_burst_then_rate(self):
+        admission = AdmissionController(rate=20, burst=3)
+        waits = []
+        for _ in range(5):
+            waits.append(admission.acquire())
+            admission.release()
+        self.assertTrue(all(wait < 0.01 for wait in waits[:3]), waits)
+        # Tokens 4 and 5 each wait one refill interval (50 ms)
+        self.assertGreater(waits[3], 0.03)
+        self.assertGreater(waits[4], 0.03)
+
+    def test_refill_is_capped_at_burst(self):
+        admission = AdmissionController(rate=20, burst=2)
+        for _ in range(2):
+            admission.acquire()
+            admission.release()
+        time.sleep(0.3)
+        waits = []
+        for _ in range(3):
+            waits.append(admission.acquire())
+            admission.release()
+        self.assertTrue(all(wait < 0.01 for wait in waits[:2]), waits)
+        self.assertGreater(waits[2], 0.03)
+
+    def test_max_down(self):
+        admission = AdmissionController(max_down=2)
+        admission.acquire()
+        admission.acquire()
+        third = threading.Thread(target=admission.acquire, daemon=True)
+        third.start()
+        third.join(0.1)
+        self.assertTrue(third.is_alive())
+        self.assertEqual(admission.queue_depth, 1)
+        admission.release()
+        third.join(1)
+        self.assertFalse(third.is_alive())
+        stats = admission.stats()
+        self.assertEqual(stats['admitted'], 3)
+        self.assertEqual(stats['max_down'], 2)
+
+    def test_phase_is_deterministic(self):
+        phase = AdmissionController.phase('eth0', 30)
+        self.assertEqual(phase, AdmissionController.phase('eth0', 30))
+        self.assertTrue(0 <= phase < 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
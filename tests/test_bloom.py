@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""BloomFilter false negative and false positive rate tests."""
+
+import random
+import unittest
+
+import support  # noqa: F401  - path and state dir, must precede macspoofx
+from macspoofx import BloomFilter
+
+
+class BloomFilterTest(unittest.TestCase):
+
+    def test_no_false_negatives(self):
+        rng = random.Random(4)
+        bloom = BloomFilter(2000)
+        values = [rng.getrandbits(48) for _ in range(6000)]
+        for i, value in enumerate(values):
+            if i % 2:
+                bloom.add(value)
+            else:
+                bloom.add_many([value])
+        # Even far past capacity every added value must still be found
+        self.assertTrue(all(value in bloom for value in values))
+        self.assertEqual(bloom.count, len(values))
+
+    def test_false_positive_rate_at_capacity(self):
+        rng = random.Random(5)
+        bloom = BloomFilter(5000, false_positive_rate=0.01)
+        bloom.add_many(rng.getrandbits(48) for _ in range(5000))
+        probes = [rng.getrandbits(48) | 1 << 48 for _ in range(20000)]
+        rate = sum(value in bloom for value in probes) / len(probes)
+        self.assertLess(rate, 0.03)
+
+
+if __name__ == '__main__':
+    unittest.main()
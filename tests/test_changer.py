@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""MACChanger and AsyncMACChanger verification rollback tests."""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import support  # noqa: F401  - path and state dir, must precede macspoofx
+from macspoofx import (AsyncMACChanger, ChangeJournal, MACBackend, MACChanger, MACGenerator,
+                       SimulatedBackend, SimulatedInterfaceManager, SimulatedKernel)
+
+
+class VerifyRollbackTest(unittest.TestCase):
+    """A change that does not read back is rolled back; only a confirmed rollback ends the journal entry."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix='msxtest-')
+        # sticky_mac links accept a new address but keep the old one, so verification fails
+        self.kernel = SimulatedKernel(count=1, quirks={'sticky_mac': 1.0})
+        self.backend = SimulatedBackend(self.kernel)
+        self.journal = ChangeJournal(os.path.join(self.tmp, 'journal.log'), sync=False)
+        self.addCleanup(self.journal.close)
+        self.old_mac = self.backend.get_mac('sim0')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def changer(self, cls=MACChanger, **kwargs):
+        return cls('sim0', interface_manager=SimulatedInterfaceManager(self.kernel), journal=self.journal,
+                   generator=MACGenerator(sequence_state=os.path.join(self.tmp, 'seq.json')), **kwargs)
+
+    def test_rollback_ends_entry(self):
+        changer = self.changer(backend=self.backend)
+        self.assertEqual(changer.change_mac_custom('02:00:00:00:00:42'), (False, None))
+        self.assertTrue(changer.last_change['rolled_back'])
+        self.assertEqual(self.journal.pending(), [])
+
+    def test_failed_rollback_keeps_entry(self):
+        changer = self.changer(backend=self.backend)
+        real = self.backend.apply_mac
+        with mock.patch.object(self.backend, 'apply_mac',
+                               side_effect=[real('sim0', '02:00:00:00:00:42', self.old_mac),
+                                            MACBackend._outcome()]):
+            self.assertEqual(changer.change_mac_custom('02:00:00:00:00:42'), (False, None))
+        self.assertFalse(changer.last_change['rolled_back'])
+        self.assertEqual([(entry['interface'], entry['old_mac']) for entry in self.journal.pending()],
+                         [('sim0', self.old_mac)])
+
+    def run_async(self, rollback_success: bool) -> AsyncMACChanger:
+        changer = self.changer(AsyncMACChanger)
+        applied = dict(MACBackend._outcome(), success=True)
+
+        async def apply(mac, old_mac):
+            return applied if old_mac else dict(applied, success=rollback_success)
+
+        async def get_mac():
+            return self.old_mac
+
+        changer._apply = apply
+        changer._get_mac = get_mac
+        self.assertEqual(asyncio.run(changer.rotate('custom', '02:00:00:00:00:42')), (False, None))
+        return changer
+
+    def test_async_rollback_ends_entry(self):
+        changer = self.run_async(rollback_success=True)
+        self.assertTrue(changer.last_change['rolled_back'])
+        self.assertEqual(self.journal.pending(), [])
+
+    def test_async_failed_rollback_keeps_entry(self):
+        changer = self.run_async(rollback_success=False)
+        self.assertFalse(changer.last_change['rolled_back'])
+        self.assertEqual(len(self.journal.pending()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
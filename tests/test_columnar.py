@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""ColumnarExporter round-trip tests."""
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import support  # noqa: F401  - path and state dir, must precede macspoofx
+from macspoofx import ColumnarExporter, HistoryStore, MacAddress
+
+
+class ColumnarExporterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix='msxtest-')
+        self.path = os.path.join(self.tmp, 'history.msxc')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def entries(self, count: int) -> list:
+        rng = random.Random(3)
+        entries = []
+        for i in range(count):
+            custom = i % 7 == 0
+            new_mac = str(MacAddress(rng.getrandbits(48)))
+            entries.append({
+                'timestamp': 1700000000 + i * 1.25,
+                'interface': f'eth{i % 3}',
+                'mode': 'custom' if custom else 'random',
+                'old_mac': None if i == 0 else entries[-1]['new_mac'],
+                'new_mac': new_mac,
+                'custom_mac': new_mac if custom else None,
+                'downtime_ms': None if i % 5 == 0 else round(rng.uniform(0, 50), 3)
+            })
+        return entries
+
+    def read_back(self) -> list:
+        rows = list(ColumnarExporter.read(self.path))
+        for row in rows:
+            row['timestamp'] = HistoryStore._to_epoch(row['timestamp'])
+        return rows
+
+    def test_round_trip_across_row_groups(self):
+        entries = self.entries(250)
+        exporter = ColumnarExporter(self.path, flush_every=64)
+        exporter.write_all(entries)
+        exporter.close()
+        self.assertEqual(self.read_back(), entries)
+
+    def test_truncated_file_keeps_complete_groups(self):
+        entries = self.entries(100)
+        exporter = ColumnarExporter(self.path, flush_every=40)
+        exporter.write_all(entries)
+        exporter.close()
+        with open(self.path, 'rb+') as f:
+            f.truncate(os.path.getsize(self.path) - 10)
+        self.assertEqual(self.read_back(), entries[:80])
+
+
+if __name__ == '__main__':
+    unittest.main()
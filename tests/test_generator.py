@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""MACGenerator mode and address bit tests."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import support  # noqa: F401  - path and state dir, must precede macspoofx
+from macspoofx import MACGenerator, MacAddress
+
+
+class MACGeneratorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix='msxtest-')
+        self.state = os.path.join(self.tmp, 'sequence.json')
+        self.generator = MACGenerator(sequence_state=self.state)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def assertLocalUnicast(self, macs):
+        for mac in macs:
+            address = MacAddress.parse(mac)
+            self.assertTrue(address.is_unicast and address.is_locally_administered, mac)
+
+    def test_random_is_local_unicast(self):
+        macs = self.generator.generate('random', 2000)
+        self.assertEqual(len(macs), 2000)
+        self.assertLocalUnicast(macs)
+        self.assertGreater(len(set(macs)), 1990)
+        self.assertLocalUnicast(self.generator.next('random') for _ in range(600))
+
+    def test_vendor_uses_the_builtin_table(self):
+        for mac in self.generator.generate('vendor', 200, 'vmware'):
+            self.assertIn(mac[:8], ('00:50:56', '00:0c:29'))
+        for mac in self.generator.vendor_batch(20, 'raspberry'):
+            self.assertTrue(mac.startswith('b8:27:eb'), mac)
+        ouis = {oui.lower() for ouis in MACGenerator.DEFAULT_VENDOR_OUIS.values() for oui in ouis}
+        self.assertTrue({mac[:8] for mac in self.generator.vendor_batch(200)} <= ouis)
+        with self.assertRaises(ValueError):
+            self.generator.vendor_batch(1, 'no such vendor')
+
+    def test_sequence_is_monotonic_and_persisted(self):
+        first = self.generator.generate('sequence', 5)
+        second = MACGenerator(sequence_state=self.state).generate('sequence', 5)
+        values = [int(MacAddress.parse(mac)) for mac in first + second]
+        self.assertEqual(values, list(range(values[0], values[0] + 10)))
+        self.assertLocalUnicast(first + second)
+
+    def test_sequence_wraps_to_a_fresh_prefix(self):
+        with open(self.state, 'w') as f:
+            json.dump({'prefix': 0x02AAAA, 'counter': 0xFFFFFE}, f)
+        macs = self.generator.sequence_batch(3)
+        self.assertEqual(macs[:2], ['02:aa:aa:ff:ff:fe', '02:aa:aa:ff:ff:ff'])
+        self.assertTrue(macs[2].endswith(':00:00:00'))
+        self.assertLocalUnicast(macs)
+
+    def test_sequence_survives_unwritable_state(self):
+        blocker = os.path.join(self.tmp, 'file')
+        open(blocker, 'w').close()
+        generator = MACGenerator(sequence_state=os.path.join(blocker, 'sequence.json'))
+        macs = generator.sequence_batch(3) + generator.sequence_batch(3)
+        values = [int(MacAddress.parse(mac)) for mac in macs]
+        self.assertEqual(values, list(range(values[0], values[0] + 6)))
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            self.generator.generate('bogus')
+
+    def test_guard_rejecting_everything_raises(self):
+        self.generator.guard = mock.Mock(accept=mock.Mock(return_value=False))
+        with self.assertRaises(ValueError):
+            self.generator.next('random')
+        self.assertEqual(self.generator.guard.accept.call_count, MACGenerator.MAX_DRAWS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""ChangeJournal begin/end, orphan detection and reopen tests."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from support import ROOT
+from macspoofx import ChangeJournal
+
+
+class ChangeJournalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix='msxtest-')
+        self.path = os.path.join(self.tmp, 'journal.log')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def crash_in_child(self, interface: str, old_mac: str, new_mac: str):
+        """Begin a change in another process and die without ending it."""
+        code = ('import os, sys; sys.path.insert(0, sys.argv[1]); import macspoofx; '
+                'journal = macspoofx.ChangeJournal(sys.argv[2], sync=False); '
+                'journal.begin(sys.argv[3], sys.argv[4], sys.argv[5]); os._exit(0)')
+        subprocess.run([sys.executable, '-c', code, ROOT, self.path, interface, old_mac, new_mac],
+                       check=True, env=dict(os.environ, MACSPOOFX_STATE_DIR=self.tmp))
+
+    def test_begin_end_survives_reopen(self):
+        journal = ChangeJournal(self.path, sync=False)
+        entry_id = journal.begin('eth0', '02:00:00:00:00:01', '02:00:00:00:00:02')
+        self.assertEqual([entry['id'] for entry in journal.pending()], [entry_id])
+        journal.end(entry_id)
+        self.assertEqual(journal.pending(), [])
+        journal.close()
+
+        journal = ChangeJournal(self.path, sync=False)
+        self.assertEqual(journal.orphaned(), [])
+        self.assertEqual(journal.originals, {'eth0': '02:00:00:00:00:01'})
+        # Ids keep increasing across reopen
+        self.assertGreater(journal.begin('eth0', '02:00:00:00:00:02', '02:00:00:00:00:03'), entry_id)
+        journal.close()
+
+    def test_crashed_change_is_orphaned(self):
+        self.crash_in_child('eth1', '02:00:00:00:00:0a', '02:00:00:00:00:0b')
+        journal = ChangeJournal(self.path, sync=False)
+        orphaned = journal.orphaned()
+        self.assertEqual([(entry['interface'], entry['old_mac']) for entry in orphaned],
+                         [('eth1', '02:00:00:00:00:0a')])
+        # Our own unfinished changes are pending, never orphaned
+        journal.begin('eth2', '02:00:00:00:00:0c', '02:00:00:00:00:0d')
+        self.assertEqual(len(journal.orphaned()), 1)
+        self.assertEqual([entry['interface'] for entry in journal.pending()], ['eth2'])
+        journal.close()
+
+    def test_first_original_wins_and_forget(self):
+        journal = ChangeJournal(self.path, sync=False)
+        journal.end(journal.begin('eth0', '02:00:00:00:00:01', '02:00:00:00:00:02'))
+        journal.end(journal.begin('eth0', '02:00:00:00:00:02', '02:00:00:00:00:03'))
+        journal.forget(['eth1'])
+        journal.close()
+
+        journal = ChangeJournal(self.path, sync=False)
+        self.assertEqual(journal.originals, {'eth0': '02:00:00:00:00:01'})
+        journal.forget(['eth0'])
+        journal.close()
+        journal = ChangeJournal(self.path, sync=False)
+        self.assertEqual(journal.originals, {})
+        journal.close()
+
+    def test_torn_last_line_is_ignored(self):
+        journal = ChangeJournal(self.path, sync=False)
+        journal.end(journal.begin('eth0', '02:00:00:00:00:01', '02:00:00:00:00:02'))
+        journal.close()
+        with open(self.path, 'a') as f:
+            f.write('{"op": "begin", "id": 9, "interf')
+        journal = ChangeJournal(self.path, sync=False)
+        self.assertEqual(journal.orphaned(), [])
+        self.assertEqual(journal.originals, {'eth0': '02:00:00:00:00:01'})
+        journal.close()
+
+    def test_namespace_keys(self):
+        key = ChangeJournal.key('veth0', '/run/netns/blue')
+        self.assertEqual(key, 'veth0@/run/netns/blue')
+        self.assertEqual(ChangeJournal.split(key), ('veth0', '/run/netns/blue'))
+        self.assertEqual(ChangeJournal.split('eth0'), ('eth0', None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""MacAddress parsing and formatting tests."""
+
+import random
+import unittest
+
+import support  # noqa: F401  - path and state dir, must precede macspoofx
+from macspoofx import MacAddress
+
+
+class MacAddressTest(unittest.TestCase):
+
+    FORMS = ('00:1a:2b:3c:4d:5e', '00-1A-2B-3C-4D-5E', '001a.2b3c.4d5e', '001A2B3C4D5E',
+             '  00:1a:2b:3c:4d:5e\n')
+
+    def test_parse_every_form(self):
+        for text in self.FORMS:
+            self.assertEqual(int(MacAddress.parse(text)), 0x001A2B3C4D5E, text)
+
+    def test_format_round_trip(self):
+        rng = random.Random(1)
+        for _ in range(500):
+            mac = MacAddress(rng.getrandbits(48))
+            for style in MacAddress.STYLES:
+                for upper in (False, True):
+                    self.assertEqual(MacAddress.parse(mac.format(style, upper)), mac)
+            self.assertEqual(MacAddress.from_bytes(mac.packed), mac)
+        self.assertEqual(MacAddress(0x001A2B3C4D5E).format('cisco', upper=True), '001A.2B3C.4D5E')
+
+    def test_rejects_bad_input(self):
+        for text in ('', '00:1a:2b:3c:4d', '00:1a:2b:3c:4d:5e:6f', '00:1a-2b:3c:4d:5e',
+                     'g0:1a:2b:3c:4d:5e', '001a.2b3c4d5e', '001a2b3c4d5', '0:1a:2b:3c:4d:5e'):
+            with self.assertRaises(ValueError, msg=text):
+                MacAddress.parse(text)
+        with self.assertRaises(ValueError):
+            MacAddress(1 << 48)
+        with self.assertRaises(ValueError):
+            MacAddress(-1)
+        with self.assertRaises(ValueError):
+            MacAddress.from_bytes(b'\0' * 5)
+        with self.assertRaises(ValueError):
+            MacAddress(0).format('dotted')
+
+    def test_bits(self):
+        mac = MacAddress.parse('03:00:00:00:00:00')
+        self.assertTrue(mac.is_multicast and mac.is_locally_administered)
+        mac = MacAddress.parse('00:1a:2b:3c:4d:5e')
+        self.assertTrue(mac.is_unicast and mac.is_universal)
+        self.assertEqual(mac.oui, 0x001A2B)
+
+    def test_parse_many_round_trip(self):
+        rng = random.Random(2)
+        values = [rng.getrandbits(48) for _ in range(1000)]
+        text = MacAddress.format_many(values)
+        for use_numpy in (False, None):
+            parsed, invalid = MacAddress.parse_many(text, use_numpy=use_numpy)
+            self.assertEqual(list(parsed), values)
+            self.assertEqual(invalid, [])
+
+    def test_parse_many_reports_bad_lines(self):
+        lines = ['00:1a:2b:3c:4d:5e', 'zz', '', '001a.2b3c.4d5e', '00:1a:2b:3c:4d']
+        parsed, invalid = MacAddress.parse_many(lines, use_numpy=False)
+        self.assertEqual(list(parsed), [0x001A2B3C4D5E, 0x001A2B3C4D5E])
+        # Line numbers are 1-based; blank lines inside the input are invalid too
+        self.assertEqual(invalid, [(2, 'zz'), (3, ''), (5, '00:1a:2b:3c:4d')])
+        parsed, invalid = MacAddress.parse_many('00:1a:2b:3c:4d:5e\n', use_numpy=False)
+        self.assertEqual((list(parsed), invalid), ([0x001A2B3C4D5E], []))
+
+
+if __name__ == '__main__':
+    unittest.main()
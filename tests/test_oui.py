@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""OUIDatabase compile, lookup and vendor prefix selection tests."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import support  # noqa: F401  - path and state dir, must precede macspoofx
+from macspoofx import MACGenerator, OUIDatabase
+
+
+class OUIDatabaseTest(unittest.TestCase):
+
+    IEEE = (
+        'OUI/MA-L                                                    Organization\n'
+        'company_id                                                  Organization\n'
+        '\n'
+        '00-1B-63   (hex)\t\tApple, Inc.\n'
+        '001B63     (base 16)\t\tApple, Inc.\n'
+        '\t\t\t\t1 Infinite Loop\n'
+        '\n'
+        'AC-DE-48   (hex)\t\tPrivate\n'
+        'ACDE48     (base 16)\t\tPrivate\n'
+    )
+    MANUF = (
+        '00:50:56\tVMware, Inc.\n'
+        '70:B3:D5:01:20/36\tTiny Sensors\n'
+        '00:55:DA:50/28\tMid Widgets\n'
+        '00:55:DA\tBig Widgets\n'
+        '# comment\n'
+        '70:B3:D5:01:2\tmalformed\n'
+    )
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix='msxtest-')
+        self.sources = []
+        for name, content in (('oui.txt', self.IEEE), ('manuf', self.MANUF)):
+            path = os.path.join(self.tmp, name)
+            with open(path, 'w') as f:
+                f.write(content)
+            self.sources.append(path)
+        self.index = os.path.join(self.tmp, 'oui.idx')
+        self.db = OUIDatabase.load(self.sources, self.index)
+        self.addCleanup(self.db.close)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_compile(self):
+        self.assertTrue(os.path.exists(self.index))
+        self.assertEqual([self.db.vendor_name(i) for i in range(self.db.vendor_count)],
+                         ['Apple, Inc.', 'Big Widgets', 'Mid Widgets', 'Private', 'Tiny Sensors',
+                          'VMware, Inc.'])
+
+    def test_lookup_longest_prefix(self):
+        for mac, vendor in (('00:1b:63:00:00:01', 'Apple, Inc.'),
+                            ('00-1B-63-FF-FF-FF', 'Apple, Inc.'),
+                            ('00:55:da:5f:00:00', 'Mid Widgets'),
+                            ('00:55:da:40:00:00', 'Big Widgets'),
+                            ('70:b3:d5:01:20:01', 'Tiny Sensors'),
+                            ('70:b3:d5:01:30:00', None),
+                            ('12:34:56:00:00:00', None),
+                            ('not a mac', None)):
+            self.assertEqual(self.db.lookup(mac), vendor, mac)
+
+    def test_find_vendors(self):
+        # Prefix matches win; substring matches are the fallback
+        self.assertEqual(self.db.find_vendors('APPLE'), [0])
+        self.assertEqual(self.db.find_vendors('widgets'), [1, 2])
+        self.assertEqual(self.db.find_vendors('sensor'), [4])
+        self.assertEqual(self.db.find_vendors('nothing'), [])
+
+    def test_random_prefix(self):
+        self.assertEqual(self.db.random_prefix('tiny'), (0x70B3D5012, 36))
+        self.assertIsNone(self.db.random_prefix('nothing'))
+        seen = {self.db.random_prefix('widgets') for _ in range(200)}
+        self.assertEqual(seen, {(0x0055DA, 24), (0x0055DA5, 28)})
+        self.assertEqual(len({self.db.random_prefix() for _ in range(500)}), 6)
+
+    def test_vendor_batch_stays_inside_the_prefix(self):
+        generator = MACGenerator(oui_db=self.db, sequence_state=os.path.join(self.tmp, 'seq.json'))
+        for mac in generator.vendor_batch(300, 'widgets'):
+            self.assertIn(self.db.lookup(mac), ('Big Widgets', 'Mid Widgets'))
+        for mac in generator.vendor_batch(50, 'tiny'):
+            self.assertTrue(mac.startswith('70:b3:d5:01:2'), mac)
+
+    def test_vendor_resolved_once_per_batch(self):
+        path = os.path.join(self.tmp, 'big-manuf')
+        with open(path, 'w') as f:
+            for i in range(3000):
+                f.write(f'{i >> 16:02X}:{i >> 8 & 0xFF:02X}:{i & 0xFF:02X}\tVendor{i} Widget{i % 97} Corp\n')
+        db = OUIDatabase.load([path], os.path.join(self.tmp, 'big.idx'))
+        self.addCleanup(db.close)
+        generator = MACGenerator(oui_db=db, sequence_state=os.path.join(self.tmp, 'seq.json'))
+
+        # 'widget5' only matches as a substring, which scans every vendor name
+        with mock.patch.object(db, 'vendor_name', wraps=db.vendor_name) as vendor_name:
+            macs = generator.vendor_batch(1000, 'widget5')
+            self.assertLessEqual(vendor_name.call_count, db.vendor_count + 32)
+            vendor_name.reset_mock()
+            generator.vendor_batch(1000, 'widget5')
+            self.assertEqual(vendor_name.call_count, 0)
+        self.assertTrue(all(' Widget5' in db.lookup(mac) for mac in macs))
+
+
+if __name__ == '__main__':
+    unittest.main()
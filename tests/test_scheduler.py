@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""DeadlineScheduler ordering, missed-deadline policy and drift tests."""
+
+import threading
+import time
+import unittest
+
+import support  # noqa: F401  - path and state dir, must precede macspoofx
+from macspoofx import DeadlineScheduler
+
+
+class DeadlineSchedulerTest(unittest.TestCase):
+
+    def run_scheduler(self, scheduler: DeadlineScheduler, timeout: float = 5.0):
+        runner = threading.Thread(target=scheduler.run, daemon=True)
+        runner.start()
+        runner.join(timeout)
+        scheduler.stop()
+        runner.join()
+
+    def test_rejects_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            DeadlineScheduler('later')
+        with self.assertRaises(ValueError):
+            DeadlineScheduler().add('eth0', lambda: None, 0)
+
+    def test_deadline_order(self):
+        scheduler = DeadlineScheduler()
+        fired = []
+
+        def callback(name):
+            fired.append(name)
+            if len(fired) == 3:
+                scheduler.stop()
+
+        for name, delay in (('c', 0.06), ('a', 0.0), ('b', 0.03)):
+            scheduler.add(name, lambda name=name: callback(name), interval=60, delay=delay)
+        self.run_scheduler(scheduler)
+        self.assertEqual(fired, ['a', 'b', 'c'])
+
+    def stalled_job(self, policy: str) -> dict:
+        """One 20 ms job whose first run stalls for 110 ms, stopped after 8 runs."""
+        scheduler = DeadlineScheduler(policy)
+        runs = []
+
+        def callback():
+            runs.append(time.monotonic())
+            if len(runs) == 1:
+                time.sleep(0.11)
+            if len(runs) == 8:
+                scheduler.stop()
+
+        scheduler.add('eth0', callback, interval=0.02)
+        self.run_scheduler(scheduler)
+        return dict(scheduler.jobs['eth0'], times=runs)
+
+    def test_missed_policy_skip(self):
+        job = self.stalled_job('skip')
+        self.assertGreaterEqual(job['missed'], 4)
+        # Back on the original grid, one slot at a time
+        self.assertGreater(job['times'][2] - job['times'][1], 0.01)
+
+    def test_missed_policy_catchup(self):
+        job = self.stalled_job('catchup')
+        self.assertEqual(job['missed'], 0)
+        # Missed slots run back to back
+        self.assertLess(job['times'][2] - job['times'][1], 0.01)
+
+    def test_no_cumulative_drift(self):
+        scheduler = DeadlineScheduler()
+        runs = []
+
+        def callback():
+            runs.append(time.monotonic())
+            time.sleep(0.02)
+            if len(runs) == 6:
+                scheduler.stop()
+
+        scheduler.add('eth0', callback, interval=0.05)
+        self.run_scheduler(scheduler)
+        # Callback time must not push later deadlines back (would be ~0.35 s)
+        self.assertAlmostEqual(runs[-1] - runs[0], 5 * 0.05, delta=0.04)
+        stats = scheduler.stats()
+        self.assertEqual(stats['runs'], 6)
+        self.assertLess(stats['drift_max_ms'], 40)
+
+    def test_jitter_stays_within_bounds(self):
+        scheduler = DeadlineScheduler()
+        scheduler.add('eth0', lambda: None, interval=10, jitter=2)
+        job = scheduler.jobs['eth0']
+        for _ in range(200):
+            self.assertLessEqual(abs(scheduler._jittered(job) - job['nominal']), 2)
+        scheduler.add('eth1', lambda: None, interval=1, jitter=5)
+        self.assertEqual(scheduler.jobs['eth1']['jitter'], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
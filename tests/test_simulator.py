@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""SimulatedKernel and SimulatedBackend rotation tests (no root, no real links)."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import support  # noqa: F401  - path and state dir, must precede macspoofx
+from macspoofx import (BatchRotator, ChangeJournal, MACGenerator, MacAddress, SimulatedBackend,
+                       SimulatedInterfaceManager, SimulatedKernel)
+
+
+class SimulatedKernelTest(unittest.TestCase):
+
+    def test_links_and_addresses(self):
+        kernel = SimulatedKernel(count=300, prefix='v')
+        links = kernel.dump()
+        self.assertEqual([link['interface'] for link in links[:3]], ['v0', 'v1', 'v2'])
+        self.assertEqual(links[257]['mac'], '00:16:3e:00:01:01')
+        self.assertEqual(links[257]['ip'], '10.0.1.1')
+        self.assertEqual(len(kernel.addresses()), 300)
+        with self.assertRaises(OSError):
+            kernel.get('eth0')
+
+    def test_quirks_are_deterministic(self):
+        quirks = {'no_live': 0.3, 'sticky_mac': 0.1}
+        first = SimulatedKernel(count=500, quirks=quirks, seed=7)
+        second = SimulatedKernel(count=500, quirks=quirks, seed=7)
+        self.assertEqual([link['quirks'] for link in first.links.values()],
+                         [link['quirks'] for link in second.links.values()])
+        summary = first.summary()['quirks']
+        self.assertTrue(100 < summary['no_live'] < 200, summary)
+        self.assertTrue(20 < summary['sticky_mac'] < 80, summary)
+
+    def test_rejects_unknown_keys(self):
+        with self.assertRaises(ValueError):
+            SimulatedKernel(latency_ms={'teleport': 1})
+        with self.assertRaises(ValueError):
+            SimulatedKernel(quirks={'haunted': 0.5})
+
+    def test_from_config(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            json.dump({'prefix': 'cfg', 'latency_ms': {'up': 0}, 'failure_rate': {'set': 1.0}, 'seed': 3}, f)
+        self.addCleanup(os.unlink, f.name)
+        kernel = SimulatedKernel.from_config(f.name, count=2, seed=None)
+        self.assertEqual(list(kernel.links), ['cfg0', 'cfg1'])
+        self.assertEqual(kernel.seed, 3)
+        self.assertEqual(SimulatedKernel.from_config(f.name, count=1, seed=9).seed, 9)
+
+
+class SimulatedRotationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix='msxtest-')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def rotate(self, kernel: SimulatedKernel, **kwargs):
+        backend = SimulatedBackend(kernel)
+        rotator = BatchRotator(backend, MACGenerator(sequence_state=os.path.join(self.tmp, 'seq.json')),
+                               SimulatedInterfaceManager(kernel), max_workers=8, **kwargs)
+        before = {link['interface']: link['mac'] for link in kernel.dump()}
+        result = rotator.rotate([{'interface': name, 'mode': 'random'} for name in kernel.links])
+        after = {link['interface']: link['mac'] for link in kernel.dump()}
+        return result, before, after
+
+    def test_batch_rotation(self):
+        kernel = SimulatedKernel(count=64)
+        result, before, after = self.rotate(kernel)
+        self.assertEqual(len(result.succeeded), 64)
+        for entry in result.results:
+            self.assertEqual(after[entry['interface']], entry['new_mac'])
+            self.assertNotEqual(before[entry['interface']], entry['new_mac'])
+            self.assertTrue(MacAddress.parse(entry['new_mac']).is_locally_administered)
+        self.assertTrue(all(link['up'] for link in kernel.dump()))
+
+    def test_quirky_drivers(self):
+        kernel = SimulatedKernel(count=60, quirks={'no_live': 0.5, 'refuse_down': 0.2, 'sticky_mac': 0.2},
+                                 seed=11)
+        result, before, after = self.rotate(kernel)
+        for entry in result.results:
+            quirks = kernel.links[entry['interface']]['quirks']
+            if 'sticky_mac' in quirks:
+                # Verification catches the ignored write
+                self.assertFalse(entry['success'], entry)
+                self.assertEqual(after[entry['interface']], before[entry['interface']])
+            elif 'no_live' in quirks and 'refuse_down' in quirks:
+                self.assertFalse(entry['success'], entry)
+            else:
+                self.assertTrue(entry['success'], entry)
+        # No link is ever left down
+        self.assertTrue(all(link['up'] for link in kernel.dump()))
+
+    def test_journal_is_closed_out(self):
+        kernel = SimulatedKernel(count=16, failure_rate={'set': 0.3}, seed=5)
+        journal = ChangeJournal(os.path.join(self.tmp, 'journal.log'), sync=False)
+        self.addCleanup(journal.close)
+        result, _before, _after = self.rotate(kernel, journal=journal)
+        self.assertTrue(result.failed and result.succeeded)
+        self.assertEqual(journal.pending(), [])
+        self.assertEqual(set(journal.originals), set(kernel.links))
+        self.assertGreater(kernel.summary()['operations']['set']['failures'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()